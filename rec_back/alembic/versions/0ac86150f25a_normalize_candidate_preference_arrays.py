@@ -0,0 +1,77 @@
+"""normalize_candidate_preference_arrays
+
+Revision ID: 0ac86150f25a
+Revises: ffabaac29926
+Create Date: 2026-10-17 12:04:55.318420
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0ac86150f25a'
+down_revision: Union[str, None] = 'ffabaac29926'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, value column, length, array column on candidate_preferences, short name)
+PREFERENCE_TABLES = [
+    ('candidate_preferred_job_types', 'job_type', 100, 'job_types', 'cpjt'),
+    ('candidate_preferred_industries', 'industry', 200, 'industries', 'cpi'),
+    ('candidate_preferred_locations', 'location', 200, 'locations', 'cpl'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, length, array_column, short in PREFERENCE_TABLES:
+        op.create_table(
+            table,
+            sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+            sa.Column('candidate_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('candidate_profiles.id'), nullable=False),
+            sa.Column(column, sa.String(length), nullable=False),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+            sa.UniqueConstraint('id'),
+            sa.UniqueConstraint('candidate_id', column, name=f'uq_{short}_candidate_{column}'),
+        )
+        op.create_index(f'ix_{short}_{column}', table, [column, 'candidate_id'])
+
+        # Move existing array values into the child table
+        op.execute(
+            f"""
+            INSERT INTO {table} (id, candidate_id, {column})
+            SELECT gen_random_uuid(), candidate_id, value
+            FROM (
+                SELECT DISTINCT candidate_id, unnest({array_column}) AS value
+                FROM candidate_preferences
+            ) AS preferred
+            WHERE value IS NOT NULL
+            """
+        )
+        op.drop_column('candidate_preferences', array_column)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, _, array_column, short in reversed(PREFERENCE_TABLES):
+        op.add_column('candidate_preferences', sa.Column(array_column, postgresql.ARRAY(sa.String()), nullable=True))
+        op.execute(
+            f"""
+            UPDATE candidate_preferences AS cp
+            SET {array_column} = agg.preferred_values
+            FROM (
+                SELECT candidate_id, array_agg({column} ORDER BY {column}) AS preferred_values
+                FROM {table}
+                GROUP BY candidate_id
+            ) AS agg
+            WHERE agg.candidate_id = cp.candidate_id
+            """
+        )
+        op.drop_index(f'ix_{short}_{column}', table_name=table)
+        op.drop_table(table)
@@ -0,0 +1,74 @@
+"""inline_candidate_notification_settings
+
+Revision ID: 0eedbc15e745
+Revises: e4cc3730d24f
+Create Date: 2026-10-17 14:47:12.630584
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0eedbc15e745'
+down_revision: Union[str, None] = 'e4cc3730d24f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# candidate_profiles.flags bits for the former candidate_notification_settings columns
+SETTING_BITS = [
+    ('email_alerts', 0x8),
+    ('job_matches', 0x10),
+    ('application_updates', 0x20),
+]
+SETTINGS_MASK = 0x38
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Candidates without a settings row get the old defaults (all enabled)
+    op.execute(f"UPDATE candidate_profiles SET flags = flags | {SETTINGS_MASK}")
+    cleared = ' | '.join(
+        f'(CASE WHEN NOT ns.{column} THEN {bit} ELSE 0 END)' for column, bit in SETTING_BITS
+    )
+    op.execute(
+        f"""
+        UPDATE candidate_profiles AS cp
+        SET flags = cp.flags & ~({cleared})
+        FROM candidate_notification_settings AS ns
+        WHERE ns.candidate_id = cp.id
+        """
+    )
+    op.alter_column('candidate_profiles', 'flags', server_default=str(0x2 | SETTINGS_MASK))
+    op.drop_table('candidate_notification_settings')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table(
+        'candidate_notification_settings',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column('candidate_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('candidate_profiles.id'), nullable=False),
+        sa.Column('email_alerts', sa.Boolean(), nullable=False),
+        sa.Column('job_matches', sa.Boolean(), nullable=False),
+        sa.Column('application_updates', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint('id'),
+        sa.UniqueConstraint('candidate_id'),
+    )
+    columns = ', '.join(column for column, _ in SETTING_BITS)
+    values = ', '.join(f'(flags & {bit}) <> 0' for _, bit in SETTING_BITS)
+    op.execute(
+        f"""
+        INSERT INTO candidate_notification_settings (id, candidate_id, {columns})
+        SELECT gen_random_uuid(), id, {values}
+        FROM candidate_profiles
+        """
+    )
+    op.alter_column('candidate_profiles', 'flags', server_default='2')
+    op.execute(f"UPDATE candidate_profiles SET flags = flags & ~{SETTINGS_MASK}")
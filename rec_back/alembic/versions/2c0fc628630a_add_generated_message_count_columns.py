@@ -0,0 +1,50 @@
+"""add_generated_message_count_columns
+
+Revision ID: 2c0fc628630a
+Revises: 733433e93180
+Create Date: 2026-10-17 17:05:47.152690
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c0fc628630a'
+down_revision: Union[str, None] = '733433e93180'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (generated column, JSONB source column)
+COUNT_COLUMNS = [
+    ('mention_count', 'mentions'),
+    ('reaction_count', 'reactions'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column, source in COUNT_COLUMNS:
+        op.add_column(
+            'messages',
+            sa.Column(
+                column,
+                sa.Integer(),
+                sa.Computed(
+                    f"CASE WHEN jsonb_typeof({source}) = 'array' THEN jsonb_array_length({source}) ELSE 0 END",
+                    persisted=True
+                ),
+                nullable=False
+            )
+        )
+        op.create_index(f'ix_messages_{column}', 'messages', [column])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column, _ in reversed(COUNT_COLUMNS):
+        op.drop_index(f'ix_messages_{column}', table_name='messages')
+        op.drop_column('messages', column)
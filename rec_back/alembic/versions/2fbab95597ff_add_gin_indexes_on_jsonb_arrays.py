@@ -0,0 +1,65 @@
+"""add_gin_indexes_on_jsonb_arrays
+
+Revision ID: 2fbab95597ff
+Revises: 62a17f8607f1
+Create Date: 2026-10-17 10:21:37.640912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2fbab95597ff'
+down_revision: Union[str, None] = '62a17f8607f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, column)
+GIN_INDEXES = [
+    ('ix_candidate_languages_gin', 'candidate_profiles', 'languages'),
+    ('ix_candidate_certifications_gin', 'candidate_profiles', 'certifications'),
+    ('ix_jobs_benefits_gin', 'jobs', 'benefits'),
+    ('ix_jobs_requirements_gin', 'jobs', 'requirements'),
+    ('ix_jobs_responsibilities_gin', 'jobs', 'responsibilities'),
+    ('ix_consultant_specializations_gin', 'consultant_profiles', 'specializations'),
+    ('ix_consultant_certifications_gin', 'consultant_profiles', 'certifications'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 33bdd5ac94fb added these as JSON; jsonb_path_ops requires JSONB
+    for column in ('languages', 'certifications'):
+        op.alter_column(
+            'candidate_profiles',
+            column,
+            type_=sa.dialects.postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            postgresql_using=f'{column}::jsonb'
+        )
+
+    for name, table, column in GIN_INDEXES:
+        op.create_index(
+            name, table, [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'jsonb_path_ops'}
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(GIN_INDEXES):
+        op.drop_index(name, table_name=table)
+
+    for column in ('languages', 'certifications'):
+        op.alter_column(
+            'candidate_profiles',
+            column,
+            type_=sa.JSON(),
+            existing_type=sa.dialects.postgresql.JSONB(),
+            postgresql_using=f'{column}::json'
+        )
@@ -0,0 +1,61 @@
+"""maintain_conversation_counters_by_trigger
+
+Revision ID: 3b461b45eecb
+Revises: ae238ede1ca0
+Create Date: 2026-10-17 18:44:09.318267
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b461b45eecb'
+down_revision: Union[str, None] = 'ae238ede1ca0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+MAINTAIN_CONVERSATION_COUNTERS_FUNCTION = """
+CREATE OR REPLACE FUNCTION maintain_conversation_counters() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE conversations
+        SET total_messages = total_messages + 1,
+            last_message_at = COALESCE(NEW.sent_at, timezone('utc', now())),
+            last_activity_at = COALESCE(NEW.sent_at, timezone('utc', now()))
+        WHERE id = NEW.conversation_id;
+    ELSE
+        UPDATE conversations
+        SET total_messages = total_messages - 1
+        WHERE id = OLD.conversation_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(MAINTAIN_CONVERSATION_COUNTERS_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER maintain_conversation_counters AFTER INSERT OR DELETE ON messages "
+        "FOR EACH ROW EXECUTE FUNCTION maintain_conversation_counters()"
+    )
+
+    # Start the trigger from exact counts
+    op.execute(
+        """
+        UPDATE conversations AS c
+        SET total_messages = (SELECT count(*) FROM messages AS m WHERE m.conversation_id = c.id)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS maintain_conversation_counters ON messages")
+    op.execute("DROP FUNCTION IF EXISTS maintain_conversation_counters()")
@@ -0,0 +1,34 @@
+"""add_message_timeline_indexes
+
+Revision ID: 3e5a8f5402c6
+Revises: 2c0fc628630a
+Create Date: 2026-10-17 17:21:13.660418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e5a8f5402c6'
+down_revision: Union[str, None] = '2c0fc628630a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Conversation timeline: live messages, newest first
+    op.create_index(
+        'ix_messages_conv_sent_active', 'messages', ['conversation_id', 'sent_at'],
+        postgresql_where=sa.text("is_deleted = false")
+    )
+    op.create_index('ix_messages_sender_sent', 'messages', ['sender_id', 'sent_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_messages_sender_sent', table_name='messages')
+    op.drop_index('ix_messages_conv_sent_active', table_name='messages')
@@ -0,0 +1,42 @@
+"""add_brin_indexes_on_append_only_dates
+
+Revision ID: 4095c32f889b
+Revises: b630b5802e47
+Create Date: 2026-10-17 15:31:56.082417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4095c32f889b'
+down_revision: Union[str, None] = 'b630b5802e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, column)
+BRIN_INDEXES = [
+    ('ix_recruitment_history_date_filled_brin', 'recruitment_history', 'date_filled'),
+    ('ix_jobs_created_at_brin', 'jobs', 'created_at'),
+    ('ix_applications_applied_at_brin', 'applications', 'applied_at'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, column in BRIN_INDEXES:
+        op.create_index(
+            name, table, [column],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(BRIN_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,65 @@
+"""store_candidate_skill_proficiency_as_smallint
+
+Revision ID: 55bf2c6821b3
+Revises: 9ab7b6af74fd
+Create Date: 2026-10-17 16:12:48.730215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '55bf2c6821b3'
+down_revision: Union[str, None] = '9ab7b6af74fd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Codes mirror app.models.enums.PROFICIENCY_LEVEL_CODES; the proficiencylevel
+    # type itself stays, job_skill_requirements still uses it
+    op.alter_column(
+        'candidate_skills',
+        'proficiency_level',
+        type_=sa.SmallInteger(),
+        existing_type=postgresql.ENUM(name='proficiencylevel', create_type=False),
+        existing_nullable=True,
+        postgresql_using=(
+            "CASE proficiency_level::text "
+            "WHEN 'BEGINNER' THEN 0 "
+            "WHEN 'INTERMEDIATE' THEN 1 "
+            "WHEN 'ADVANCED' THEN 2 "
+            "WHEN 'EXPERT' THEN 3 "
+            "END"
+        )
+    )
+    op.create_check_constraint(
+        'ck_candidate_skills_proficiency_level',
+        'candidate_skills',
+        'proficiency_level BETWEEN 0 AND 3'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('ck_candidate_skills_proficiency_level', 'candidate_skills', type_='check')
+    op.alter_column(
+        'candidate_skills',
+        'proficiency_level',
+        type_=postgresql.ENUM(name='proficiencylevel', create_type=False),
+        existing_type=sa.SmallInteger(),
+        existing_nullable=True,
+        postgresql_using=(
+            "(CASE proficiency_level "
+            "WHEN 0 THEN 'BEGINNER' "
+            "WHEN 1 THEN 'INTERMEDIATE' "
+            "WHEN 2 THEN 'ADVANCED' "
+            "WHEN 3 THEN 'EXPERT' "
+            "END)::proficiencylevel"
+        )
+    )
@@ -0,0 +1,57 @@
+"""add_composite_indexes_for_hot_filters
+
+Revision ID: 62a17f8607f1
+Revises: fdb8e83c8e34
+Create Date: 2026-10-17 09:48:03.217754
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '62a17f8607f1'
+down_revision: Union[str, None] = 'fdb8e83c8e34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Jobs: company listings, open-job feed and consultant workload
+    op.create_index('ix_jobs_company_status_posted', 'jobs', ['company_id', 'status', 'posting_date'])
+    op.create_index('ix_jobs_open', 'jobs', ['posting_date'], postgresql_where=sa.text("status = 'OPEN'"))
+    op.create_index(
+        'ix_jobs_consultant_active', 'jobs', ['assigned_consultant_id'],
+        postgresql_where=sa.text("status IN ('OPEN', 'DRAFT')")
+    )
+
+    # Applications: per-candidate, per-job, per-status and per-consultant timelines
+    op.create_index('ix_applications_candidate_applied', 'applications', ['candidate_id', 'applied_at'])
+    op.create_index('ix_applications_job_applied', 'applications', ['job_id', 'applied_at'])
+    op.create_index('ix_applications_status_applied', 'applications', ['status', 'applied_at'])
+    op.create_index('ix_applications_consultant_updated', 'applications', ['consultant_id', 'last_updated'])
+
+    # Active consultant-client assignments
+    op.create_index(
+        'ix_cc_consultant_active', 'consultant_clients', ['consultant_id'],
+        postgresql_where=sa.text("is_active")
+    )
+
+    # Reverse lookup: candidates having a given skill
+    op.create_index('ix_candidate_skills_skill', 'candidate_skills', ['skill_id', 'candidate_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_candidate_skills_skill', table_name='candidate_skills')
+    op.drop_index('ix_cc_consultant_active', table_name='consultant_clients')
+    op.drop_index('ix_applications_consultant_updated', table_name='applications')
+    op.drop_index('ix_applications_status_applied', table_name='applications')
+    op.drop_index('ix_applications_job_applied', table_name='applications')
+    op.drop_index('ix_applications_candidate_applied', table_name='applications')
+    op.drop_index('ix_jobs_consultant_active', table_name='jobs')
+    op.drop_index('ix_jobs_open', table_name='jobs')
+    op.drop_index('ix_jobs_company_status_posted', table_name='jobs')
@@ -0,0 +1,44 @@
+"""add_gin_indexes_on_messaging_jsonb
+
+Revision ID: 733433e93180
+Revises: e1043ce69b90
+Create Date: 2026-10-17 16:49:22.906134
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '733433e93180'
+down_revision: Union[str, None] = 'e1043ce69b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, column)
+GIN_INDEXES = [
+    ('ix_conversations_tags_gin', 'conversations', 'tags'),
+    ('ix_messages_mentions_gin', 'messages', 'mentions'),
+    ('ix_messages_reactions_gin', 'messages', 'reactions'),
+    ('ix_email_templates_tags_gin', 'email_templates', 'tags'),
+    ('ix_email_templates_variables_gin', 'email_templates', 'variables'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, column in GIN_INDEXES:
+        op.create_index(
+            name, table, [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'jsonb_path_ops'}
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(GIN_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,86 @@
+"""add_consultant_stats_materialized_view
+
+Revision ID: 7b81425798d5
+Revises: b725f62dc570
+Create Date: 2026-10-17 13:52:08.419377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b81425798d5'
+down_revision: Union[str, None] = 'b725f62dc570'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNTER_COLUMNS = ('total_placements', 'successful_placements', 'current_active_jobs', 'this_month_placements')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW consultant_stats_mv AS
+        SELECT cp.id AS consultant_id,
+               COALESCE(a.total_placements, 0) AS total_placements,
+               COALESCE(a.total_placements, 0) AS successful_placements,
+               COALESCE(a.this_month_placements, 0) AS this_month_placements,
+               COALESCE(cc.active, 0) + COALESCE(cl.active, 0) AS current_active_jobs
+        FROM consultant_profiles cp
+        LEFT JOIN (
+            SELECT consultant_id,
+                   COUNT(*) AS total_placements,
+                   COUNT(*) FILTER (
+                       WHERE COALESCE(last_updated, applied_at) >= date_trunc('month', now())
+                   ) AS this_month_placements
+            FROM applications
+            WHERE status = 'HIRED' AND consultant_id IS NOT NULL
+            GROUP BY consultant_id
+        ) a ON a.consultant_id = cp.id
+        LEFT JOIN (
+            SELECT consultant_id, COUNT(*) AS active
+            FROM consultant_candidates
+            WHERE is_active
+            GROUP BY consultant_id
+        ) cc ON cc.consultant_id = cp.id
+        LEFT JOIN (
+            SELECT consultant_id, COUNT(*) AS active
+            FROM consultant_clients
+            WHERE is_active
+            GROUP BY consultant_id
+        ) cl ON cl.consultant_id = cp.id
+        """
+    )
+    # REFRESH ... CONCURRENTLY requires a unique index
+    op.create_index('ux_consultant_stats_mv_consultant', 'consultant_stats_mv', ['consultant_id'], unique=True)
+
+    # Counters are now served by the view
+    for column in COUNTER_COLUMNS:
+        op.drop_column('consultant_profiles', column)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in COUNTER_COLUMNS:
+        op.add_column(
+            'consultant_profiles',
+            sa.Column(column, sa.Integer(), nullable=False, server_default='0')
+        )
+
+    op.execute(
+        """
+        UPDATE consultant_profiles AS cp
+        SET total_placements = mv.total_placements,
+            successful_placements = mv.successful_placements,
+            current_active_jobs = mv.current_active_jobs,
+            this_month_placements = mv.this_month_placements
+        FROM consultant_stats_mv AS mv
+        WHERE mv.consultant_id = cp.id
+        """
+    )
+    op.execute("DROP MATERIALIZED VIEW consultant_stats_mv")
@@ -0,0 +1,122 @@
+"""move_message_file_and_template_fields_to_side_tables
+
+Revision ID: 7db1ae246200
+Revises: 3e5a8f5402c6
+Create Date: 2026-10-17 17:44:36.287051
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7db1ae246200'
+down_revision: Union[str, None] = '3e5a8f5402c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FILE_COLUMNS = ['file_url', 'file_name', 'file_size', 'file_type', 'thumbnail_url']
+TEMPLATE_COLUMNS = ['template_id', 'template_variables']
+SIDE_TABLES = ['message_file_meta', 'message_template_bindings']
+
+
+def _timestamps():
+    return [
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'message_file_meta',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column('message_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('messages.id'), nullable=False),
+        sa.Column('file_url', sa.String(500), nullable=True),
+        sa.Column('file_name', sa.String(200), nullable=True),
+        sa.Column('file_size', sa.Integer(), nullable=True),
+        sa.Column('file_type', sa.String(50), nullable=True),
+        sa.Column('thumbnail_url', sa.String(500), nullable=True),
+        *_timestamps(),
+        sa.UniqueConstraint('id'),
+        sa.UniqueConstraint('message_id'),
+    )
+    op.create_table(
+        'message_template_bindings',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column('message_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('messages.id'), nullable=False),
+        sa.Column('template_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('email_templates.id'), nullable=True),
+        sa.Column('template_variables', postgresql.JSONB(), nullable=True),
+        *_timestamps(),
+        sa.UniqueConstraint('id'),
+        sa.UniqueConstraint('message_id'),
+    )
+    op.create_index('ix_message_template_bindings_template_id', 'message_template_bindings', ['template_id'])
+    op.create_index('ix_messages_message_type', 'messages', ['message_type'])
+
+    # 9ab7b6af74fd only installed set_updated_at on tables that existed back then
+    for table in SIDE_TABLES:
+        op.execute(
+            f"CREATE TRIGGER set_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+    # Only messages that actually carry file/template data get a side row
+    op.execute(
+        f"""
+        INSERT INTO message_file_meta (id, message_id, {', '.join(FILE_COLUMNS)})
+        SELECT gen_random_uuid(), id, {', '.join(FILE_COLUMNS)}
+        FROM messages
+        WHERE {' OR '.join(f'{c} IS NOT NULL' for c in FILE_COLUMNS)}
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO message_template_bindings (id, message_id, {', '.join(TEMPLATE_COLUMNS)})
+        SELECT gen_random_uuid(), id, {', '.join(TEMPLATE_COLUMNS)}
+        FROM messages
+        WHERE {' OR '.join(f'{c} IS NOT NULL' for c in TEMPLATE_COLUMNS)}
+        """
+    )
+    for column in FILE_COLUMNS + TEMPLATE_COLUMNS:
+        op.drop_column('messages', column)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('messages', sa.Column('file_url', sa.String(500), nullable=True))
+    op.add_column('messages', sa.Column('file_name', sa.String(200), nullable=True))
+    op.add_column('messages', sa.Column('file_size', sa.Integer(), nullable=True))
+    op.add_column('messages', sa.Column('file_type', sa.String(50), nullable=True))
+    op.add_column('messages', sa.Column('thumbnail_url', sa.String(500), nullable=True))
+    op.add_column('messages', sa.Column('template_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('email_templates.id'), nullable=True))
+    op.add_column('messages', sa.Column('template_variables', postgresql.JSONB(), nullable=True))
+
+    op.execute(
+        f"""
+        UPDATE messages AS m
+        SET {', '.join(f'{c} = f.{c}' for c in FILE_COLUMNS)}
+        FROM message_file_meta AS f
+        WHERE f.message_id = m.id
+        """
+    )
+    op.execute(
+        f"""
+        UPDATE messages AS m
+        SET {', '.join(f'{c} = t.{c}' for c in TEMPLATE_COLUMNS)}
+        FROM message_template_bindings AS t
+        WHERE t.message_id = m.id
+        """
+    )
+
+    for table in SIDE_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS set_updated_at ON {table}")
+    op.drop_index('ix_messages_message_type', table_name='messages')
+    op.drop_index('ix_message_template_bindings_template_id', table_name='message_template_bindings')
+    op.drop_table('message_template_bindings')
+    op.drop_table('message_file_meta')
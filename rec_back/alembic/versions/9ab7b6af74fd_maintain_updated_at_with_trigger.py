@@ -0,0 +1,65 @@
+"""maintain_updated_at_with_trigger
+
+Revision ID: 9ab7b6af74fd
+Revises: 4095c32f889b
+Create Date: 2026-10-17 15:54:20.517339
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9ab7b6af74fd'
+down_revision: Union[str, None] = '4095c32f889b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+                NEW.updated_at = now();
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    # Every BaseModel table carries updated_at
+    op.execute(
+        """
+        DO $$
+        DECLARE t text;
+        BEGIN
+            FOR t IN
+                SELECT c.table_name
+                FROM information_schema.columns c
+                JOIN information_schema.tables tb
+                  ON tb.table_schema = c.table_schema AND tb.table_name = c.table_name
+                WHERE c.table_schema = current_schema()
+                  AND c.column_name = 'updated_at'
+                  AND tb.table_type = 'BASE TABLE'
+            LOOP
+                EXECUTE format('DROP TRIGGER IF EXISTS set_updated_at ON %I', t);
+                EXECUTE format(
+                    'CREATE TRIGGER set_updated_at BEFORE UPDATE ON %I '
+                    'FOR EACH ROW EXECUTE FUNCTION set_updated_at()', t
+                );
+            END LOOP;
+        END
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # CASCADE drops the per-table set_updated_at triggers
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at() CASCADE")
@@ -0,0 +1,43 @@
+"""add_utc_now_server_defaults_to_messaging
+
+Revision ID: a5493ac4d796
+Revises: cbdf64c0f67a
+Create Date: 2026-10-17 19:27:48.193604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5493ac4d796'
+down_revision: Union[str, None] = 'cbdf64c0f67a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) holding naive UTC timestamps now defaulted by the server
+UTC_NOW_COLUMNS = [
+    ('conversation_participants', 'joined_at'),
+    ('conversations', 'last_activity_at'),
+    ('messages', 'sent_at'),
+    ('message_read_receipts', 'read_at'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in UTC_NOW_COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())")
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in reversed(UTC_NOW_COLUMNS):
+        op.alter_column(table, column, existing_type=sa.DateTime(), server_default=None)
@@ -0,0 +1,85 @@
+"""replace_parent_message_with_thread_root
+
+Revision ID: ae238ede1ca0
+Revises: 7db1ae246200
+Create Date: 2026-10-17 18:26:40.571903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ae238ede1ca0'
+down_revision: Union[str, None] = '7db1ae246200'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SET_MESSAGE_THREAD_ROOT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_message_thread_root() RETURNS trigger AS $$
+BEGIN
+    IF NEW.thread_root_id IS NULL THEN
+        NEW.thread_root_id = COALESCE(
+            (SELECT thread_root_id FROM messages WHERE id = NEW.reply_to_id),
+            NEW.id
+        );
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('messages', sa.Column('thread_root_id', postgresql.UUID(as_uuid=True), nullable=True))
+
+    # Walk parent/reply chains down from each top-level message
+    op.execute(
+        """
+        WITH RECURSIVE chain AS (
+            SELECT id, id AS root_id
+            FROM messages
+            WHERE parent_message_id IS NULL AND reply_to_id IS NULL
+            UNION ALL
+            SELECT m.id, chain.root_id
+            FROM messages AS m
+            JOIN chain ON COALESCE(m.parent_message_id, m.reply_to_id) = chain.id
+        )
+        UPDATE messages
+        SET thread_root_id = chain.root_id
+        FROM chain
+        WHERE chain.id = messages.id
+        """
+    )
+    # Rows whose chain points at a missing message start their own thread
+    op.execute("UPDATE messages SET thread_root_id = id WHERE thread_root_id IS NULL")
+
+    op.create_index('ix_messages_thread_root_id', 'messages', ['thread_root_id'])
+    op.execute(SET_MESSAGE_THREAD_ROOT_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER set_message_thread_root BEFORE INSERT ON messages "
+        "FOR EACH ROW EXECUTE FUNCTION set_message_thread_root()"
+    )
+    op.drop_column('messages', 'parent_message_id')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column(
+        'messages',
+        sa.Column('parent_message_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('messages.id'), nullable=True)
+    )
+    # Best effort: replies point back at their thread root
+    op.execute(
+        "UPDATE messages SET parent_message_id = thread_root_id "
+        "WHERE thread_root_id <> id AND reply_to_id IS NOT NULL"
+    )
+    op.execute("DROP TRIGGER IF EXISTS set_message_thread_root ON messages")
+    op.execute("DROP FUNCTION IF EXISTS set_message_thread_root()")
+    op.drop_index('ix_messages_thread_root_id', table_name='messages')
+    op.drop_column('messages', 'thread_root_id')
@@ -0,0 +1,57 @@
+"""use_citext_for_company_names_and_emails
+
+Revision ID: b630b5802e47
+Revises: 0eedbc15e745
+Create Date: 2026-10-17 15:09:31.274880
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b630b5802e47'
+down_revision: Union[str, None] = '0eedbc15e745'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, nullable)
+CITEXT_COLUMNS = [
+    ('companies', 'name', False),
+    ('companies', 'email', True),
+    ('company_contacts', 'name', False),
+    ('company_contacts', 'email', False),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    for table, column, nullable in CITEXT_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.CITEXT(),
+            existing_type=sa.String(),
+            existing_nullable=nullable
+        )
+
+    op.create_index('ix_companies_name', 'companies', ['name'])
+    op.create_index('ix_company_contacts_email', 'company_contacts', ['email'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_company_contacts_email', table_name='company_contacts')
+    op.drop_index('ix_companies_name', table_name='companies')
+
+    for table, column, nullable in reversed(CITEXT_COLUMNS):
+        op.alter_column(
+            table, column,
+            type_=sa.String(),
+            existing_type=postgresql.CITEXT(),
+            existing_nullable=nullable
+        )
@@ -0,0 +1,49 @@
+"""add_unique_candidate_skill_constraint
+
+Revision ID: b725f62dc570
+Revises: cf3063deac77
+Create Date: 2026-10-17 13:26:09.771542
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b725f62dc570'
+down_revision: Union[str, None] = 'cf3063deac77'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the most recently updated row for each (candidate, skill) pair
+    op.execute(
+        """
+        DELETE FROM candidate_skills
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY candidate_id, skill_id
+                    ORDER BY updated_at DESC, id
+                ) AS rn
+                FROM candidate_skills
+            ) AS ranked
+            WHERE ranked.rn > 1
+        )
+        """
+    )
+    # Conflict target for INSERT ... ON CONFLICT upserts
+    op.create_unique_constraint(
+        'uq_candidate_skills_candidate_skill',
+        'candidate_skills',
+        ['candidate_id', 'skill_id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_candidate_skills_candidate_skill', 'candidate_skills', type_='unique')
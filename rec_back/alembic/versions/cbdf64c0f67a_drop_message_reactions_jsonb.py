@@ -0,0 +1,72 @@
+"""drop_message_reactions_jsonb
+
+Revision ID: cbdf64c0f67a
+Revises: 3b461b45eecb
+Create Date: 2026-10-17 19:02:35.740118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cbdf64c0f67a'
+down_revision: Union[str, None] = '3b461b45eecb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Reactions were only ever written to message_reactions; the JSONB copy is unused
+    op.drop_index('ix_messages_reaction_count', table_name='messages')
+    op.drop_column('messages', 'reaction_count')
+    op.drop_index('ix_messages_reactions_gin', table_name='messages')
+    op.drop_column('messages', 'reactions')
+
+    # Keep the oldest row per (message, user, emoji) before enforcing it; id breaks created_at ties
+    op.execute(
+        """
+        DELETE FROM message_reactions AS r
+        USING message_reactions AS d
+        WHERE r.message_id = d.message_id
+          AND r.user_id = d.user_id
+          AND r.emoji = d.emoji
+          AND (r.created_at, r.id) > (d.created_at, d.id)
+        """
+    )
+    op.create_unique_constraint(
+        'uq_message_reactions_message_user_emoji', 'message_reactions', ['message_id', 'user_id', 'emoji']
+    )
+    op.create_index('ix_reactions_msg_emoji', 'message_reactions', ['message_id', 'emoji'])
+    op.create_index('ix_reactions_user', 'message_reactions', ['user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reactions_user', table_name='message_reactions')
+    op.drop_index('ix_reactions_msg_emoji', table_name='message_reactions')
+    op.drop_constraint('uq_message_reactions_message_user_emoji', 'message_reactions', type_='unique')
+
+    op.add_column('messages', sa.Column('reactions', postgresql.JSONB(), nullable=True))
+    op.create_index(
+        'ix_messages_reactions_gin', 'messages', ['reactions'],
+        postgresql_using='gin',
+        postgresql_ops={'reactions': 'jsonb_path_ops'}
+    )
+    op.add_column(
+        'messages',
+        sa.Column(
+            'reaction_count',
+            sa.Integer(),
+            sa.Computed(
+                "CASE WHEN jsonb_typeof(reactions) = 'array' THEN jsonb_array_length(reactions) ELSE 0 END",
+                persisted=True
+            ),
+            nullable=False
+        )
+    )
+    op.create_index('ix_messages_reaction_count', 'messages', ['reaction_count'])
@@ -0,0 +1,41 @@
+"""set_fillfactor_on_association_tables
+
+Revision ID: cf3063deac77
+Revises: 0ac86150f25a
+Create Date: 2026-10-17 12:47:20.904116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cf3063deac77'
+down_revision: Union[str, None] = '0ac86150f25a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Insert-heavy association tables whose counters are updated in place
+ASSOCIATION_TABLES = [
+    'consultant_candidates',
+    'consultant_clients',
+    'candidate_skills',
+    'job_skills',
+    'consultant_skills',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Leave free space on each page so updates can stay HOT
+    for table in ASSOCIATION_TABLES:
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = 90)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ASSOCIATION_TABLES:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
@@ -0,0 +1,31 @@
+"""index_conversation_participants_by_user
+
+Revision ID: e1043ce69b90
+Revises: 55bf2c6821b3
+Create Date: 2026-10-17 16:31:05.418273
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1043ce69b90'
+down_revision: Union[str, None] = '55bf2c6821b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The (conversation_id, user_id) PK cannot serve lookups by user_id alone
+    op.create_index('ix_conv_part_user', 'conversation_participants', ['user_id'])
+    op.create_index('ix_conv_part_conv_last_read', 'conversation_participants', ['conversation_id', 'last_read_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_conv_part_conv_last_read', table_name='conversation_participants')
+    op.drop_index('ix_conv_part_user', table_name='conversation_participants')
@@ -0,0 +1,60 @@
+"""pack_boolean_flags_into_smallint
+
+Revision ID: e4cc3730d24f
+Revises: 7b81425798d5
+Create Date: 2026-10-17 14:18:44.905126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4cc3730d24f'
+down_revision: Union[str, None] = '7b81425798d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table -> (default flags, [(boolean column, bit, column default)])
+FLAG_COLUMNS = {
+    'jobs': (0, [
+        ('remote_option', 0x1, 'false'),
+        ('is_hybrid', 0x2, 'false'),
+        ('requires_cover_letter', 0x4, 'false'),
+        ('is_featured', 0x8, 'false'),
+    ]),
+    'candidate_profiles': (0x2, [
+        ('profile_completed', 0x1, 'false'),
+        ('is_open_to_opportunities', 0x2, 'true'),
+        ('willing_to_relocate', 0x4, 'false'),
+    ]),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, (default_flags, columns) in FLAG_COLUMNS.items():
+        op.add_column(
+            table,
+            sa.Column('flags', sa.SmallInteger(), nullable=False, server_default=str(default_flags))
+        )
+        packed = ' | '.join(f'(CASE WHEN {column} THEN {bit} ELSE 0 END)' for column, bit, _ in columns)
+        op.execute(f"UPDATE {table} SET flags = {packed}")
+        for column, _, _ in columns:
+            op.drop_column(table, column)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, (_, columns) in FLAG_COLUMNS.items():
+        for column, bit, default in columns:
+            op.add_column(
+                table,
+                sa.Column(column, sa.Boolean(), nullable=False, server_default=default)
+            )
+            op.execute(f"UPDATE {table} SET {column} = (flags & {bit}) <> 0")
+            op.alter_column(table, column, server_default=None)
+        op.drop_column(table, 'flags')
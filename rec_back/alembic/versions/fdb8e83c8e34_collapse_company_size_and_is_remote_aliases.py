@@ -0,0 +1,45 @@
+"""collapse_company_size_and_is_remote_aliases
+
+Revision ID: fdb8e83c8e34
+Revises: a84ecd219edb
+Create Date: 2026-10-17 09:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fdb8e83c8e34'
+down_revision: Union[str, None] = 'a84ecd219edb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Backfill the canonical columns before dropping their aliases
+    op.execute("UPDATE companies SET size = company_size WHERE size IS NULL AND company_size IS NOT NULL")
+    op.execute("UPDATE jobs SET remote_option = true WHERE is_remote AND NOT remote_option")
+
+    # company_size / is_remote are now ORM synonyms of size / remote_option
+    op.drop_column('companies', 'company_size')
+    op.drop_column('jobs', 'is_remote')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('jobs', sa.Column('is_remote', sa.Boolean(), nullable=False, server_default='false'))
+    op.add_column(
+        'companies',
+        sa.Column(
+            'company_size',
+            sa.dialects.postgresql.ENUM(name='companysize', create_type=False),
+            nullable=True
+        )
+    )
+
+    op.execute("UPDATE jobs SET is_remote = remote_option")
+    op.execute("UPDATE companies SET company_size = size")
@@ -0,0 +1,63 @@
+"""store_consultant_status_as_smallint
+
+Revision ID: ffabaac29926
+Revises: 2fbab95597ff
+Create Date: 2026-10-17 10:58:14.882301
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ffabaac29926'
+down_revision: Union[str, None] = '2fbab95597ff'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Codes mirror app.models.enums.CONSULTANT_STATUS_CODES
+    op.alter_column(
+        'consultant_profiles',
+        'status',
+        type_=sa.SmallInteger(),
+        existing_type=sa.String(20),
+        existing_nullable=False,
+        postgresql_using=(
+            "CASE status "
+            "WHEN 'active' THEN 0 "
+            "WHEN 'inactive' THEN 1 "
+            "WHEN 'on_leave' THEN 2 "
+            "WHEN 'suspended' THEN 3 "
+            "END"
+        )
+    )
+    op.create_check_constraint(
+        'ck_consultant_profiles_status',
+        'consultant_profiles',
+        'status IN (0, 1, 2, 3)'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('ck_consultant_profiles_status', 'consultant_profiles', type_='check')
+    op.alter_column(
+        'consultant_profiles',
+        'status',
+        type_=sa.String(20),
+        existing_type=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=(
+            "CASE status "
+            "WHEN 0 THEN 'active' "
+            "WHEN 1 THEN 'inactive' "
+            "WHEN 2 THEN 'on_leave' "
+            "WHEN 3 THEN 'suspended' "
+            "END"
+        )
+    )
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Response
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict, Any
 from uuid import UUID
+import orjson
 
 from app.api.v1.deps import (
     get_database, get_admin_user, get_superadmin_user,
@@ -17,7 +18,8 @@ from app.schemas.admin import (
     SystemConfigSearchFilters, SystemConfigListResponse,
     AdminNotification, AdminNotificationCreate,
     UpdateAdminPermissionsRequest, UpdateSystemConfigRequest, CreateAuditLogRequest,
-    AdminStats, SystemStats
+    AdminStats, SystemStats,
+    admin_list_adapter, system_configuration_list_adapter
 )
 from app.models.user import User
 from app.models.enums import UserRole, AdminStatus, AdminRole, PermissionLevel
@@ -63,11 +65,11 @@ async def list_admin_users(
         )
         
         return AdminListResponse(
-            items=admins,
+            items=admin_list_adapter.validate_python(admins, from_attributes=True),
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
-            pages=(total + pagination.page_size - 1) // pagination.page_size
+            total_pages=(total + pagination.page_size - 1) // pagination.page_size
         )
     except Exception as e:
         raise HTTPException(
@@ -264,6 +266,8 @@ async def get_audit_logs(
 ):
     """
     Get system audit logs with filtering.
+    The log rows are serialized by PostgreSQL and embedded as-is;
+    response_model only documents the shape.
     Admins and superadmins can view audit logs.
     """
     try:
@@ -273,24 +277,27 @@ async def get_audit_logs(
             user_id=user_id,
             status=status,
             ip_address=ip_address,
-            start_date=filters.created_after,
-            end_date=filters.created_before,
+            date_from=filters.created_after,
+            date_to=filters.created_before,
             page=pagination.page,
             page_size=pagination.page_size,
             sort_by=filters.sort_by or "created_at",
             sort_order=filters.sort_order
         )
         
-        logs, total = admin_service.get_audit_logs_with_search(
+        logs_json, total = admin_service.get_audit_logs_json(
             db, filters=search_filters
         )
         
-        return AuditLogListResponse(
-            items=logs,
-            total=total,
-            page=pagination.page,
-            page_size=pagination.page_size,
-            pages=(total + pagination.page_size - 1) // pagination.page_size
+        return Response(
+            content=orjson.dumps({
+                "items": orjson.Fragment(logs_json),
+                "total": total,
+                "page": pagination.page,
+                "page_size": pagination.page_size,
+                "total_pages": (total + pagination.page_size - 1) // pagination.page_size
+            }),
+            media_type="application/json"
         )
     except Exception as e:
         raise HTTPException(
@@ -354,11 +361,11 @@ async def get_system_settings(
         )
         
         return SystemConfigListResponse(
-            items=configs,
+            items=system_configuration_list_adapter.validate_python(configs, from_attributes=True),
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
-            pages=(total + pagination.page_size - 1) // pagination.page_size
+            total_pages=(total + pagination.page_size - 1) // pagination.page_size
         )
     except Exception as e:
         raise HTTPException(
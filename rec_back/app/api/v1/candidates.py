@@ -13,7 +13,8 @@ from app.schemas.candidate import (
     CandidateJobPreference, CandidateJobPreferenceCreate, CandidateJobPreferenceUpdate,
     CandidateSearchFilters, CandidateListResponse,
     CandidateNotificationSettings, CandidateNotificationSettingsUpdate,
-    CandidateSkill, CandidateSkillCreate
+    CandidateSkill, CandidateSkillCreate,
+    candidate_profile_list_adapter
 )
 from app.services.candidate import candidate_service
 
@@ -822,7 +823,7 @@ def search_candidates(
     )
     
     return CandidateListResponse(
-        candidates=[CandidateFullProfile.from_orm(c) for c in candidates],
+        candidates=candidate_profile_list_adapter.validate_python(candidates, from_attributes=True),
         total=total,
         page=filters.page,
         page_size=filters.page_size,
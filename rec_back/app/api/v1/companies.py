@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Path
 from sqlalchemy.orm import Session
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from uuid import UUID
 
 from app.api.v1.deps import (
@@ -27,7 +27,7 @@ async def list_companies(
     # Search and filtering
     name: Optional[str] = Query(None, description="Search by company name"),
     industry: Optional[str] = Query(None, description="Filter by industry"),
-    company_size: Optional[str] = Query(None, description="Filter by company size"),
+    company_size: Optional[Literal["1-10", "10-50", "50-200", "200-1000", "1000+"]] = Query(None, description="Filter by company size"),
     location: Optional[str] = Query(None, description="Filter by location"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     
@@ -62,7 +62,7 @@ async def list_companies(
         )
         
         return CompanyListResponse(
-            companies=companies,
+            companies=[Company.from_orm_fast(company) for company in companies],
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
@@ -16,7 +16,7 @@ from app.schemas.consultant import (
     ConsultantPerformanceReview, ConsultantPerformanceReviewCreate, ConsultantPerformanceReviewUpdate,
     ConsultantCandidate, ConsultantCandidateCreate, ConsultantCandidateUpdate,
     ConsultantClient, ConsultantClientCreate, ConsultantClientUpdate,
-    ConsultantStats
+    ConsultantStats, consultant_profile_list_adapter
 )
 from app.models.user import User
 from app.models.enums import UserRole, ConsultantStatus
@@ -64,10 +64,9 @@ async def list_consultants(
         )
         
         return ConsultantListResponse(
-            items=consultants,
+            consultants=consultant_profile_list_adapter.validate_python(consultants, from_attributes=True),
             total=total,
             page=pagination.page,
-            page_size=pagination.page_size,
             pages=(total + pagination.page_size - 1) // pagination.page_size
         )
     except Exception as e:
@@ -13,6 +13,7 @@ from app.models.candidate import CandidateProfile
 from app.models.company import EmployerProfile
 from app.models.consultant import ConsultantProfile
 from app.models.admin import AdminProfile, SuperAdminProfile
+from app.services.user import UserLoader
 
 # Type aliases for compatibility
 CurrentUser = User
@@ -344,6 +345,11 @@ def get_common_filters(
         created_before=created_before
     )
 
+# Request-scoped loaders (FastAPI caches a dependency once per request)
+def get_user_loader(db: Session = Depends(get_database)) -> UserLoader:
+    """Batch loader for user display data"""
+    return UserLoader(db)
+
 # Compatibility aliases
 get_db = get_database
 get_current_user_optional = get_optional_current_user
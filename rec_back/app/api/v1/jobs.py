@@ -12,7 +12,7 @@ from app.services.job import job_service
 from app.schemas.job import (
     JobBase, JobCreate, JobUpdate, Job, JobWithDetails,
     JobSkillRequirementBase, JobSkillRequirementCreate, JobSkillRequirementUpdate, JobSkillRequirement,
-    JobSearchFilters, JobListResponse, JobApplicationSummary
+    JobSearchFilters, JobListResponse, JobApplicationSummary, job_list_adapter
 )
 from app.models.user import User
 from app.models.enums import UserRole, JobStatus, ExperienceLevel
@@ -57,7 +57,7 @@ async def search_jobs(
         jobs, total = job_service.get_jobs_with_search(db, filters=search_filters)
         
         return JobListResponse(
-            jobs=jobs,
+            jobs=job_list_adapter.validate_python(jobs, from_attributes=True),
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
@@ -114,7 +114,7 @@ async def list_jobs(
         jobs, total = job_service.get_jobs_with_search(db, filters=search_filters)
         
         return JobListResponse(
-            jobs=jobs,
+            jobs=job_list_adapter.validate_python(jobs, from_attributes=True),
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
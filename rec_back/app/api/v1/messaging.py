@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, UploadFile, File, Response
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict, Any
 from uuid import UUID
@@ -6,9 +6,10 @@ from uuid import UUID
 from app.api.v1.deps import (
     get_database, get_current_active_user, get_admin_user,
     get_pagination_params, PaginationParams,
-    get_common_filters, CommonFilters
+    get_common_filters, CommonFilters, get_user_loader
 )
 from app.services.messaging import messaging_service
+from app.services.user import UserLoader
 from app.schemas.messaging import (
     ConversationCreate, ConversationUpdate, Conversation, ConversationWithDetails,
     MessageCreate, MessageUpdate, Message, MessageWithDetails,
@@ -16,7 +17,8 @@ from app.schemas.messaging import (
     EmailTemplateCreate, EmailTemplateUpdate, EmailTemplate, EmailTemplateWithStats,
     ConversationSearchFilters, MessageSearchFilters, EmailTemplateSearchFilters,
     ConversationListResponse, MessageListResponse, EmailTemplateListResponse,
-    SendMessageRequest, CreateConversationRequest, MessageReactionRequest, MarkAsReadRequest
+    SendMessageRequest, CreateConversationRequest, MessageReactionRequest, MarkAsReadRequest,
+    conversation_list_adapter, message_list_adapter
 )
 from app.models.user import User
 from app.models.enums import UserRole, MessageType, ConversationType
@@ -62,7 +64,7 @@ async def list_conversations(
         )
         
         return ConversationListResponse(
-            conversations=conversations,
+            conversations=conversation_list_adapter.validate_python(conversations, from_attributes=True),
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
@@ -137,6 +139,47 @@ async def get_conversation(
             detail=f"Error retrieving conversation: {str(e)}"
         )
 
+@router.get("/conversations/{conversation_id}/full")
+async def get_conversation_full(
+    conversation_id: UUID = Path(..., description="Conversation ID"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_database)
+):
+    """
+    Get a conversation with its messages, attachments and reactions.
+    The nested document is built by PostgreSQL and returned as-is.
+    Only participants can view conversation details.
+    """
+    try:
+        # Check if user is participant
+        is_participant = messaging_service.is_conversation_participant(
+            db, conversation_id=conversation_id, user_id=current_user.id
+        )
+        
+        if not is_participant and current_user.role not in [UserRole.ADMIN, UserRole.SUPERADMIN]:
+            raise HTTPException(
+                status_code=403,
+                detail="Access denied to this conversation"
+            )
+        
+        conversation_json = messaging_service.get_conversation_json(
+            db, id=conversation_id
+        )
+        if conversation_json is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Conversation not found"
+            )
+        
+        return Response(content=conversation_json, media_type="application/json")
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error retrieving conversation: {str(e)}"
+        )
+
 @router.put("/conversations/{conversation_id}", response_model=Conversation)
 async def update_conversation(
     conversation_update: ConversationUpdate,
@@ -218,11 +261,14 @@ async def get_conversation_messages(
     pagination: PaginationParams = Depends(get_pagination_params),
     filters: CommonFilters = Depends(get_common_filters),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_database)
+    db: Session = Depends(get_database),
+    user_loader: UserLoader = Depends(get_user_loader)
 ):
     """
     Get messages from a conversation.
     Only participants can view conversation messages.
+    Senders are returned once each in the `users` map, keyed by sender_id,
+    and per-emoji reaction tallies in the `reactions` map, keyed by message id.
     """
     try:
         # Check if user is participant
@@ -244,7 +290,7 @@ async def get_conversation_messages(
             query=filters.q,
             page=pagination.page,
             page_size=pagination.page_size,
-            sort_by=filters.sort_by or "created_at",
+            sort_by=filters.sort_by or "sent_at",
             sort_order=filters.sort_order
         )
         
@@ -253,7 +299,11 @@ async def get_conversation_messages(
         )
         
         return MessageListResponse(
-            messages=messages,
+            messages=message_list_adapter.validate_python(messages, from_attributes=True),
+            users=user_loader.load_many(message.sender_id for message in messages),
+            reactions=messaging_service.get_reaction_counts(
+                db, message_ids=[message.id for message in messages]
+            ),
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
@@ -265,6 +315,47 @@ async def get_conversation_messages(
             detail=f"Error retrieving messages: {str(e)}"
         )
 
+@router.get("/conversations/{conversation_id}/threads/{thread_root_id}", response_model=List[Message])
+async def get_message_thread(
+    conversation_id: UUID = Path(..., description="Conversation ID"),
+    thread_root_id: UUID = Path(..., description="ID of the thread's first message"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_database)
+):
+    """
+    Get every message in a thread, oldest first.
+    Only participants can view conversation threads.
+    """
+    try:
+        # Check if user is participant
+        is_participant = messaging_service.is_conversation_participant(
+            db, conversation_id=conversation_id, user_id=current_user.id
+        )
+        
+        if not is_participant and current_user.role not in [UserRole.ADMIN, UserRole.SUPERADMIN]:
+            raise HTTPException(
+                status_code=403,
+                detail="Access denied to this conversation"
+            )
+        
+        messages = messaging_service.get_thread(
+            db, conversation_id=conversation_id, thread_root_id=thread_root_id
+        )
+        if not messages:
+            raise HTTPException(
+                status_code=404,
+                detail="Thread not found"
+            )
+        
+        return messages
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error retrieving thread: {str(e)}"
+        )
+
 @router.post("/conversations/{conversation_id}/messages", response_model=Message)
 async def send_message(
     message_data: SendMessageRequest,
@@ -484,7 +575,7 @@ async def list_email_templates(
         )
         
         return EmailTemplateListResponse(
-            templates=templates,
+            templates=[EmailTemplateWithStats.from_orm_fast(template) for template in templates],
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
@@ -679,6 +770,29 @@ async def get_unread_message_count(
             detail=f"Error retrieving unread count: {str(e)}"
         )
 
+@router.get("/mentions", response_model=List[Message])
+async def get_my_mentions(
+    pagination: PaginationParams = Depends(get_pagination_params),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_database)
+):
+    """
+    Get messages mentioning the current user, newest first.
+    All authenticated users can read their mentions feed.
+    """
+    try:
+        return messaging_service.get_user_mentions(
+            db,
+            user_id=current_user.id,
+            skip=pagination.offset,
+            limit=pagination.page_size
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error retrieving mentions: {str(e)}"
+        )
+
 @router.post("/search")
 async def search_messages(
     query: str = Query(..., description="Search query"),
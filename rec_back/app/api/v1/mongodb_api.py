@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import JSONResponse
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Literal, Optional
 from uuid import UUID, uuid4
 import logging
 from beanie import PydanticObjectId
+from pydantic import TypeAdapter
 
 from app.models.mongodb_models import (
     UserDocument, 
@@ -19,6 +20,9 @@ from app.api.v1.deps import get_mongodb
 
 logger = logging.getLogger(__name__)
 
+# Serializes a whole page of skills in one pass (IDs dumped as strings by BaseDocument)
+skill_list_adapter = TypeAdapter(List[SkillDocument])
+
 router = APIRouter()
 
 @router.get("/info")
@@ -37,8 +41,8 @@ async def mongodb_info():
 async def get_skills(
     limit: int = Query(10, ge=1, le=100),
     skip: int = Query(0, ge=0),
-    sort_by: str = Query("name", pattern="^(name|category|created_at)$"),
-    sort_order: str = Query("asc", pattern="^(asc|desc)$")
+    sort_by: Literal["name", "category", "created_at"] = Query("name"),
+    sort_order: Literal["asc", "desc"] = Query("asc")
 ):
     """Get skills from MongoDB"""
     try:
@@ -63,13 +67,7 @@ async def get_skills(
         skills = await query.to_list()
         
         # Convert to dicts with string IDs
-        result = []
-        for skill in skills:
-            skill_dict = skill.dict()
-            skill_dict["id"] = str(skill.id)
-            result.append(skill_dict)
-        
-        return result
+        return skill_list_adapter.dump_python(skills)
     except Exception as e:
         logger.error(f"Error fetching skills from MongoDB: {str(e)}")
         raise HTTPException(
@@ -104,10 +102,7 @@ async def create_skill(skill: Dict[str, Any]):
         await skill_doc.insert()
         
         # Return created skill
-        result = skill_doc.dict()
-        result["id"] = str(skill_doc.id)
-        
-        return result
+        return skill_doc.model_dump()
     except HTTPException:
         raise
     except Exception as e:
@@ -139,10 +134,7 @@ async def get_skill(skill_id: str):
             )
         
         # Return skill
-        result = skill.dict()
-        result["id"] = str(skill.id)
-        
-        return result
+        return skill.model_dump()
     except HTTPException:
         raise
     except Exception as e:
@@ -198,10 +190,7 @@ async def update_skill(skill_id: str, skill_update: Dict[str, Any]):
         await skill.save()
         
         # Return updated skill
-        result = skill.dict()
-        result["id"] = str(skill.id)
-        
-        return result
+        return skill.model_dump()
     except HTTPException:
         raise
     except Exception as e:
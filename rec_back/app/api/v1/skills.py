@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Path
 from sqlalchemy.orm import Session
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from uuid import UUID
 
 from app.api.v1.deps import (
@@ -13,7 +13,7 @@ from app.schemas.skill import (
     SkillCreate, SkillUpdate, Skill, SkillWithCategory,
     SkillCategoryCreate, SkillCategoryUpdate, SkillCategory,
     SkillSearchFilters, SkillListResponse, SkillCategoryListResponse,
-    SkillStats, CategoryStats
+    SkillStats, CategoryStats, skill_list_adapter, skill_category_list_adapter
 )
 from app.models.user import User
 from app.models.enums import UserRole
@@ -26,7 +26,7 @@ router = APIRouter()
 async def list_skills(
     # Search and filtering
     category_id: Optional[UUID] = Query(None, description="Filter by skill category"),
-    proficiency_level: Optional[str] = Query(None, description="Filter by proficiency level"),
+    proficiency_level: Optional[Literal["Beginner", "Intermediate", "Advanced", "Expert"]] = Query(None, description="Filter by proficiency level"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     industry: Optional[str] = Query(None, description="Filter by industry relevance"),
     
@@ -66,7 +66,7 @@ async def list_skills(
         )
         
         return SkillListResponse(
-            skills=skills,
+            skills=skill_list_adapter.validate_python(skills, from_attributes=True),
             total=total,
             page=pagination.page,
             page_size=pagination.page_size,
@@ -125,7 +125,7 @@ async def list_skill_categories(
         )
         
         return SkillCategoryListResponse(
-            categories=categories,
+            categories=skill_category_list_adapter.validate_python(categories, from_attributes=True),
             total=total
         )
     except Exception as e:
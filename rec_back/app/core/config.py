@@ -49,9 +49,14 @@ class Settings(BaseSettings):
     FIRST_SUPERUSER_EMAIL: str = os.getenv("FIRST_SUPERUSER_EMAIL", "admin@example.com")
     FIRST_SUPERUSER_PASSWORD: str = os.getenv("FIRST_SUPERUSER_PASSWORD", "changethis")
     
+    # Consultant dashboard materialized view refresh interval (0 disables)
+    CONSULTANT_STATS_REFRESH_MINUTES: int = int(os.getenv("CONSULTANT_STATS_REFRESH_MINUTES", "5"))
+    
     # Environment
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
+    # Validate ORM rows in BaseSchema.from_orm_fast instead of trusting them
+    ENABLE_VALIDATION: bool = os.getenv("ENABLE_VALIDATION", "False").lower() == "true"
     
     # Email
     SMTP_HOST: Optional[str] = os.getenv("SMTP_HOST")
@@ -0,0 +1,28 @@
+import importlib
+
+
+def lazy_exports(namespace, exports):
+    """
+    Build PEP 562 re-export hooks for a package __init__.
+
+    ``exports`` maps each submodule to the public names it defines. A name's
+    submodule is only imported on first attribute access, and the value is
+    then cached in the package namespace. Returns ``(__getattr__, __dir__,
+    __all__)`` for the package to bind at module level.
+    """
+    package = namespace["__name__"]
+    lazy = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name):
+        module_name = lazy.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(f".{module_name}", package)
+        value = getattr(module, name)
+        namespace[name] = value  # Cache so later lookups skip __getattr__
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(lazy))
+
+    return __getattr__, __dir__, tuple(sorted(lazy))
@@ -1,6 +1,7 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import and_, or_, desc, asc, func
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
+from sqlalchemy import and_, or_, desc, asc, func, select, literal, Text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from uuid import UUID
 from datetime import datetime
 
@@ -14,10 +15,22 @@ from app.schemas.admin import (
     AdminProfileCreate, AdminProfileUpdate,
     SuperAdminProfileCreate, SuperAdminProfileUpdate,
     AdminAuditLogCreate, SystemConfigurationCreate, SystemConfigurationUpdate,
-    AdminNotificationCreate
+    AdminNotificationCreate, AuditLogSearchFilters
 )
 
 
+# (AdminAuditLogWithDetails schema field, search_as_json page column)
+AUDIT_LOG_JSON_FIELDS = [
+    ('id', 'id'), ('admin_id', 'admin_id'), ('superadmin_id', 'superadmin_id'),
+    ('action_type', 'action_type'), ('resource_type', 'resource_type'), ('resource_id', 'resource_id'),
+    ('ip_address', 'ip_address'), ('user_agent', 'user_agent'), ('session_id', 'session_id'),
+    ('old_values', 'old_values'), ('new_values', 'new_values'), ('changes_summary', 'changes_summary'),
+    ('status', 'status'), ('error_message', 'error_message'), ('reason', 'reason'),
+    ('notes', 'notes'), ('metadata', 'admin_metadata'), ('created_at', 'created_at'),
+    ('admin_name', 'admin_name'), ('superadmin_name', 'superadmin_name'),
+]
+
+
 class CRUDAdminProfile(CRUDBase[AdminProfile, AdminProfileCreate, AdminProfileUpdate]):
     def get_by_user_id(self, db: Session, *, user_id: UUID) -> Optional[AdminProfile]:
         """Get admin profile by user ID"""
@@ -193,6 +206,65 @@ class CRUDAdminAuditLog(CRUDBase[AdminAuditLog, AdminAuditLogCreate, dict]):
             .limit(limit)\
             .all()
     
+    def search_as_json(self, db: Session, *, filters: AuditLogSearchFilters) -> Tuple[str, int]:
+        """Get a page of audit logs as a JSON array, plus the total match count"""
+        conditions = []
+        if filters.admin_id:
+            conditions.append(AdminAuditLog.admin_id == filters.admin_id)
+        if filters.user_id:
+            conditions.append(AdminAuditLog.admin_id.in_(
+                select(AdminProfile.id).where(AdminProfile.user_id == filters.user_id)
+            ))
+        if filters.action_type:
+            conditions.append(AdminAuditLog.action_type == filters.action_type)
+        if filters.resource_type:
+            conditions.append(AdminAuditLog.resource_type == filters.resource_type)
+        if filters.status:
+            conditions.append(AdminAuditLog.status == filters.status)
+        if filters.ip_address:
+            conditions.append(AdminAuditLog.ip_address == filters.ip_address)
+        if filters.date_from:
+            conditions.append(AdminAuditLog.created_at >= filters.date_from)
+        if filters.date_to:
+            conditions.append(AdminAuditLog.created_at <= filters.date_to)
+        
+        total = db.scalar(select(func.count(AdminAuditLog.id)).where(*conditions))
+        
+        sort_key = filters.sort_by or "created_at"
+        direction = asc if filters.sort_order == "asc" else desc
+        admin_user = aliased(User)
+        superadmin_user = aliased(User)
+        page = select(
+                AdminAuditLog,
+                admin_user.full_name.label("admin_name"),
+                superadmin_user.full_name.label("superadmin_name")
+            )\
+            .outerjoin(AdminProfile, AdminProfile.id == AdminAuditLog.admin_id)\
+            .outerjoin(admin_user, admin_user.id == AdminProfile.user_id)\
+            .outerjoin(SuperAdminProfile, SuperAdminProfile.id == AdminAuditLog.superadmin_id)\
+            .outerjoin(superadmin_user, superadmin_user.id == SuperAdminProfile.user_id)\
+            .where(*conditions)\
+            .order_by(direction(getattr(AdminAuditLog, sort_key)))\
+            .offset((filters.page - 1) * filters.page_size)\
+            .limit(filters.page_size)\
+            .subquery()
+        
+        # Keyed by AdminAuditLogWithDetails field names, so the rows need no
+        # per-object validation before they are sent
+        row = func.jsonb_build_object(*[
+            arg for field, column in AUDIT_LOG_JSON_FIELDS
+            for arg in (literal(field), page.c[column])
+        ])
+        logs = db.scalar(
+            select(
+                func.coalesce(
+                    func.jsonb_agg(aggregate_order_by(row, direction(page.c[sort_key]))),
+                    func.jsonb_build_array()
+                ).cast(Text)
+            )
+        )
+        return logs, total
+    
     def get_critical_actions(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[AdminAuditLog]:
         """Get critical system actions"""
         critical_actions = ["delete_user", "system_config_change", "emergency_access", "backup_restore"]
@@ -55,8 +55,7 @@ class CRUDApplication(CRUDBase[Application, ApplicationCreate, ApplicationUpdate
             search_term = f"%{filters.query}%"
             query = query.filter(
                 or_(
-                    User.first_name.ilike(search_term),
-                    User.last_name.ilike(search_term),
+                    User.full_name.ilike(search_term),
                     User.email.ilike(search_term),
                     Job.title.ilike(search_term),
                     Company.name.ilike(search_term)
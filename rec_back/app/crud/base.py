@@ -3,6 +3,7 @@ from uuid import UUID
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 
 from app.models.base import BaseModel as DBBaseModel
@@ -51,12 +52,15 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj_in: Union[UpdateSchemaType, Dict[str, Any]]
     ) -> ModelType:
         """Update an existing record"""
-        obj_data = jsonable_encoder(db_obj)
+        # Mapped columns, synonyms and hybrids - including deferred or
+        # unloaded ones, which never appear in the instance __dict__
+        mapper = inspect(self.model)
+        obj_fields = set(mapper.all_orm_descriptors.keys()) - set(mapper.relationships.keys())
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
-        for field in obj_data:
+        for field in obj_fields:
             if field in update_data:
                 setattr(db_obj, field, update_data[field])
         db.add(db_obj)
@@ -110,11 +114,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             obj_in_data = jsonable_encoder(obj_in)
             db_obj = self.model(**obj_in_data)
             db_objs.append(db_obj)
-        
+
         db.add_all(db_objs)
+        db.flush()  # One batched INSERT for the whole list
+        ids = [db_obj.id for db_obj in db_objs]
         db.commit()
-        for db_obj in db_objs:
-            db.refresh(db_obj)
+        # Reload every expired row with one IN query instead of a refresh per object
+        if ids:
+            db.query(self.model).filter(self.model.id.in_(ids)).all()
         return db_objs
 
     def bulk_update(
@@ -1,12 +1,13 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import and_, or_, desc, asc, func
-from uuid import UUID
+from typing import List, Optional, Dict, Any, Iterator
+from sqlalchemy.orm import Session, joinedload, selectinload, defer
+from sqlalchemy import and_, or_, desc, asc, func, select
+from sqlalchemy.dialects.postgresql import insert
+from uuid import UUID, uuid4
 
 from app.crud.base import CRUDBase
 from app.models.candidate import (
     CandidateProfile, CandidateEducation, CandidateExperience, 
-    CandidatePreferences, CandidateSkill, CandidateNotificationSettings
+    CandidatePreferences, CandidateSkill
 )
 from app.models.user import User
 from app.models.skill import Skill
@@ -34,8 +35,7 @@ class CRUDCandidateProfile(CRUDBase[CandidateProfile, CandidateProfileCreate, Ca
                 selectinload(CandidateProfile.education_records),
                 selectinload(CandidateProfile.experience_records),
                 joinedload(CandidateProfile.preferences),
-                selectinload(CandidateProfile.skills).joinedload(CandidateSkill.skill),
-                joinedload(CandidateProfile.notification_settings)
+                selectinload(CandidateProfile.skills).joinedload(CandidateSkill.skill)
             )\
             .filter(CandidateProfile.id == id)\
             .first()
@@ -61,8 +61,7 @@ class CRUDCandidateProfile(CRUDBase[CandidateProfile, CandidateProfileCreate, Ca
             search_term = f"%{filters.query}%"
             query = query.filter(
                 or_(
-                    User.first_name.ilike(search_term),
-                    User.last_name.ilike(search_term),
+                    User.full_name.ilike(search_term),
                     User.email.ilike(search_term),
                     CandidateProfile.current_position.ilike(search_term),
                     CandidateProfile.current_company.ilike(search_term),
@@ -121,6 +120,31 @@ class CRUDCandidateProfile(CRUDBase[CandidateProfile, CandidateProfileCreate, Ca
         
         return candidates, total
     
+    def stream(
+        self, 
+        db: Session, 
+        *filters, 
+        batch_size: int = 500
+    ) -> Iterator[CandidateProfile]:
+        """Stream candidate profiles in batches for exports and bulk matching.
+
+        Rows are fetched ``batch_size`` at a time so memory stays bounded
+        regardless of table size. Optional JSONB blobs are deferred and only
+        loaded if accessed.
+        """
+        stmt = select(CandidateProfile)\
+            .where(*filters)\
+            .options(
+                selectinload(CandidateProfile.skills),
+                defer(CandidateProfile.cv_urls),
+                defer(CandidateProfile.awards),
+                defer(CandidateProfile.publications)
+            )\
+            .execution_options(yield_per=batch_size)
+        
+        for partition in db.execute(stmt).scalars().partitions():
+            yield from partition
+    
     def update_profile_completion(self, db: Session, *, candidate_id: UUID) -> Optional[CandidateProfile]:
         """Update profile completion status"""
         candidate = self.get(db, id=candidate_id)
@@ -242,11 +266,13 @@ class CRUDCandidateJobPreference(CRUDBase[CandidatePreferences, CandidateJobPref
             return self.create(db, obj_in=create_data)
 
 
-class CRUDCandidateNotificationSettings(CRUDBase[CandidateNotificationSettings, CandidateNotificationSettingsCreate, CandidateNotificationSettingsUpdate]):
-    def get_by_candidate(self, db: Session, *, candidate_id: UUID) -> Optional[CandidateNotificationSettings]:
+class CRUDCandidateNotificationSettings(CRUDBase[CandidateProfile, CandidateNotificationSettingsCreate, CandidateNotificationSettingsUpdate]):
+    """Notification settings are flag bits on CandidateProfile, not a separate table"""
+
+    def get_by_candidate(self, db: Session, *, candidate_id: UUID) -> Optional[CandidateProfile]:
         """Get notification settings for a candidate"""
-        return db.query(CandidateNotificationSettings)\
-            .filter(CandidateNotificationSettings.candidate_id == candidate_id)\
+        return db.query(CandidateProfile)\
+            .filter(CandidateProfile.id == candidate_id)\
             .first()
     
     def create_or_update(
@@ -255,23 +281,18 @@ class CRUDCandidateNotificationSettings(CRUDBase[CandidateNotificationSettings,
         *, 
         candidate_id: UUID, 
         obj_in: CandidateNotificationSettingsUpdate
-    ) -> CandidateNotificationSettings:
-        """Create or update notification settings for a candidate"""
-        existing = self.get_by_candidate(db, candidate_id=candidate_id)
+    ) -> Optional[CandidateProfile]:
+        """Update notification settings for a candidate"""
+        candidate = self.get_by_candidate(db, candidate_id=candidate_id)
+        if not candidate:
+            return None
         
-        if existing:
-            update_data = obj_in.model_dump(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(existing, field, value)
-            db.commit()
-            db.refresh(existing)
-            return existing
-        else:
-            create_data = CandidateNotificationSettingsCreate(
-                candidate_id=candidate_id,
-                **obj_in.model_dump(exclude_unset=True)
-            )
-            return self.create(db, obj_in=create_data)
+        update_data = obj_in.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(candidate, field, value)
+        db.commit()
+        db.refresh(candidate)
+        return candidate
     
     def update_single_setting(
         self, 
@@ -280,25 +301,19 @@ class CRUDCandidateNotificationSettings(CRUDBase[CandidateNotificationSettings,
         candidate_id: UUID, 
         setting_name: str, 
         value: bool
-    ) -> Optional[CandidateNotificationSettings]:
+    ) -> Optional[CandidateProfile]:
         """Update a single notification setting"""
-        settings = self.get_by_candidate(db, candidate_id=candidate_id)
-        if not settings:
-            # Create default settings if they don't exist
-            settings = CandidateNotificationSettings(
-                candidate_id=candidate_id,
-                email_alerts=True,
-                job_matches=True,
-                application_updates=True
-            )
-            db.add(settings)
+        if setting_name not in CandidateNotificationSettingsUpdate.model_fields:
+            return None
         
-        if hasattr(settings, setting_name):
-            setattr(settings, setting_name, value)
-            db.commit()
-            db.refresh(settings)
-            return settings
-        return None
+        candidate = self.get_by_candidate(db, candidate_id=candidate_id)
+        if not candidate:
+            return None
+        
+        setattr(candidate, setting_name, value)
+        db.commit()
+        db.refresh(candidate)
+        return candidate
 
 
 class CRUDCandidateSkill(CRUDBase[CandidateSkill, CandidateSkillCreate, CandidateSkillUpdate]):
@@ -322,23 +337,53 @@ class CRUDCandidateSkill(CRUDBase[CandidateSkill, CandidateSkillCreate, Candidat
             .filter(CandidateSkill.candidate_id == candidate_id)\
             .delete()
         
-        # Add new skills
-        new_skills = []
-        for skill_info in skill_data:
-            candidate_skill = CandidateSkill(
-                candidate_id=candidate_id,
-                skill_id=skill_info['skill_id'],
-                proficiency_level=skill_info.get('proficiency_level'),
-                years_experience=skill_info.get('years_experience')
+        # Add new skills in a single executemany batch
+        if skill_data:
+            db.execute(
+                insert(CandidateSkill),
+                [
+                    {
+                        "candidate_id": candidate_id,
+                        "skill_id": skill_info['skill_id'],
+                        "proficiency_level": skill_info.get('proficiency_level'),
+                        "years_experience": skill_info.get('years_experience')
+                    }
+                    for skill_info in skill_data
+                ]
             )
-            db.add(candidate_skill)
-            new_skills.append(candidate_skill)
         
         db.commit()
-        for skill in new_skills:
-            db.refresh(skill)
+        return self.get_by_candidate(db, candidate_id=candidate_id)
+    
+    def add_missing(
+        self, 
+        db: Session, 
+        *, 
+        candidate_id: UUID, 
+        skill_ids: List[UUID], 
+        proficiency_level: Optional[str] = None
+    ) -> None:
+        """Attach skills the candidate does not have yet, leaving existing ones untouched.
+
+        Runs inside the caller's transaction; the caller commits.
+        """
+        if not skill_ids:
+            return
         
-        return new_skills
+        db.execute(
+            insert(CandidateSkill).on_conflict_do_nothing(
+                index_elements=[CandidateSkill.candidate_id, CandidateSkill.skill_id]
+            ),
+            [
+                {
+                    "id": uuid4(),
+                    "candidate_id": candidate_id,
+                    "skill_id": skill_id,
+                    "proficiency_level": proficiency_level
+                }
+                for skill_id in skill_ids
+            ]
+        )
     
     def get_by_skill(self, db: Session, *, skill_id: UUID, skip: int = 0, limit: int = 100) -> List[CandidateSkill]:
         """Get all candidates with a specific skill"""
@@ -357,5 +402,5 @@ candidate_profile = CRUDCandidateProfile(CandidateProfile)
 education = CRUDEducation(CandidateEducation)
 work_experience = CRUDWorkExperience(CandidateExperience)
 candidate_job_preference = CRUDCandidateJobPreference(CandidatePreferences)
-candidate_notification_settings = CRUDCandidateNotificationSettings(CandidateNotificationSettings)
+candidate_notification_settings = CRUDCandidateNotificationSettings(CandidateProfile)
 candidate_skill = CRUDCandidateSkill(CandidateSkill)
\ No newline at end of file
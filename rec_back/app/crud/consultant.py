@@ -1,13 +1,13 @@
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import and_, or_, desc, asc, func
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload
+from sqlalchemy import and_, or_, desc, asc, func, text
 from uuid import UUID
 from datetime import datetime
 
 from app.crud.base import CRUDBase
 from app.models.consultant import (
     ConsultantProfile, ConsultantStatus, ConsultantTarget, 
-    ConsultantPerformanceReview, ConsultantCandidate, ConsultantClient
+    ConsultantPerformanceReview, ConsultantCandidate, ConsultantClient, ConsultantStats
 )
 from app.models.candidate import CandidateProfile
 from app.models.company import Company
@@ -96,7 +96,9 @@ class CRUDConsultantProfile(CRUDBase[ConsultantProfile, ConsultantProfileCreate,
         if filters.sort_by == "experience_years":
             order_column = ConsultantProfile.years_of_experience
         elif filters.sort_by == "total_placements":
-            order_column = ConsultantProfile.total_placements
+            # The sort join also populates stats, replacing the default joined eager load
+            query = query.outerjoin(ConsultantProfile.stats).options(contains_eager(ConsultantProfile.stats))
+            order_column = func.coalesce(ConsultantStats.total_placements, 0)
         elif filters.sort_by == "updated_at":
             order_column = ConsultantProfile.updated_at
         else:  # default to created_at
@@ -116,40 +118,30 @@ class CRUDConsultantProfile(CRUDBase[ConsultantProfile, ConsultantProfileCreate,
     def get_active_consultants(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[ConsultantProfile]:
         """Get active consultants"""
         return db.query(ConsultantProfile)\
-            .options(joinedload(ConsultantProfile.user))\
+            .outerjoin(ConsultantProfile.stats)\
+            .options(
+                joinedload(ConsultantProfile.user),
+                contains_eager(ConsultantProfile.stats)
+            )\
             .filter(ConsultantProfile.status == ConsultantStatus.ACTIVE)\
-            .order_by(desc(ConsultantProfile.total_placements))\
+            .order_by(desc(func.coalesce(ConsultantStats.total_placements, 0)))\
             .offset(skip)\
             .limit(limit)\
             .all()
     
+    def refresh_stats(self, db: Session) -> None:
+        """Refresh consultant_stats_mv without blocking dashboard reads"""
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY consultant_stats_mv"))
+        db.commit()
+
     def update_performance_metrics(self, db: Session, *, consultant_id: UUID) -> Optional[ConsultantProfile]:
         """Update consultant performance metrics"""
         consultant = self.get(db, id=consultant_id)
         if not consultant:
             return None
-        
-        # Count active assignments
-        active_candidates = db.query(func.count(ConsultantCandidate.id))\
-            .filter(
-                and_(
-                    ConsultantCandidate.consultant_id == consultant_id,
-                    ConsultantCandidate.is_active == True
-                )
-            ).scalar()
-        
-        active_clients = db.query(func.count(ConsultantClient.id))\
-            .filter(
-                and_(
-                    ConsultantClient.consultant_id == consultant_id,
-                    ConsultantClient.is_active == True
-                )
-            ).scalar()
-        
-        # Update metrics
-        consultant.current_active_jobs = (active_candidates or 0) + (active_clients or 0)
-        
-        db.commit()
+
+        # Counters are aggregated in consultant_stats_mv
+        self.refresh_stats(db)
         db.refresh(consultant)
         return consultant
 
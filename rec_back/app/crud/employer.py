@@ -233,8 +233,7 @@ class CRUDEmployerProfile(CRUDBase[EmployerProfile, EmployerProfileCreate, Emplo
             search_term = f"%{filters.query}%"
             query = query.filter(
                 or_(
-                    User.first_name.ilike(search_term),
-                    User.last_name.ilike(search_term),
+                    User.full_name.ilike(search_term),
                     User.email.ilike(search_term),
                     EmployerProfile.position.ilike(search_term),
                     Company.name.ilike(search_term)
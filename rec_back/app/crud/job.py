@@ -1,7 +1,7 @@
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import and_, or_, desc, asc, func, case
-from uuid import UUID
+from sqlalchemy import and_, or_, desc, asc, func, case, insert
+from uuid import UUID, uuid4
 from datetime import datetime, date
 
 from app.crud.base import CRUDBase
@@ -201,18 +201,23 @@ class CRUDJobSkillRequirement(CRUDBase[JobSkillRequirement, JobSkillRequirementC
     
     def create_multiple(self, db: Session, *, job_id: UUID, skill_requirements: List[JobSkillRequirementCreate]) -> List[JobSkillRequirement]:
         """Create multiple skill requirements for a job"""
-        db_objs = []
+        rows = []
         for req in skill_requirements:
             req_data = req.model_dump()
+            req_data['id'] = uuid4()
             req_data['job_id'] = job_id
-            db_obj = JobSkillRequirement(**req_data)
-            db.add(db_obj)
-            db_objs.append(db_obj)
+            rows.append(req_data)
         
+        if not rows:
+            return []
+        
+        # Single executemany batch, then one SELECT to load the new rows
+        db.execute(insert(JobSkillRequirement), rows)
         db.commit()
-        for obj in db_objs:
-            db.refresh(obj)
-        return db_objs
+        return db.query(JobSkillRequirement)\
+            .options(joinedload(JobSkillRequirement.skill))\
+            .filter(JobSkillRequirement.id.in_([row['id'] for row in rows]))\
+            .all()
     
     def update_job_skills(self, db: Session, *, job_id: UUID, skill_requirements: List[JobSkillRequirementCreate]) -> List[JobSkillRequirement]:
         """Update all skill requirements for a job"""
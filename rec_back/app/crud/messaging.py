@@ -1,6 +1,7 @@
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import and_, or_, desc, asc, func
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload, raiseload
+from sqlalchemy import and_, or_, desc, asc, func, insert, select, literal, Text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from uuid import UUID
 from datetime import datetime
 
@@ -18,40 +19,125 @@ from app.schemas.messaging import (
 )
 
 
+# Queries over the messaging models end in raiseload("*") so that touching a
+# relationship that was not loaded up front raises instead of issuing N+1 SELECTs
+
+def load_message_full():
+    """SELECT for a message with everything needed to render it"""
+    return select(Message).options(
+        selectinload(Message.attachments),
+        selectinload(Message.read_receipts),
+        selectinload(Message.message_reactions),
+        joinedload(Message.sender),
+        joinedload(Message.reply_to),
+        raiseload("*")
+    )
+
+
+def load_conversation_full():
+    """SELECT for a conversation with its participants and messages"""
+    return select(Conversation).options(
+        joinedload(Conversation.created_by),
+        selectinload(Conversation.participants),
+        selectinload(Conversation.messages).joinedload(Message.sender),
+        raiseload("*")
+    )
+
+
+def _jsonb_object(*columns):
+    """jsonb_build_object() over columns, keyed by column name"""
+    args = []
+    for column in columns:
+        args.extend((literal(column.key), column))
+    return func.jsonb_build_object(*args)
+
+
+def _jsonb_array(element, *, where, order_by):
+    """Correlated jsonb_agg() subquery, '[]' instead of NULL when empty"""
+    return select(
+        func.coalesce(
+            func.jsonb_agg(aggregate_order_by(element, order_by)),
+            func.jsonb_build_array()
+        )
+    ).where(where).scalar_subquery()
+
+
+def conversation_json():
+    """SELECT returning a conversation with messages, attachments and reactions
+    as one nested JSON document, built in a single round-trip"""
+    attachments = _jsonb_array(
+        _jsonb_object(
+            MessageAttachment.id, MessageAttachment.file_name, MessageAttachment.file_url,
+            MessageAttachment.file_size, MessageAttachment.mime_type, MessageAttachment.thumbnail_url
+        ),
+        where=MessageAttachment.message_id == Message.id,
+        order_by=MessageAttachment.created_at
+    )
+    reactions = _jsonb_array(
+        _jsonb_object(MessageReaction.user_id, MessageReaction.emoji, MessageReaction.created_at),
+        where=MessageReaction.message_id == Message.id,
+        order_by=MessageReaction.created_at
+    )
+    message = _jsonb_object(
+        Message.id, Message.sender_id, Message.content, Message.message_type, Message.status,
+        Message.reply_to_id, Message.thread_root_id, Message.is_edited, Message.is_pinned,
+        Message.sent_at
+    ).concat(func.jsonb_build_object("attachments", attachments, "reactions", reactions))
+    messages = _jsonb_array(
+        message,
+        where=and_(Message.conversation_id == Conversation.id, Message.is_deleted == False),
+        order_by=Message.sent_at
+    )
+    conversation = _jsonb_object(
+        Conversation.id, Conversation.title, Conversation.type, Conversation.description,
+        Conversation.created_by_id, Conversation.total_messages, Conversation.last_message_at,
+        Conversation.created_at, Conversation.updated_at
+    ).concat(func.jsonb_build_object("messages", messages))
+    # Text keeps the driver from decoding JSON the caller only passes through
+    return select(conversation.cast(Text))
+
+
 class CRUDConversation(CRUDBase[Conversation, ConversationCreate, ConversationUpdate]):
     def get_with_details(self, db: Session, *, id: UUID) -> Optional[Conversation]:
         """Get conversation with participants and recent messages"""
-        return db.query(Conversation)\
-            .options(
-                joinedload(Conversation.created_by),
-                selectinload(Conversation.participants),
-                selectinload(Conversation.messages).joinedload(Message.sender)
-            )\
-            .filter(Conversation.id == id)\
-            .first()
+        return db.execute(
+            load_conversation_full().where(Conversation.id == id)
+        ).unique().scalar_one_or_none()
+    
+    def get_as_json(self, db: Session, *, id: UUID) -> Optional[str]:
+        """Get a conversation with its messages as a JSON document"""
+        return db.scalar(conversation_json().where(Conversation.id == id))
     
     def get_user_conversations(self, db: Session, *, user_id: UUID, skip: int = 0, limit: int = 50) -> List[Conversation]:
         """Get conversations for a user"""
         from app.models.messaging import conversation_participants
-        return db.query(Conversation)\
+        # Page over conversation ids first so LIMIT counts conversations, then
+        # join every participant once and let contains_eager reuse that JOIN
+        page = select(Conversation.id, Conversation.last_activity_at)\
             .join(conversation_participants)\
-            .filter(conversation_participants.c.user_id == user_id)\
-            .options(
-                joinedload(Conversation.created_by),
-                selectinload(Conversation.participants)
-            )\
+            .where(conversation_participants.c.user_id == user_id)\
             .order_by(desc(Conversation.last_activity_at))\
             .offset(skip)\
             .limit(limit)\
-            .all()
+            .subquery()
+        return db.execute(
+            select(Conversation)
+            .join(page, page.c.id == Conversation.id)
+            .outerjoin(Conversation.participants)
+            .options(
+                joinedload(Conversation.created_by),
+                contains_eager(Conversation.participants),
+                raiseload("*")
+            )
+            .order_by(desc(page.c.last_activity_at))
+        ).unique().scalars().all()
     
     def create_direct_conversation(self, db: Session, *, user1_id: UUID, user2_id: UUID, title: Optional[str] = None) -> Conversation:
         """Create a direct conversation between two users"""
         conversation = Conversation(
             title=title,
             type=ConversationType.DIRECT,
-            created_by_id=user1_id,
-            last_activity_at=datetime.utcnow()
+            created_by_id=user1_id
         )
         db.add(conversation)
         db.flush()  # Get the ID
@@ -60,8 +146,8 @@ class CRUDConversation(CRUDBase[Conversation, ConversationCreate, ConversationUp
         from app.models.messaging import conversation_participants
         db.execute(
             conversation_participants.insert().values([
-                {"conversation_id": conversation.id, "user_id": user1_id, "joined_at": datetime.utcnow()},
-                {"conversation_id": conversation.id, "user_id": user2_id, "joined_at": datetime.utcnow()}
+                {"conversation_id": conversation.id, "user_id": user1_id},
+                {"conversation_id": conversation.id, "user_id": user2_id}
             ])
         )
         
@@ -76,8 +162,7 @@ class CRUDConversation(CRUDBase[Conversation, ConversationCreate, ConversationUp
             db.execute(
                 conversation_participants.insert().values(
                     conversation_id=conversation_id,
-                    user_id=user_id,
-                    joined_at=datetime.utcnow()
+                    user_id=user_id
                 )
             )
             db.commit()
@@ -119,15 +204,11 @@ class CRUDConversation(CRUDBase[Conversation, ConversationCreate, ConversationUp
 class CRUDMessage(CRUDBase[Message, MessageCreate, MessageUpdate]):
     def get_with_details(self, db: Session, *, id: UUID) -> Optional[Message]:
         """Get message with sender and attachments"""
-        return db.query(Message)\
-            .options(
-                joinedload(Message.sender),
-                joinedload(Message.conversation),
-                selectinload(Message.attachments),
-                selectinload(Message.read_receipts)
-            )\
-            .filter(Message.id == id)\
-            .first()
+        return db.execute(
+            load_message_full()
+            .options(joinedload(Message.conversation))
+            .where(Message.id == id)
+        ).unique().scalar_one_or_none()
     
     def get_conversation_messages(
         self, 
@@ -138,31 +219,56 @@ class CRUDMessage(CRUDBase[Message, MessageCreate, MessageUpdate]):
         limit: int = 50
     ) -> List[Message]:
         """Get messages in a conversation"""
+        # Matches the partial index ix_messages_conv_sent_active; senders are
+        # batch-loaded per request by UserLoader rather than joined per row
         return db.query(Message)\
             .options(
-                joinedload(Message.sender),
-                selectinload(Message.attachments)
+                selectinload(Message.attachments),
+                raiseload("*")
             )\
-            .filter(Message.conversation_id == conversation_id)\
+            .filter(
+                and_(
+                    Message.conversation_id == conversation_id,
+                    Message.is_deleted == False
+                )
+            )\
+            .order_by(desc(Message.sent_at))\
+            .offset(skip)\
+            .limit(limit)\
+            .all()
+    
+    def get_thread(self, db: Session, *, conversation_id: UUID, thread_root_id: UUID) -> List[Message]:
+        """Get every message in a conversation thread, oldest first"""
+        return db.query(Message)\
+            .options(
+                selectinload(Message.attachments),
+                raiseload("*")
+            )\
+            .filter(
+                and_(
+                    Message.thread_root_id == thread_root_id,
+                    Message.conversation_id == conversation_id,
+                    Message.is_deleted == False
+                )
+            )\
+            .order_by(asc(Message.sent_at))\
+            .all()
+    
+    def get_user_mentions(self, db: Session, *, user_id: UUID, skip: int = 0, limit: int = 50) -> List[Message]:
+        """Get messages mentioning a user"""
+        # contains() compiles to @>, which ix_messages_mentions_gin can serve
+        return db.query(Message)\
+            .options(raiseload("*"))\
+            .filter(Message.mentions.contains([str(user_id)]))\
             .order_by(desc(Message.created_at))\
             .offset(skip)\
             .limit(limit)\
             .all()
     
     def create_message(self, db: Session, *, message_data: MessageCreate) -> Message:
-        """Create a new message and update conversation activity"""
+        """Create a new message (conversation activity and count are updated by trigger)"""
         message = Message(**message_data.model_dump())
-        message.sent_at = datetime.utcnow()
         db.add(message)
-        db.flush()
-        
-        # Update conversation activity and message count
-        conversation = db.query(Conversation).filter(Conversation.id == message.conversation_id).first()
-        if conversation:
-            conversation.last_activity_at = datetime.utcnow()
-            conversation.last_message_at = datetime.utcnow()
-            conversation.total_messages = (conversation.total_messages or 0) + 1
-        
         db.commit()
         db.refresh(message)
         return message
@@ -172,8 +278,7 @@ class CRUDMessage(CRUDBase[Message, MessageCreate, MessageUpdate]):
         try:
             read_receipt = MessageReadReceipt(
                 message_id=message_id,
-                user_id=user_id,
-                read_at=datetime.utcnow()
+                user_id=user_id
             )
             db.add(read_receipt)
             db.commit()
@@ -182,6 +287,44 @@ class CRUDMessage(CRUDBase[Message, MessageCreate, MessageUpdate]):
             db.rollback()
             return False
     
+    def mark_many_as_read(self, db: Session, *, message_ids: List[UUID], user_id: UUID) -> int:
+        """Mark messages as read by user, inserting all receipts in one batch"""
+        if not message_ids:
+            return 0
+        # Skip unknown messages and ones this user has already read
+        already_read = select(MessageReadReceipt.message_id).where(MessageReadReceipt.user_id == user_id)
+        unread_ids = db.scalars(
+            select(Message.id).where(
+                and_(
+                    Message.id.in_(message_ids),
+                    Message.id.not_in(already_read)
+                )
+            )
+        ).all()
+        
+        if unread_ids:
+            db.execute(
+                insert(MessageReadReceipt),
+                [{"message_id": message_id, "user_id": user_id} for message_id in unread_ids]
+            )
+            db.commit()
+        return len(unread_ids)
+    
+    def get_reaction_counts(self, db: Session, *, message_ids: List[UUID]) -> Dict[UUID, Dict[str, int]]:
+        """Get emoji tallies for a batch of messages, most used first"""
+        if not message_ids:
+            return {}
+        counts: Dict[UUID, Dict[str, int]] = {}
+        rows = db.execute(
+            select(MessageReaction.message_id, MessageReaction.emoji, func.count().label("count"))
+            .where(MessageReaction.message_id.in_(message_ids))
+            .group_by(MessageReaction.message_id, MessageReaction.emoji)
+            .order_by(MessageReaction.message_id, desc("count"))
+        ).all()
+        for message_id, emoji, count in rows:
+            counts.setdefault(message_id, {})[emoji] = count
+        return counts
+    
     def add_reaction(self, db: Session, *, message_id: UUID, user_id: UUID, emoji: str) -> bool:
         """Add reaction to message"""
         try:
@@ -7,7 +7,8 @@ from app.models.base import Base  # Import Base first
 from app.models.user import User
 from app.models.candidate import (
     CandidateProfile, CandidateEducation, CandidateExperience,
-    CandidatePreferences, CandidateSkill, CandidateNotificationSettings
+    CandidatePreferences, CandidateSkill,
+    CandidatePreferredJobType, CandidatePreferredIndustry, CandidatePreferredLocation
 )
 from app.models.company import (
     Company, EmployerProfile, CompanyContact,
@@ -18,10 +19,10 @@ from app.models.skill import Skill, SkillCategory
 from app.models.application import Application, ApplicationStatusHistory, ApplicationNote
 from app.models.consultant import (
     ConsultantProfile, ConsultantTarget, ConsultantPerformanceReview,
-    ConsultantCandidate, ConsultantClient, consultant_skills
+    ConsultantCandidate, ConsultantClient, ConsultantStats, consultant_skills
 )
 from app.models.messaging import (
-    Conversation, Message, MessageAttachment, MessageReadReceipt,
+    Conversation, Message, MessageFileMeta, MessageTemplateBinding, MessageAttachment, MessageReadReceipt,
     MessageReaction, EmailTemplate, conversation_participants
 )
 from app.models.admin import (
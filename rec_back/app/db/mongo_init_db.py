@@ -106,7 +106,7 @@ async def _load_skills():
         
         # Insert skills into database
         if skills:
-            await SkillDocument.insert_many(skills)
+            await SkillDocument.bulk_create(skills)
             logger.info(f"Loaded {len(skills)} skills into MongoDB")
     except Exception as e:
         logger.error(f"Error loading skills: {e}")
@@ -149,7 +149,7 @@ async def _load_companies():
         
         # Insert companies into database
         if companies:
-            await CompanyDocument.insert_many(companies)
+            await CompanyDocument.bulk_create(companies)
             logger.info(f"Loaded {len(companies)} companies into MongoDB")
     except Exception as e:
         logger.error(f"Error loading companies: {e}")
@@ -191,7 +191,7 @@ async def _load_users():
         
         # Insert users into database
         if users:
-            await UserDocument.insert_many(users)
+            await UserDocument.bulk_create(users)
             logger.info(f"Loaded {len(users)} users into MongoDB")
     except Exception as e:
         logger.error(f"Error loading users: {e}")
@@ -234,7 +234,7 @@ async def _load_email_templates():
         
         # Insert templates into database
         if templates:
-            await EmailTemplateDocument.insert_many(templates)
+            await EmailTemplateDocument.bulk_create(templates)
             logger.info(f"Loaded {len(templates)} email templates into MongoDB")
     except Exception as e:
         logger.error(f"Error loading email templates: {e}")
@@ -27,7 +27,9 @@ class MongoDB:
                 connectTimeoutMS=settings.MONGODB_CONNECT_TIMEOUT,
                 socketTimeoutMS=settings.MONGODB_SOCKET_TIMEOUT,
                 retryWrites=True,
-                w='majority'
+                w='majority',
+                # UUIDs travel as 16-byte BSON Binary subtype 4 and decode back to uuid.UUID
+                uuidRepresentation='standard'
             )
             
             # Get database instance
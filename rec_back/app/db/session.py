@@ -1,10 +1,19 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
 import os
 
 from app.core.config import settings
 
+# psycopg2: fold executemany() UPDATE/DELETE batches into few round-trips too
+# (SQLAlchemy 2.1 maps plain postgresql:// URLs to psycopg 3, which batches natively)
+driver_options = (
+    {"executemany_mode": "values_plus_batch", "executemany_batch_page_size": 500}
+    if make_url(settings.DATABASE_URL).get_dialect().driver == "psycopg2"
+    else {}
+)
+
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
@@ -12,6 +21,8 @@ engine = create_engine(
     pool_size=10,
     max_overflow=20,
     echo=settings.DEBUG,  # Log SQL queries in debug mode
+    insertmanyvalues_page_size=10000,  # Rows per batched INSERT ... VALUES statement
+    **driver_options,
 )
 
 # Create SessionLocal class
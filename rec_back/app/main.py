@@ -2,6 +2,7 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse
+import asyncio
 import logging
 from app.api.v1 import (
     ai_tools_db, candidates, companies, jobs, skills, 
@@ -102,4 +103,48 @@ async def startup_event():
     except Exception as e:
         logger.error(f"MongoDB initialization failed: {str(e)}")
 
+async def refresh_consultant_stats():
+    """Periodically refresh the consultant dashboard materialized view"""
+    from app.crud.consultant import consultant_profile
+    from app.db.session import SessionLocal
+
+    def _refresh():
+        db = SessionLocal()
+        try:
+            consultant_profile.refresh_stats(db)
+        finally:
+            db.close()
+
+    while True:
+        await asyncio.sleep(settings.CONSULTANT_STATS_REFRESH_MINUTES * 60)
+        try:
+            await asyncio.to_thread(_refresh)
+        except Exception as e:
+            logger.error(f"Consultant stats refresh failed: {str(e)}")
+
+@app.on_event("startup")
+async def start_consultant_stats_refresh():
+    """Schedule consultant_stats_mv refreshes"""
+    if settings.CONSULTANT_STATS_REFRESH_MINUTES > 0:
+        app.state.consultant_stats_task = asyncio.create_task(refresh_consultant_stats())
+
+@app.on_event("startup")
+async def build_list_adapters():
+    """Build the deferred list adapters once, before the first request needs them"""
+    from app.schemas.admin import admin_list_adapter, system_configuration_list_adapter
+    from app.schemas.application import application_list_adapter
+    from app.schemas.candidate import candidate_profile_list_adapter
+    from app.schemas.consultant import consultant_profile_list_adapter
+    from app.schemas.job import job_list_adapter
+    from app.schemas.messaging import conversation_list_adapter, message_list_adapter
+    from app.schemas.skill import skill_category_list_adapter, skill_list_adapter
+
+    for adapter in (
+        admin_list_adapter, system_configuration_list_adapter,
+        application_list_adapter, candidate_profile_list_adapter, consultant_profile_list_adapter,
+        job_list_adapter, conversation_list_adapter, message_list_adapter,
+        skill_list_adapter, skill_category_list_adapter
+    ):
+        adapter.rebuild()
+
 # Note: We don't need the shutdown event here as it's handled by init_mongodb()
\ No newline at end of file
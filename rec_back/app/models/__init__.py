@@ -9,7 +9,8 @@ from .enums import (
 from .user import User
 from .candidate import (
     CandidateProfile, CandidateEducation, CandidateExperience, 
-    CandidatePreferences, CandidateSkill, CandidateNotificationSettings
+    CandidatePreferences, CandidateSkill,
+    CandidatePreferredJobType, CandidatePreferredIndustry, CandidatePreferredLocation
 )
 from .company import (
     EmployerProfile, Company, CompanyContact, 
@@ -20,10 +21,11 @@ from .skill import Skill, SkillCategory
 from .application import Application, ApplicationStatusHistory, ApplicationNote
 from .consultant import (
     ConsultantProfile, ConsultantStatus, ConsultantTarget, 
-    ConsultantPerformanceReview, ConsultantCandidate, ConsultantClient
+    ConsultantPerformanceReview, ConsultantCandidate, ConsultantClient,
+    ConsultantStats
 )
 from .messaging import (
-    Conversation, Message, MessageAttachment, MessageReadReceipt, MessageReaction, 
+    Conversation, Message, MessageFileMeta, MessageTemplateBinding, MessageAttachment, MessageReadReceipt, MessageReaction, 
     EmailTemplate, ConversationType, MessageType, MessageStatus
 )
 from .admin import (
@@ -47,7 +49,8 @@ __all__ = [
     
     # Candidate module
     "CandidateProfile", "CandidateEducation", "CandidateExperience", 
-    "CandidatePreferences", "CandidateSkill", "CandidateNotificationSettings",
+    "CandidatePreferences", "CandidateSkill",
+    "CandidatePreferredJobType", "CandidatePreferredIndustry", "CandidatePreferredLocation",
     
     # Employer module
     "EmployerProfile", "Company", "CompanyContact", 
@@ -65,9 +68,10 @@ __all__ = [
     # Consultant module
     "ConsultantProfile", "ConsultantTarget", 
     "ConsultantPerformanceReview", "ConsultantCandidate", "ConsultantClient",
+    "ConsultantStats",
     
     # Messaging module
-    "Conversation", "Message", "MessageAttachment", "MessageReadReceipt", "MessageReaction",
+    "Conversation", "Message", "MessageFileMeta", "MessageTemplateBinding", "MessageAttachment", "MessageReadReceipt", "MessageReaction",
     "EmailTemplate",
     
     # Admin module
@@ -52,6 +52,7 @@ class AdminProfile(BaseModel):
     supervisor = relationship("AdminProfile", remote_side="AdminProfile.id")
     supervised_admins = relationship("AdminProfile", back_populates="supervisor")
     audit_logs = relationship("AdminAuditLog", back_populates="admin")
+    notifications = relationship("AdminNotification", back_populates="admin")
 
 
 class SuperAdminProfile(BaseModel):
@@ -88,6 +89,8 @@ class SuperAdminProfile(BaseModel):
     
     # Relationships
     user = relationship("User", back_populates="superadmin_profile")
+    audit_logs = relationship("AdminAuditLog", back_populates="superadmin")
+    notifications = relationship("AdminNotification", back_populates="superadmin")
 
 
 class AdminAuditLog(BaseModel):
@@ -122,7 +125,7 @@ class AdminAuditLog(BaseModel):
     
     # Relationships
     admin = relationship("AdminProfile", back_populates="audit_logs")
-    superadmin = relationship("SuperAdminProfile", backref="audit_logs")
+    superadmin = relationship("SuperAdminProfile", back_populates="audit_logs")
 
 
 class SystemConfiguration(BaseModel):
@@ -185,5 +188,5 @@ class AdminNotification(BaseModel):
     source_id = Column(UUID(as_uuid=True), nullable=True)
     
     # Relationships
-    admin = relationship("AdminProfile", backref="notifications")
-    superadmin = relationship("SuperAdminProfile", backref="notifications")
\ No newline at end of file
+    admin = relationship("AdminProfile", back_populates="notifications")
+    superadmin = relationship("SuperAdminProfile", back_populates="notifications")
\ No newline at end of file
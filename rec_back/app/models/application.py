@@ -1,12 +1,20 @@
-from sqlalchemy import Column, String, Text, Date, ForeignKey, Enum as SQLEnum, DateTime, Integer, func
+from sqlalchemy import Column, String, Text, Date, ForeignKey, Index, Enum as SQLEnum, DateTime, Integer, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.base import BaseModel
+from app.models.base import BaseModel, model_repr
 from app.models.enums import ApplicationStatus
 
 
 class Application(BaseModel):
     __tablename__ = "applications"
+    __table_args__ = (
+        Index("ix_applications_candidate_applied", "candidate_id", "applied_at"),
+        Index("ix_applications_job_applied", "job_id", "applied_at"),
+        Index("ix_applications_status_applied", "status", "applied_at"),
+        Index("ix_applications_consultant_updated", "consultant_id", "last_updated"),
+        # Append-only timestamp: BRIN for applied_after/applied_before ranges
+        Index("ix_applications_applied_at_brin", "applied_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+    )
 
     candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidate_profiles.id"), nullable=False)
     job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id"), nullable=False)
@@ -44,8 +52,7 @@ class Application(BaseModel):
     status_history = relationship("ApplicationStatusHistory", back_populates="application", cascade="all, delete-orphan")
     notes = relationship("ApplicationNote", back_populates="application", cascade="all, delete-orphan")
 
-    def __repr__(self):
-        return f"<Application(id={self.id}, candidate_id={self.candidate_id}, job_id={self.job_id}, status={self.status})>"
+    __repr__ = model_repr("Application", "id", "candidate_id", "job_id", "status")
 
 
 class ApplicationStatusHistory(BaseModel):
@@ -61,8 +68,7 @@ class ApplicationStatusHistory(BaseModel):
     application = relationship("Application", back_populates="status_history")
     changed_by_user = relationship("User", foreign_keys=[changed_by])
 
-    def __repr__(self):
-        return f"<ApplicationStatusHistory(id={self.id}, application_id={self.application_id}, status={self.status})>"
+    __repr__ = model_repr("ApplicationStatusHistory", "id", "application_id", "status")
 
 
 class ApplicationNote(BaseModel):
@@ -76,5 +82,4 @@ class ApplicationNote(BaseModel):
     application = relationship("Application", back_populates="notes")
     consultant = relationship("ConsultantProfile", back_populates="application_notes")
 
-    def __repr__(self):
-        return f"<ApplicationNote(id={self.id}, application_id={self.application_id}, consultant_id={self.consultant_id})>"
\ No newline at end of file
+    __repr__ = model_repr("ApplicationNote", "id", "application_id", "consultant_id")
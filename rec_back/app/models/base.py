@@ -1,10 +1,47 @@
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import Column, DateTime, FetchedValue, event, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declared_attr, declarative_base
+from sqlalchemy.ext.hybrid import hybrid_property
 import uuid
 
 Base = declarative_base()
 
+
+def model_repr(name, *fields, **labels):
+    """
+    Build a __repr__ from a template compiled once per class.
+    Positional fields are shown under their own name; keyword labels map
+    a display label to the attribute, e.g. level="proficiency_level".
+    """
+    parts = [f"{field}={{0.{field}}}" for field in fields]
+    parts += [f"{label}={{0.{attr}}}" for label, attr in labels.items()]
+    template = f"<{name}(" + ", ".join(parts) + ")>"
+
+    def __repr__(self):
+        return template.format(self)
+
+    return __repr__
+
+
+def flag_property(bit, default_flags=0):
+    """
+    Boolean view of one bit of a model's SMALLINT ``flags`` column.
+    Works on instances (including constructor kwargs, before the column
+    default is applied) and in query expressions.
+    """
+    def fget(self):
+        flags = self.flags if self.flags is not None else default_flags
+        return bool(flags & bit)
+
+    def fset(self, value):
+        flags = self.flags if self.flags is not None else default_flags
+        self.flags = flags | bit if value else flags & ~bit
+
+    def expr(cls):
+        return cls.flags.op("&")(bit) != 0
+
+    return hybrid_property(fget, fset, expr=expr)
+
 class TimestampMixin:
     """Mixin for adding timestamp fields to models."""
     
@@ -14,14 +51,44 @@ class TimestampMixin:
     
     @declared_attr
     def updated_at(cls):
+        # Maintained by the set_updated_at trigger; FetchedValue tells the
+        # ORM to expire the attribute after UPDATE instead of sending a value
         return Column(
             DateTime(timezone=True), 
             server_default=func.now(), 
-            onupdate=func.now(), 
+            server_onupdate=FetchedValue(), 
             nullable=False
         )
 
 
+# Bumps updated_at on UPDATE unless the statement set it explicitly
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+        NEW.updated_at = now();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_updated_at_triggers(target, connection, **kw):
+    """Install set_updated_at on every table created by create_all (init_db)"""
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(text(SET_UPDATED_AT_FUNCTION))
+    for table in kw.get("tables") or target.sorted_tables:
+        if "updated_at" in table.c:
+            connection.execute(text(f"DROP TRIGGER IF EXISTS set_updated_at ON {table.name}"))
+            connection.execute(text(
+                f"CREATE TRIGGER set_updated_at BEFORE UPDATE ON {table.name} "
+                "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+            ))
+
+
 class UUIDMixin:
     """Mixin for adding UUID primary key to models."""
     
@@ -1,12 +1,54 @@
-from sqlalchemy import Column, String, Boolean, Integer, Date, Text, ForeignKey, ARRAY, Enum as SQLEnum
+from sqlalchemy import (
+    Column, String, Boolean, Integer, SmallInteger, Date, Text, ForeignKey, Index, UniqueConstraint,
+    CheckConstraint, TypeDecorator, text
+)
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from app.models.base import BaseModel
-from app.models.enums import ContractType, ProficiencyLevel
+from app.models.base import BaseModel, model_repr, flag_property
+from app.models.enums import ContractType, ProficiencyLevel, PROFICIENCY_LEVEL_CODES
+
+
+_PROFICIENCY_INT2MEMBER = {code: member for member, code in PROFICIENCY_LEVEL_CODES.items()}
+
+
+class ProficiencyLevelType(TypeDecorator):
+    """Stores ProficiencyLevel as a SMALLINT ordinal (0=Beginner..3=Expert) and loads it back as the enum member"""
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, int):
+            return value
+        # Accept members, values ("Expert") and names ("EXPERT")
+        member = ProficiencyLevel._vmap.get(value) or ProficiencyLevel[value]
+        return member.int_code
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return _PROFICIENCY_INT2MEMBER[value]
+
+
+# CandidateProfile.flags bits - never renumber, only append
+CANDIDATE_FLAG_PROFILE_COMPLETED = 0x1
+CANDIDATE_FLAG_OPEN_TO_OPPORTUNITIES = 0x2
+CANDIDATE_FLAG_WILLING_TO_RELOCATE = 0x4
+CANDIDATE_FLAG_EMAIL_ALERTS = 0x8
+CANDIDATE_FLAG_JOB_MATCHES = 0x10
+CANDIDATE_FLAG_APPLICATION_UPDATES = 0x20
+CANDIDATE_DEFAULT_FLAGS = (
+    CANDIDATE_FLAG_OPEN_TO_OPPORTUNITIES | CANDIDATE_FLAG_EMAIL_ALERTS
+    | CANDIDATE_FLAG_JOB_MATCHES | CANDIDATE_FLAG_APPLICATION_UPDATES
+)
 
 
 class CandidateProfile(BaseModel):
     __tablename__ = "candidate_profiles"
+    __table_args__ = (
+        # jsonb_path_ops GIN indexes back the @> containment filters
+        Index("ix_candidate_languages_gin", "languages", postgresql_using="gin", postgresql_ops={"languages": "jsonb_path_ops"}),
+        Index("ix_candidate_certifications_gin", "certifications", postgresql_using="gin", postgresql_ops={"certifications": "jsonb_path_ops"}),
+    )
 
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, unique=True)
     
@@ -25,10 +67,13 @@ class CandidateProfile(BaseModel):
     address = Column(String(500), nullable=True)
     postal_code = Column(String(20), nullable=True)
     
+    # Boolean attributes packed into one SMALLINT, see CANDIDATE_FLAG_*
+    flags = Column(SmallInteger, default=CANDIDATE_DEFAULT_FLAGS, server_default=text(str(CANDIDATE_DEFAULT_FLAGS)), nullable=False)
+    
     # Profile Status
-    profile_completed = Column(Boolean, default=False, nullable=False)
+    profile_completed = flag_property(CANDIDATE_FLAG_PROFILE_COMPLETED, CANDIDATE_DEFAULT_FLAGS)
     profile_visibility = Column(String(20), default="public", nullable=False)
-    is_open_to_opportunities = Column(Boolean, default=True, nullable=False)
+    is_open_to_opportunities = flag_property(CANDIDATE_FLAG_OPEN_TO_OPPORTUNITIES, CANDIDATE_DEFAULT_FLAGS)
     
     # Documents
     cv_urls = Column(JSONB, nullable=True)  # Array of CV file URLs
@@ -46,7 +91,12 @@ class CandidateProfile(BaseModel):
     publications = Column(JSONB, nullable=True)  # Array of publication objects
     
     # Preferences
-    willing_to_relocate = Column(Boolean, default=False, nullable=False)
+    willing_to_relocate = flag_property(CANDIDATE_FLAG_WILLING_TO_RELOCATE, CANDIDATE_DEFAULT_FLAGS)
+    
+    # Notification settings (formerly the candidate_notification_settings table)
+    email_alerts = flag_property(CANDIDATE_FLAG_EMAIL_ALERTS, CANDIDATE_DEFAULT_FLAGS)
+    job_matches = flag_property(CANDIDATE_FLAG_JOB_MATCHES, CANDIDATE_DEFAULT_FLAGS)
+    application_updates = flag_property(CANDIDATE_FLAG_APPLICATION_UPDATES, CANDIDATE_DEFAULT_FLAGS)
     salary_expectation = Column(Integer, nullable=True)
     
     # Notes
@@ -55,25 +105,24 @@ class CandidateProfile(BaseModel):
     # Relationships
     user = relationship("User", back_populates="candidate_profile")
     preferences = relationship("CandidatePreferences", back_populates="candidate", uselist=False, cascade="all, delete-orphan")
-    notification_settings = relationship("CandidateNotificationSettings", back_populates="candidate", uselist=False, cascade="all, delete-orphan")
     education_records = relationship("CandidateEducation", back_populates="candidate", cascade="all, delete-orphan")
     experience_records = relationship("CandidateExperience", back_populates="candidate", cascade="all, delete-orphan")
     skills = relationship("CandidateSkill", back_populates="candidate", cascade="all, delete-orphan")
     applications = relationship("Application", back_populates="candidate", cascade="all, delete-orphan")
     consultant_assignments = relationship("ConsultantCandidate", back_populates="candidate")
-    
 
-    def __repr__(self):
-        return f"<CandidateProfile(id={self.id}, user_id={self.user_id})>"
+    @property
+    def notification_settings(self) -> "CandidateProfile":
+        """Notification settings are inlined on the profile; kept for schema compatibility"""
+        return self
+
+    __repr__ = model_repr("CandidateProfile", "id", "user_id")
 
 
 class CandidatePreferences(BaseModel):
     __tablename__ = "candidate_preferences"
 
     candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidate_profiles.id"), nullable=False, unique=True)
-    job_types = Column(ARRAY(String), nullable=True)
-    industries = Column(ARRAY(String), nullable=True)
-    locations = Column(ARRAY(String), nullable=True)
     remote_work = Column(Boolean, default=False, nullable=True)
     salary_expectation_min = Column(Integer, nullable=True)
     salary_expectation_max = Column(Integer, nullable=True)
@@ -82,18 +131,104 @@ class CandidatePreferences(BaseModel):
 
     # Relationships
     candidate = relationship("CandidateProfile", back_populates="preferences")
+    
+    # Preferred values live in child tables keyed by candidate_id for indexable matching joins
+    _job_type_rows = relationship(
+        "CandidatePreferredJobType",
+        primaryjoin="CandidatePreferences.candidate_id == foreign(CandidatePreferredJobType.candidate_id)",
+        order_by="CandidatePreferredJobType.job_type",
+        cascade="all, delete-orphan",
+        lazy="selectin"
+    )
+    _industry_rows = relationship(
+        "CandidatePreferredIndustry",
+        primaryjoin="CandidatePreferences.candidate_id == foreign(CandidatePreferredIndustry.candidate_id)",
+        order_by="CandidatePreferredIndustry.industry",
+        cascade="all, delete-orphan",
+        lazy="selectin"
+    )
+    _location_rows = relationship(
+        "CandidatePreferredLocation",
+        primaryjoin="CandidatePreferences.candidate_id == foreign(CandidatePreferredLocation.candidate_id)",
+        order_by="CandidatePreferredLocation.location",
+        cascade="all, delete-orphan",
+        lazy="selectin"
+    )
 
+    @property
+    def job_types(self):
+        return [row.job_type for row in self._job_type_rows]
 
-class CandidateNotificationSettings(BaseModel):
-    __tablename__ = "candidate_notification_settings"
+    @job_types.setter
+    def job_types(self, values):
+        existing = {row.job_type: row for row in self._job_type_rows}
+        self._job_type_rows = [
+            existing.get(value) or CandidatePreferredJobType(job_type=value)
+            for value in dict.fromkeys(values or [])
+        ]
 
-    candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidate_profiles.id"), nullable=False, unique=True)
-    email_alerts = Column(Boolean, default=True, nullable=False)
-    job_matches = Column(Boolean, default=True, nullable=False)
-    application_updates = Column(Boolean, default=True, nullable=False)
+    @property
+    def industries(self):
+        return [row.industry for row in self._industry_rows]
 
-    # Relationships
-    candidate = relationship("CandidateProfile", back_populates="notification_settings")
+    @industries.setter
+    def industries(self, values):
+        existing = {row.industry: row for row in self._industry_rows}
+        self._industry_rows = [
+            existing.get(value) or CandidatePreferredIndustry(industry=value)
+            for value in dict.fromkeys(values or [])
+        ]
+
+    @property
+    def locations(self):
+        return [row.location for row in self._location_rows]
+
+    @locations.setter
+    def locations(self, values):
+        existing = {row.location: row for row in self._location_rows}
+        self._location_rows = [
+            existing.get(value) or CandidatePreferredLocation(location=value)
+            for value in dict.fromkeys(values or [])
+        ]
+
+
+class CandidatePreferredJobType(BaseModel):
+    __tablename__ = "candidate_preferred_job_types"
+    __table_args__ = (
+        UniqueConstraint("candidate_id", "job_type", name="uq_cpjt_candidate_job_type"),
+        Index("ix_cpjt_job_type", "job_type", "candidate_id"),
+    )
+
+    candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidate_profiles.id"), nullable=False)
+    job_type = Column(String(100), nullable=False)
+
+    __repr__ = model_repr("CandidatePreferredJobType", "candidate_id", "job_type")
+
+
+class CandidatePreferredIndustry(BaseModel):
+    __tablename__ = "candidate_preferred_industries"
+    __table_args__ = (
+        UniqueConstraint("candidate_id", "industry", name="uq_cpi_candidate_industry"),
+        Index("ix_cpi_industry", "industry", "candidate_id"),
+    )
+
+    candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidate_profiles.id"), nullable=False)
+    industry = Column(String(200), nullable=False)
+
+    __repr__ = model_repr("CandidatePreferredIndustry", "candidate_id", "industry")
+
+
+class CandidatePreferredLocation(BaseModel):
+    __tablename__ = "candidate_preferred_locations"
+    __table_args__ = (
+        UniqueConstraint("candidate_id", "location", name="uq_cpl_candidate_location"),
+        Index("ix_cpl_location", "location", "candidate_id"),
+    )
+
+    candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidate_profiles.id"), nullable=False)
+    location = Column(String(200), nullable=False)
+
+    __repr__ = model_repr("CandidatePreferredLocation", "candidate_id", "location")
 
 
 class CandidateEducation(BaseModel):
@@ -110,8 +245,7 @@ class CandidateEducation(BaseModel):
     # Relationships
     candidate = relationship("CandidateProfile", back_populates="education_records")
 
-    def __repr__(self):
-        return f"<CandidateEducation(id={self.id}, degree={self.degree}, institution={self.institution})>"
+    __repr__ = model_repr("CandidateEducation", "id", "degree", "institution")
 
 
 class CandidateExperience(BaseModel):
@@ -128,21 +262,26 @@ class CandidateExperience(BaseModel):
     # Relationships
     candidate = relationship("CandidateProfile", back_populates="experience_records")
 
-    def __repr__(self):
-        return f"<CandidateExperience(id={self.id}, title={self.title}, company={self.company})>"
+    __repr__ = model_repr("CandidateExperience", "id", "title", "company")
 
 
 class CandidateSkill(BaseModel):
     __tablename__ = "candidate_skills"
+    __table_args__ = (
+        UniqueConstraint("candidate_id", "skill_id", name="uq_candidate_skills_candidate_skill"),
+        Index("ix_candidate_skills_skill", "skill_id", "candidate_id"),
+        CheckConstraint("proficiency_level BETWEEN 0 AND 3", name="ck_candidate_skills_proficiency_level"),
+        {"implicit_returning": False},
+    )
+    __mapper_args__ = {"eager_defaults": False}
 
     candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidate_profiles.id"), nullable=False)
     skill_id = Column(UUID(as_uuid=True), ForeignKey("skills.id"), nullable=False)
-    proficiency_level = Column(SQLEnum(ProficiencyLevel), nullable=True)
+    proficiency_level = Column(ProficiencyLevelType, nullable=True)  # Ordinal, so >= / ORDER BY work
     years_experience = Column(Integer, nullable=True)
 
     # Relationships
     candidate = relationship("CandidateProfile", back_populates="skills")
     skill = relationship("Skill", back_populates="candidate_skills")
 
-    def __repr__(self):
-        return f"<CandidateSkill(candidate_id={self.candidate_id}, skill_id={self.skill_id}, level={self.proficiency_level})>"
\ No newline at end of file
+    __repr__ = model_repr("CandidateSkill", "candidate_id", "skill_id", level="proficiency_level")
@@ -1,24 +1,28 @@
-from sqlalchemy import Column, String, Text, Boolean, Date, Integer, ForeignKey, ARRAY, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
-from app.models.base import BaseModel
+from sqlalchemy import Column, String, Text, Boolean, Date, Integer, ForeignKey, ARRAY, Index, DDL, event, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID, JSONB, CITEXT
+from sqlalchemy.orm import relationship, synonym
+from app.models.base import BaseModel, model_repr
 from app.models.enums import CompanySize
 
 
 class Company(BaseModel):
     __tablename__ = "companies"
+    __table_args__ = (
+        # CITEXT compares case-insensitively, so plain B-tree indexes serve lookups
+        Index("ix_companies_name", "name"),
+    )
 
-    name = Column(String, nullable=False)
+    name = Column(CITEXT, nullable=False)
     industry = Column(String, nullable=True)
     size = Column(SQLEnum(CompanySize), nullable=True)
-    company_size = Column(SQLEnum(CompanySize), nullable=True)  # Alias for backward compatibility
+    company_size = synonym("size")  # Alias for backward compatibility
     location = Column(String, nullable=True)
     description = Column(Text, nullable=True)
     website = Column(String, nullable=True)
     logo_url = Column(String, nullable=True)
     
     # Additional fields to match schema
-    email = Column(String, nullable=True)
+    email = Column(CITEXT, nullable=True)
     phone = Column(String, nullable=True)
     address = Column(String, nullable=True)
     city = Column(String, nullable=True)
@@ -43,8 +47,7 @@ class Company(BaseModel):
     jobs = relationship("Job", back_populates="company", cascade="all, delete-orphan")
     consultant_assignments = relationship("ConsultantClient", back_populates="company")
 
-    def __repr__(self):
-        return f"<Company(id={self.id}, name={self.name}, industry={self.industry})>"
+    __repr__ = model_repr("Company", "id", "name", "industry")
 
 
 class EmployerProfile(BaseModel):
@@ -70,25 +73,26 @@ class EmployerProfile(BaseModel):
     user = relationship("User", back_populates="employer_profiles")
     company = relationship("Company", back_populates="employer_profiles")
 
-    def __repr__(self):
-        return f"<EmployerProfile(id={self.id}, user_id={self.user_id}, company_id={self.company_id})>"
+    __repr__ = model_repr("EmployerProfile", "id", "user_id", "company_id")
 
 
 class CompanyContact(BaseModel):
     __tablename__ = "company_contacts"
+    __table_args__ = (
+        Index("ix_company_contacts_email", "email"),
+    )
 
     company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False)
-    name = Column(String, nullable=False)
+    name = Column(CITEXT, nullable=False)
     title = Column(String, nullable=True)
-    email = Column(String, nullable=False)
+    email = Column(CITEXT, nullable=False)
     phone = Column(String, nullable=True)
     is_primary = Column(Boolean, default=False, nullable=False)
 
     # Relationships
     company = relationship("Company", back_populates="contacts")
 
-    def __repr__(self):
-        return f"<CompanyContact(id={self.id}, name={self.name}, email={self.email})>"
+    __repr__ = model_repr("CompanyContact", "id", "name", "email")
 
 
 class CompanyHiringPreferences(BaseModel):
@@ -103,12 +107,16 @@ class CompanyHiringPreferences(BaseModel):
     # Relationships
     company = relationship("Company", back_populates="hiring_preferences")
 
-    def __repr__(self):
-        return f"<CompanyHiringPreferences(id={self.id}, company_id={self.company_id})>"
+    __repr__ = model_repr("CompanyHiringPreferences", "id", "company_id")
 
 
 class RecruitmentHistory(BaseModel):
     __tablename__ = "recruitment_history"
+    __table_args__ = (
+        # Rows are appended roughly in date_filled order, so a BRIN index
+        # serves range scans at a fraction of a B-tree's size
+        Index("ix_recruitment_history_date_filled_brin", "date_filled", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+    )
 
     company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False)
     job_title = Column(String, nullable=False)
@@ -120,5 +128,12 @@ class RecruitmentHistory(BaseModel):
     company = relationship("Company", back_populates="recruitment_history")
     consultant = relationship("ConsultantProfile", back_populates="recruitment_history")
 
-    def __repr__(self):
-        return f"<RecruitmentHistory(id={self.id}, job_title={self.job_title}, company_id={self.company_id})>"
\ No newline at end of file
+    __repr__ = model_repr("RecruitmentHistory", "id", "job_title", "company_id")
+
+
+# CITEXT columns above need the extension before create_all (init_db) emits them
+event.listen(
+    BaseModel.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS citext").execute_if(dialect="postgresql")
+)
@@ -1,34 +1,60 @@
-from sqlalchemy import Column, String, Text, Integer, Boolean, DECIMAL, ForeignKey, DateTime, Table
+from sqlalchemy import (
+    Column, String, Text, Integer, SmallInteger, Boolean, DECIMAL, ForeignKey, DateTime, Table, Index,
+    CheckConstraint, TypeDecorator, MetaData, DDL, event, text
+)
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
-from .base import BaseModel
-from .enums import ConsultantStatus
+from sqlalchemy.orm import relationship, deferred
+from .base import Base, BaseModel, model_repr
+from .enums import ConsultantStatus, CONSULTANT_STATUS_CODES
+
+
+_INT2MEMBER = {code: member for member, code in CONSULTANT_STATUS_CODES.items()}
+
+
+class ConsultantStatusType(TypeDecorator):
+    """Stores ConsultantStatus as a SMALLINT code and loads it back as the enum member"""
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, int):
+            return value
+        return ConsultantStatus(value).int_code
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return _INT2MEMBER[value]
 
 
 class ConsultantProfile(BaseModel):
     __tablename__ = "consultant_profiles"
+    __table_args__ = (
+        # jsonb_path_ops GIN indexes back the @> containment filters in crud.consultant
+        Index("ix_consultant_specializations_gin", "specializations", postgresql_using="gin", postgresql_ops={"specializations": "jsonb_path_ops"}),
+        Index("ix_consultant_certifications_gin", "certifications", postgresql_using="gin", postgresql_ops={"certifications": "jsonb_path_ops"}),
+        CheckConstraint("status IN (0, 1, 2, 3)", name="ck_consultant_profiles_status"),
+    )
     
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, unique=True)
     employee_id = Column(String(50), nullable=True, unique=True)
     department = Column(String(100), nullable=True)
     position = Column(String(100), nullable=True)
-    status = Column(String(20), nullable=False, default=ConsultantStatus.ACTIVE)
+    status = Column(ConsultantStatusType, nullable=False, default=ConsultantStatus.ACTIVE)
     
     # Experience and skills
     years_of_experience = Column(Integer, nullable=True)
     specializations = Column(JSONB, nullable=True)  # Array of specialization areas
     certifications = Column(JSONB, nullable=True)  # Array of certification objects
     
-    # Performance metrics
-    total_placements = Column(Integer, nullable=False, default=0)
-    successful_placements = Column(Integer, nullable=False, default=0)
+    # Performance metrics - placement counters live in consultant_stats_mv
     average_rating = Column(DECIMAL(3, 2), nullable=True)
     total_revenue_generated = Column(DECIMAL(15, 2), nullable=True)
     
     # Contact and availability
     phone_number = Column(String(20), nullable=True)
     availability_status = Column(String(20), nullable=True)  # available, busy, unavailable
-    working_hours = Column(JSONB, nullable=True)  # Schedule object
+    working_hours = deferred(Column(JSONB, nullable=True), group="heavy")  # Schedule object
     
     # Assignment preferences
     preferred_job_types = Column(JSONB, nullable=True)  # Array of job types
@@ -36,8 +62,6 @@ class ConsultantProfile(BaseModel):
     max_concurrent_assignments = Column(Integer, nullable=True, default=10)
     
     # Performance tracking
-    current_active_jobs = Column(Integer, nullable=False, default=0)
-    this_month_placements = Column(Integer, nullable=False, default=0)
     this_quarter_revenue = Column(DECIMAL(15, 2), nullable=True)
     
     # Administrative fields
@@ -46,9 +70,9 @@ class ConsultantProfile(BaseModel):
     next_performance_review = Column(DateTime, nullable=True)
     manager_id = Column(UUID(as_uuid=True), ForeignKey("consultant_profiles.id"), nullable=True)
     
-    # Notes and comments
-    notes = Column(Text, nullable=True)
-    admin_notes = Column(Text, nullable=True)  # Internal notes for admins
+    # Notes and comments - deferred, only loaded on access or undefer_group("heavy")
+    notes = deferred(Column(Text, nullable=True), group="heavy")
+    admin_notes = deferred(Column(Text, nullable=True), group="heavy")  # Internal notes for admins
     
     # Relationships
     user = relationship("User", back_populates="consultant_profile")
@@ -69,6 +93,104 @@ class ConsultantProfile(BaseModel):
     # Application notes
     application_notes = relationship("ApplicationNote", back_populates="consultant")
 
+    # Targets and reviews - loaded per query, e.g. selectinload in get_with_details
+    targets = relationship("ConsultantTarget", back_populates="consultant")
+    performance_reviews = relationship("ConsultantPerformanceReview", back_populates="consultant")
+
+    # Pre-aggregated dashboard counters (read-only, see ConsultantStats)
+    stats = relationship(
+        "ConsultantStats",
+        primaryjoin="foreign(ConsultantStats.consultant_id) == ConsultantProfile.id",
+        uselist=False,
+        viewonly=True,
+        lazy="joined"
+    )
+
+    @property
+    def total_placements(self) -> int:
+        return self.stats.total_placements if self.stats else 0
+
+    @property
+    def successful_placements(self) -> int:
+        return self.stats.successful_placements if self.stats else 0
+
+    @property
+    def current_active_jobs(self) -> int:
+        return self.stats.current_active_jobs if self.stats else 0
+
+    @property
+    def this_month_placements(self) -> int:
+        return self.stats.this_month_placements if self.stats else 0
+
+
+# Materialized view backing the consultant dashboard counters. Refreshed
+# out of band by crud.consultant.refresh_stats so that application and
+# assignment writes never touch the consultant_profiles row.
+CONSULTANT_STATS_MV_SELECT = """
+SELECT cp.id AS consultant_id,
+       COALESCE(a.total_placements, 0) AS total_placements,
+       COALESCE(a.total_placements, 0) AS successful_placements,
+       COALESCE(a.this_month_placements, 0) AS this_month_placements,
+       COALESCE(cc.active, 0) + COALESCE(cl.active, 0) AS current_active_jobs
+FROM consultant_profiles cp
+LEFT JOIN (
+    SELECT consultant_id,
+           COUNT(*) AS total_placements,
+           COUNT(*) FILTER (
+               WHERE COALESCE(last_updated, applied_at) >= date_trunc('month', now())
+           ) AS this_month_placements
+    FROM applications
+    WHERE status = 'HIRED' AND consultant_id IS NOT NULL
+    GROUP BY consultant_id
+) a ON a.consultant_id = cp.id
+LEFT JOIN (
+    SELECT consultant_id, COUNT(*) AS active
+    FROM consultant_candidates
+    WHERE is_active
+    GROUP BY consultant_id
+) cc ON cc.consultant_id = cp.id
+LEFT JOIN (
+    SELECT consultant_id, COUNT(*) AS active
+    FROM consultant_clients
+    WHERE is_active
+    GROUP BY consultant_id
+) cl ON cl.consultant_id = cp.id
+"""
+
+# Kept out of BaseModel.metadata so create_all / autogenerate never emit it as a table
+consultant_stats_mv = Table(
+    "consultant_stats_mv",
+    MetaData(),
+    Column("consultant_id", UUID(as_uuid=True), primary_key=True),
+    Column("total_placements", Integer, nullable=False),
+    Column("successful_placements", Integer, nullable=False),
+    Column("this_month_placements", Integer, nullable=False),
+    Column("current_active_jobs", Integer, nullable=False),
+)
+
+
+class ConsultantStats(Base):
+    """Read-only mapping of consultant_stats_mv"""
+    __table__ = consultant_stats_mv
+
+    __repr__ = model_repr("ConsultantStats", "consultant_id", "total_placements")
+
+
+# create_all / drop_all (init_db) manage the view alongside the tables it reads
+event.listen(
+    BaseModel.metadata,
+    "after_create",
+    DDL(
+        f"CREATE MATERIALIZED VIEW IF NOT EXISTS consultant_stats_mv AS {CONSULTANT_STATS_MV_SELECT}; "
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_consultant_stats_mv_consultant ON consultant_stats_mv (consultant_id)"
+    ).execute_if(dialect="postgresql")
+)
+event.listen(
+    BaseModel.metadata,
+    "before_drop",
+    DDL("DROP MATERIALIZED VIEW IF EXISTS consultant_stats_mv").execute_if(dialect="postgresql")
+)
+
 
 # Association table for consultant skills (many-to-many)
 consultant_skills = Table(
@@ -77,7 +199,8 @@ consultant_skills = Table(
     Column('consultant_id', UUID(as_uuid=True), ForeignKey('consultant_profiles.id'), primary_key=True),
     Column('skill_id', UUID(as_uuid=True), ForeignKey('skills.id'), primary_key=True),
     Column('proficiency_level', String(20), nullable=True),  # beginner, intermediate, advanced, expert
-    Column('years_experience', Integer, nullable=True)
+    Column('years_experience', Integer, nullable=True),
+    implicit_returning=False
 )
 
 
@@ -105,7 +228,7 @@ class ConsultantTarget(BaseModel):
     notes = Column(Text, nullable=True)
     
     # Relationships
-    consultant = relationship("ConsultantProfile", backref="targets")
+    consultant = relationship("ConsultantProfile", back_populates="targets")
 
 
 class ConsultantPerformanceReview(BaseModel):
@@ -135,13 +258,15 @@ class ConsultantPerformanceReview(BaseModel):
     status = Column(String(20), nullable=False, default="draft")  # draft, completed, approved
     
     # Relationships
-    consultant = relationship("ConsultantProfile", backref="performance_reviews")
+    consultant = relationship("ConsultantProfile", back_populates="performance_reviews")
     reviewer = relationship("User", foreign_keys=[reviewer_id])
 
 
 class ConsultantCandidate(BaseModel):
     """Association table for consultant-candidate assignments"""
     __tablename__ = "consultant_candidates"
+    __table_args__ = {"implicit_returning": False}
+    __mapper_args__ = {"eager_defaults": False}
     
     consultant_id = Column(UUID(as_uuid=True), ForeignKey("consultant_profiles.id"), nullable=False)
     candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidate_profiles.id"), nullable=False)
@@ -168,6 +293,11 @@ class ConsultantCandidate(BaseModel):
 class ConsultantClient(BaseModel):
     """Association table for consultant-company client assignments"""
     __tablename__ = "consultant_clients"
+    __table_args__ = (
+        Index("ix_cc_consultant_active", "consultant_id", postgresql_where=text("is_active")),
+        {"implicit_returning": False},
+    )
+    __mapper_args__ = {"eager_defaults": False}
     
     consultant_id = Column(UUID(as_uuid=True), ForeignKey("consultant_profiles.id"), nullable=False)
     company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False)
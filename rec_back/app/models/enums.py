@@ -1,4 +1,5 @@
 import enum
+from types import MappingProxyType
 
 
 class ContractType(str, enum.Enum):
@@ -15,6 +16,20 @@ class ProficiencyLevel(str, enum.Enum):
     ADVANCED = "Advanced"
     EXPERT = "Expert"
 
+    @property
+    def int_code(self) -> int:
+        """SMALLINT ordinal stored in candidate_skills.proficiency_level"""
+        return PROFICIENCY_LEVEL_CODES[self]
+
+
+# Ordered storage codes - comparisons rely on the ordering, never renumber
+PROFICIENCY_LEVEL_CODES = {
+    ProficiencyLevel.BEGINNER: 0,
+    ProficiencyLevel.INTERMEDIATE: 1,
+    ProficiencyLevel.ADVANCED: 2,
+    ProficiencyLevel.EXPERT: 3,
+}
+
 
 class JobStatus(str, enum.Enum):
     DRAFT = "draft"
@@ -110,6 +125,20 @@ class ConsultantStatus(str, enum.Enum):
     ON_LEAVE = "on_leave"
     SUSPENDED = "suspended"
 
+    @property
+    def int_code(self) -> int:
+        """SMALLINT code stored in consultant_profiles.status"""
+        return CONSULTANT_STATUS_CODES[self]
+
+
+# Stable storage codes - never renumber, only append
+CONSULTANT_STATUS_CODES = {
+    ConsultantStatus.ACTIVE: 0,
+    ConsultantStatus.INACTIVE: 1,
+    ConsultantStatus.ON_LEAVE: 2,
+    ConsultantStatus.SUSPENDED: 3,
+}
+
 
 # Messaging related enums
 class MessageType(str, enum.Enum):
@@ -131,4 +160,19 @@ class ConversationType(str, enum.Enum):
     DIRECT = "direct"
     GROUP = "group"
     BROADCAST = "broadcast"
-    SYSTEM = "system"
\ No newline at end of file
+    SYSTEM = "system"
+
+
+# Read-only value -> member maps, built once at import so hot paths can
+# resolve raw strings with a dict get instead of going through Enum.__call__
+def _intern_values(*enums):
+    for enum_cls in enums:
+        enum_cls._vmap = MappingProxyType({m.value: m for m in enum_cls})
+
+
+_intern_values(
+    ContractType, ProficiencyLevel, JobStatus, JobType, ExperienceLevel,
+    UserRole, OfficeId, ApplicationStatus, CompanySize, AdminStatus,
+    AdminRole, PermissionLevel, ConsultantStatus, MessageType,
+    MessageStatus, ConversationType,
+)
@@ -1,12 +1,31 @@
-from sqlalchemy import Column, String, Text, Integer, Date, DateTime, Boolean, ForeignKey, Enum as SQLEnum, func
+from sqlalchemy import Column, String, Text, Integer, SmallInteger, Date, DateTime, Boolean, ForeignKey, Index, Enum as SQLEnum, func, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from app.models.base import BaseModel
+from app.models.base import BaseModel, model_repr, flag_property
 from app.models.enums import ContractType, JobStatus, ProficiencyLevel, JobType, ExperienceLevel
 
 
+# Job.flags bits - never renumber, only append
+JOB_FLAG_REMOTE = 0x1
+JOB_FLAG_HYBRID = 0x2
+JOB_FLAG_REQUIRES_COVER_LETTER = 0x4
+JOB_FLAG_FEATURED = 0x8
+
+
 class Job(BaseModel):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # SQLEnum persists member names, hence the upper-case literals below
+        Index("ix_jobs_company_status_posted", "company_id", "status", "posting_date"),
+        Index("ix_jobs_open", "posting_date", postgresql_where=text("status = 'OPEN'")),
+        Index("ix_jobs_consultant_active", "assigned_consultant_id", postgresql_where=text("status IN ('OPEN', 'DRAFT')")),
+        # jsonb_path_ops GIN indexes back the @> containment filters
+        Index("ix_jobs_benefits_gin", "benefits", postgresql_using="gin", postgresql_ops={"benefits": "jsonb_path_ops"}),
+        Index("ix_jobs_requirements_gin", "requirements", postgresql_using="gin", postgresql_ops={"requirements": "jsonb_path_ops"}),
+        Index("ix_jobs_responsibilities_gin", "responsibilities", postgresql_using="gin", postgresql_ops={"responsibilities": "jsonb_path_ops"}),
+        # Append-only timestamp: BRIN for posted_after/posted_before ranges
+        Index("ix_jobs_created_at_brin", "created_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+    )
 
     company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False)
     posted_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -24,10 +43,13 @@ class Job(BaseModel):
     job_type = Column(SQLEnum(JobType), nullable=True)
     experience_level = Column(SQLEnum(ExperienceLevel), nullable=True)
     
+    # Boolean attributes packed into one SMALLINT, see JOB_FLAG_*
+    flags = Column(SmallInteger, default=0, server_default=text("0"), nullable=False)
+    
     # Remote work
-    remote_option = Column(Boolean, default=False, nullable=False)  # Kept for backward compatibility
-    is_remote = Column(Boolean, default=False, nullable=False)  # Alias for CRUD compatibility
-    is_hybrid = Column(Boolean, default=False, nullable=False)  # Hybrid work arrangement
+    remote_option = flag_property(JOB_FLAG_REMOTE)  # Kept for backward compatibility
+    is_remote = remote_option  # Alias for CRUD compatibility
+    is_hybrid = flag_property(JOB_FLAG_HYBRID)  # Hybrid work arrangement
     
     # Salary
     salary_min = Column(Integer, nullable=True)
@@ -42,11 +64,11 @@ class Job(BaseModel):
     # Additional details
     benefits = Column(JSONB, nullable=True)  # Array of benefits
     company_culture = Column(Text, nullable=True)
-    requires_cover_letter = Column(Boolean, default=False, nullable=False)
+    requires_cover_letter = flag_property(JOB_FLAG_REQUIRES_COVER_LETTER)
     internal_notes = Column(Text, nullable=True)
     
     # Visibility and metrics
-    is_featured = Column(Boolean, default=False, nullable=False)
+    is_featured = flag_property(JOB_FLAG_FEATURED)
     view_count = Column(Integer, default=0, nullable=False)
     application_count = Column(Integer, default=0, nullable=False)
 
@@ -67,12 +89,13 @@ class Job(BaseModel):
             return f"Up to £{self.salary_max:,}"
         return "Salary not specified"
 
-    def __repr__(self):
-        return f"<Job(id={self.id}, title={self.title}, company_id={self.company_id}, status={self.status})>"
+    __repr__ = model_repr("Job", "id", "title", "company_id", "status")
 
 
 class JobSkillRequirement(BaseModel):
     __tablename__ = "job_skills"
+    __table_args__ = {"implicit_returning": False}
+    __mapper_args__ = {"eager_defaults": False}
 
     job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id"), nullable=False)
     skill_id = Column(UUID(as_uuid=True), ForeignKey("skills.id"), nullable=False)
@@ -84,5 +107,4 @@ class JobSkillRequirement(BaseModel):
     job = relationship("Job", back_populates="skill_requirements")
     skill = relationship("Skill", back_populates="job_skills")
 
-    def __repr__(self):
-        return f"<JobSkillRequirement(job_id={self.job_id}, skill_id={self.skill_id}, required={self.is_required})>"
\ No newline at end of file
+    __repr__ = model_repr("JobSkillRequirement", "job_id", "skill_id", required="is_required")
@@ -1,26 +1,42 @@
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Table, Integer
+from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Table, Integer, Index, UniqueConstraint, Computed, DDL, FetchedValue, event, func, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from .base import BaseModel
 from .enums import MessageType, MessageStatus, ConversationType
 
 
+def _jsonb_array_length_sql(column: str) -> str:
+    """Immutable SQL expression for the length of a JSONB array column (0 if NULL or not an array)"""
+    return f"CASE WHEN jsonb_typeof({column}) = 'array' THEN jsonb_array_length({column}) ELSE 0 END"
+
+
+# Server-side default for the naive UTC timestamp columns, so inserts
+# (including executemany batches) never carry a Python-side clock value
+UTC_NOW = func.timezone('utc', func.now())
+
 # Association table for conversation participants (many-to-many)
 conversation_participants = Table(
     'conversation_participants',
     BaseModel.metadata,
     Column('conversation_id', UUID(as_uuid=True), ForeignKey('conversations.id'), primary_key=True),
     Column('user_id', UUID(as_uuid=True), ForeignKey('users.id'), primary_key=True),
-    Column('joined_at', DateTime, nullable=False),
+    Column('joined_at', DateTime, nullable=False, server_default=UTC_NOW),
     Column('left_at', DateTime, nullable=True),
     Column('role', String(20), nullable=True),  # admin, member, observer
     Column('is_muted', Boolean, nullable=False, default=False),
-    Column('last_read_at', DateTime, nullable=True)
+    Column('last_read_at', DateTime, nullable=True),
+    # The PK covers lookups by conversation; these cover "my conversations" and unread checks
+    Index('ix_conv_part_user', 'user_id'),
+    Index('ix_conv_part_conv_last_read', 'conversation_id', 'last_read_at')
 )
 
 
 class Conversation(BaseModel):
     __tablename__ = "conversations"
+    __table_args__ = (
+        # jsonb_path_ops GIN indexes back the @> containment filters
+        Index("ix_conversations_tags_gin", "tags", postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}),
+    )
     
     title = Column(String(200), nullable=True)
     type = Column(String(20), nullable=False, default=ConversationType.DIRECT)
@@ -37,30 +53,49 @@ class Conversation(BaseModel):
     tags = Column(JSONB, nullable=True)  # Array of tags for categorization
     
     # Statistics
+    # Maintained by the maintain_conversation_counters trigger on messages
     total_messages = Column(Integer, nullable=False, default=0)
     last_message_at = Column(DateTime, nullable=True)
-    last_activity_at = Column(DateTime, nullable=True)
+    last_activity_at = Column(DateTime, nullable=True, server_default=UTC_NOW)
     
     # Relationships
     created_by = relationship("User", foreign_keys=[created_by_id])
-    participants = relationship("User", secondary=conversation_participants, backref="conversations")
-    messages = relationship("Message", back_populates="conversation", cascade="all, delete-orphan")
+    # Default selectin keeps a second, batched SELECT. A page query that already
+    # joins conversation_participants should use contains_eager on its own JOIN
+    # (see crud.messaging.get_user_conversations); adding joinedload on top
+    # would join the table twice and multiply the rows
+    participants = relationship("User", secondary=conversation_participants, back_populates="conversations", lazy="selectin")
+    messages = relationship(
+        "Message",
+        back_populates="conversation",
+        cascade="all, delete-orphan",
+        order_by="desc(Message.created_at)"
+    )
 
 
 class Message(BaseModel):
     __tablename__ = "messages"
+    __table_args__ = (
+        # jsonb_path_ops GIN indexes back the @> containment filters
+        Index("ix_messages_mentions_gin", "mentions", postgresql_using="gin", postgresql_ops={"mentions": "jsonb_path_ops"}),
+        # Conversation timeline (live messages, newest first) and per-sender history
+        Index("ix_messages_conv_sent_active", "conversation_id", "sent_at", postgresql_where=text("is_deleted = false")),
+        Index("ix_messages_sender_sent", "sender_id", "sent_at"),
+    )
     
     conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id"), nullable=False)
     sender_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     
     # Message content
     content = Column(Text, nullable=True)
-    message_type = Column(String(20), nullable=False, default=MessageType.TEXT)
+    message_type = Column(String(20), nullable=False, default=MessageType.TEXT, index=True)
     status = Column(String(20), nullable=False, default=MessageStatus.SENT)
     
     # Reply functionality
-    parent_message_id = Column(UUID(as_uuid=True), ForeignKey("messages.id"), nullable=True)
     reply_to_id = Column(UUID(as_uuid=True), ForeignKey("messages.id"), nullable=True)
+    # First message of the thread (itself for a top-level message); filled in
+    # by the set_message_thread_root trigger so a thread is one index scan
+    thread_root_id = Column(UUID(as_uuid=True), nullable=True, index=True, server_default=FetchedValue())
     
     # Message properties
     is_edited = Column(Boolean, nullable=False, default=False)
@@ -69,59 +104,74 @@ class Message(BaseModel):
     is_system_message = Column(Boolean, nullable=False, default=False)
     
     # Delivery tracking
-    sent_at = Column(DateTime, nullable=True)
+    sent_at = Column(DateTime, nullable=True, server_default=UTC_NOW)
     delivered_at = Column(DateTime, nullable=True)
     read_at = Column(DateTime, nullable=True)
     
     # Metadata
     mentions = Column(JSONB, nullable=True)  # Array of mentioned user IDs
-    reactions = Column(JSONB, nullable=True)  # Emoji reactions
-    
-    # File/media info (if message_type is file/image)
-    file_url = Column(String(500), nullable=True)
-    file_name = Column(String(200), nullable=True)
-    file_size = Column(Integer, nullable=True)
-    file_type = Column(String(50), nullable=True)
-    thumbnail_url = Column(String(500), nullable=True)
-    
-    # Template info (if message_type is template)
-    template_id = Column(UUID(as_uuid=True), ForeignKey("email_templates.id"), nullable=True)
-    template_variables = Column(JSONB, nullable=True)
+    # Stored generated count, so aggregates and filters skip the JSONB
+    mention_count = Column(Integer, Computed(_jsonb_array_length_sql("mentions"), persisted=True), nullable=False, index=True)
+    # Reactions live only in message_reactions (see MessageReaction)
+
+    # File/media and template info live in 1-1 side tables (MessageFileMeta,
+    # MessageTemplateBinding) so text-message rows stay narrow
     
     # Relationships - Fixed with proper foreign_keys specification
+    # Loader strategies are tuned for rendering a conversation: many-to-ones
+    # ride along in the driving SELECT, collections load with one IN query each
     conversation = relationship("Conversation", back_populates="messages")
-    sender = relationship("User", foreign_keys=[sender_id])
-    
-    # Parent-child relationships with explicit foreign_keys
-    parent_message = relationship(
-        "Message", 
-        remote_side="Message.id", 
-        foreign_keys=[parent_message_id],
-        back_populates="child_messages"
-    )
-    child_messages = relationship(
-        "Message", 
-        foreign_keys=[parent_message_id],
-        back_populates="parent_message"
-    )
+    sender = relationship("User", foreign_keys=[sender_id], lazy="joined")
     
     # Reply relationships with explicit foreign_keys
     reply_to = relationship(
         "Message", 
         remote_side="Message.id", 
         foreign_keys=[reply_to_id],
-        back_populates="replies"
+        back_populates="replies",
+        lazy="joined",
+        join_depth=1
     )
     replies = relationship(
         "Message", 
         foreign_keys=[reply_to_id],
-        back_populates="reply_to"
+        back_populates="reply_to",
+        lazy="selectin"
     )
     
-    template = relationship("EmailTemplate", foreign_keys=[template_id])
-    attachments = relationship("MessageAttachment", back_populates="message", cascade="all, delete-orphan")
-    read_receipts = relationship("MessageReadReceipt", back_populates="message", cascade="all, delete-orphan")
-    message_reactions = relationship("MessageReaction", back_populates="message", cascade="all, delete-orphan")
+    file_meta = relationship("MessageFileMeta", back_populates="message", uselist=False, cascade="all, delete-orphan", lazy="joined")
+    template_binding = relationship("MessageTemplateBinding", back_populates="message", uselist=False, cascade="all, delete-orphan", lazy="joined")
+    attachments = relationship("MessageAttachment", back_populates="message", cascade="all, delete-orphan", lazy="selectin")
+    read_receipts = relationship("MessageReadReceipt", back_populates="message", cascade="all, delete-orphan", lazy="selectin")
+    message_reactions = relationship("MessageReaction", back_populates="message", cascade="all, delete-orphan", lazy="selectin")
+
+
+class MessageFileMeta(BaseModel):
+    __tablename__ = "message_file_meta"
+    
+    # Only present when message_type is file/image
+    message_id = Column(UUID(as_uuid=True), ForeignKey("messages.id"), nullable=False, unique=True)
+    file_url = Column(String(500), nullable=True)
+    file_name = Column(String(200), nullable=True)
+    file_size = Column(Integer, nullable=True)
+    file_type = Column(String(50), nullable=True)
+    thumbnail_url = Column(String(500), nullable=True)
+    
+    # Relationships
+    message = relationship("Message", back_populates="file_meta")
+
+
+class MessageTemplateBinding(BaseModel):
+    __tablename__ = "message_template_bindings"
+    
+    # Only present when message_type is template
+    message_id = Column(UUID(as_uuid=True), ForeignKey("messages.id"), nullable=False, unique=True)
+    template_id = Column(UUID(as_uuid=True), ForeignKey("email_templates.id"), nullable=True, index=True)
+    template_variables = Column(JSONB, nullable=True)
+    
+    # Relationships
+    message = relationship("Message", back_populates="template_binding")
+    template = relationship("EmailTemplate", back_populates="message_bindings")
 
 
 class MessageAttachment(BaseModel):
@@ -154,15 +204,21 @@ class MessageReadReceipt(BaseModel):
     
     message_id = Column(UUID(as_uuid=True), ForeignKey("messages.id"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    read_at = Column(DateTime, nullable=False)
+    read_at = Column(DateTime, nullable=False, server_default=UTC_NOW)
     
     # Relationships
     message = relationship("Message", back_populates="read_receipts")
-    user = relationship("User", backref="message_read_receipts")
+    user = relationship("User", back_populates="message_read_receipts")
 
 
 class MessageReaction(BaseModel):
     __tablename__ = "message_reactions"
+    __table_args__ = (
+        # Per-message emoji tallies are index-only scans on (message_id, emoji)
+        Index("ix_reactions_msg_emoji", "message_id", "emoji"),
+        Index("ix_reactions_user", "user_id"),
+        UniqueConstraint("message_id", "user_id", "emoji", name="uq_message_reactions_message_user_emoji"),
+    )
     
     message_id = Column(UUID(as_uuid=True), ForeignKey("messages.id"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -170,11 +226,16 @@ class MessageReaction(BaseModel):
     
     # Relationships
     message = relationship("Message", back_populates="message_reactions")
-    user = relationship("User", backref="reactions")
+    user = relationship("User", back_populates="reactions")
 
 
 class EmailTemplate(BaseModel):
     __tablename__ = "email_templates"
+    __table_args__ = (
+        # jsonb_path_ops GIN indexes back the @> containment filters
+        Index("ix_email_templates_tags_gin", "tags", postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}),
+        Index("ix_email_templates_variables_gin", "variables", postgresql_using="gin", postgresql_ops={"variables": "jsonb_path_ops"}),
+    )
     
     name = Column(String(100), nullable=False)
     subject = Column(String(200), nullable=False)
@@ -209,4 +270,70 @@ class EmailTemplate(BaseModel):
     
     # Relationships
     created_by = relationship("User", foreign_keys=[created_by_id])
-    messages = relationship("Message", back_populates="template")
\ No newline at end of file
+    message_bindings = relationship("MessageTemplateBinding", back_populates="template")
+
+
+# Inherit the replied-to message's thread root, or start a new thread
+SET_MESSAGE_THREAD_ROOT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_message_thread_root() RETURNS trigger AS $$
+BEGIN
+    IF NEW.thread_root_id IS NULL THEN
+        NEW.thread_root_id = COALESCE(
+            (SELECT thread_root_id FROM messages WHERE id = NEW.reply_to_id),
+            NEW.id
+        );
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+event.listen(
+    Message.__table__,
+    "after_create",
+    DDL(SET_MESSAGE_THREAD_ROOT_FUNCTION).execute_if(dialect="postgresql")
+)
+event.listen(
+    Message.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER set_message_thread_root BEFORE INSERT ON messages "
+        "FOR EACH ROW EXECUTE FUNCTION set_message_thread_root()"
+    ).execute_if(dialect="postgresql")
+)
+
+
+# Keep Conversation.total_messages / last_message_at in step with messages,
+# without an extra application round-trip per send
+MAINTAIN_CONVERSATION_COUNTERS_FUNCTION = """
+CREATE OR REPLACE FUNCTION maintain_conversation_counters() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE conversations
+        SET total_messages = total_messages + 1,
+            last_message_at = COALESCE(NEW.sent_at, timezone('utc', now())),
+            last_activity_at = COALESCE(NEW.sent_at, timezone('utc', now()))
+        WHERE id = NEW.conversation_id;
+    ELSE
+        UPDATE conversations
+        SET total_messages = total_messages - 1
+        WHERE id = OLD.conversation_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+event.listen(
+    Message.__table__,
+    "after_create",
+    DDL(MAINTAIN_CONVERSATION_COUNTERS_FUNCTION).execute_if(dialect="postgresql")
+)
+event.listen(
+    Message.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER maintain_conversation_counters AFTER INSERT OR DELETE ON messages "
+        "FOR EACH ROW EXECUTE FUNCTION maintain_conversation_counters()"
+    ).execute_if(dialect="postgresql")
+)
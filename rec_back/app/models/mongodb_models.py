@@ -1,24 +1,41 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any, Union
 from uuid import UUID, uuid4
 from beanie import Document, Link
-from pydantic import Field, EmailStr, ConfigDict
+from pydantic import Field, EmailStr, ConfigDict, field_serializer
+from pymongo import IndexModel, ASCENDING, DESCENDING
+
+
+# Unique indexes only cover live documents, so soft-deleted ones never conflict
+LIVE_DOCUMENTS = {"is_active": True}
+
+
+def utc_now() -> datetime:
+    """Timezone-aware replacement for the deprecated datetime.utcnow()"""
+    return datetime.now(timezone.utc)
 
 
 class BaseDocument(Document):
     """Base document with common fields for all collections."""
     id: UUID = Field(default_factory=uuid4)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
     is_active: bool = Field(default=True)
     deleted_at: Optional[datetime] = None
-    
-    def dict(self, *args, **kwargs):
-        """Convert to dict with string IDs."""
-        d = super().dict(*args, **kwargs)
-        if "id" in d:
-            d["id"] = str(d["id"])
-        return d
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
+
+    @field_serializer("id")
+    def _serialize_id(self, value: UUID) -> str:
+        """Dump IDs as strings (Beanie encodes documents for Mongo without this)."""
+        return str(value)
+
+    @classmethod
+    async def bulk_create(cls, docs: List["BaseDocument"], chunk_size: int = 1000) -> int:
+        """Insert documents with one unordered insert_many round-trip per chunk."""
+        for start in range(0, len(docs), chunk_size):
+            await cls.insert_many(docs[start:start + chunk_size], ordered=False)
+        return len(docs)
     
     class Settings:
         use_state_management = True
@@ -38,9 +55,13 @@ class UserDocument(BaseDocument):
     class Settings:
         name = "users"
         indexes = [
-            "email",
-            "role",
-            ("email", "role", {"unique": True})
+            IndexModel(
+                [("email", ASCENDING)],
+                unique=True,
+                partialFilterExpression=LIVE_DOCUMENTS,
+                collation={"locale": "en", "strength": 2}
+            ),
+            IndexModel([("role", ASCENDING)])
         ]
 
 
@@ -53,8 +74,8 @@ class SkillDocument(BaseDocument):
     class Settings:
         name = "skills"
         indexes = [
-            "name",
-            "category"
+            IndexModel([("name", ASCENDING)]),
+            IndexModel([("category", ASCENDING)])
         ]
 
 
@@ -68,9 +89,9 @@ class CandidateSkillDocument(BaseDocument):
     class Settings:
         name = "candidate_skills"
         indexes = [
-            "candidate_id",
-            "skill_id",
-            ("candidate_id", "skill_id", {"unique": True})
+            IndexModel([("candidate_id", ASCENDING)]),
+            IndexModel([("skill_id", ASCENDING)]),
+            IndexModel([("candidate_id", ASCENDING), ("skill_id", ASCENDING)], unique=True, partialFilterExpression=LIVE_DOCUMENTS)
         ]
 
 
@@ -87,7 +108,7 @@ class EducationDocument(BaseDocument):
     class Settings:
         name = "education"
         indexes = [
-            "candidate_id"
+            IndexModel([("candidate_id", ASCENDING)])
         ]
 
 
@@ -104,7 +125,7 @@ class ExperienceDocument(BaseDocument):
     class Settings:
         name = "experience"
         indexes = [
-            "candidate_id"
+            IndexModel([("candidate_id", ASCENDING)])
         ]
 
 
@@ -155,11 +176,11 @@ class CandidateDocument(BaseDocument):
     class Settings:
         name = "candidates"
         indexes = [
-            "user_id",
-            "current_position",
-            "years_of_experience",
-            "country",
-            "city"
+            IndexModel([("user_id", ASCENDING)]),
+            IndexModel([("current_position", ASCENDING)]),
+            IndexModel([("years_of_experience", ASCENDING)]),
+            IndexModel([("country", ASCENDING)]),
+            IndexModel([("city", ASCENDING)])
         ]
 
 
@@ -177,9 +198,9 @@ class CompanyDocument(BaseDocument):
     class Settings:
         name = "companies"
         indexes = [
-            "name",
-            "industry",
-            "location"
+            IndexModel([("name", ASCENDING)]),
+            IndexModel([("industry", ASCENDING)]),
+            IndexModel([("location", ASCENDING)])
         ]
 
 
@@ -194,9 +215,9 @@ class JobSkillDocument(BaseDocument):
     class Settings:
         name = "job_skills"
         indexes = [
-            "job_id",
-            "skill_id",
-            ("job_id", "skill_id", {"unique": True})
+            IndexModel([("job_id", ASCENDING)]),
+            IndexModel([("skill_id", ASCENDING)]),
+            IndexModel([("job_id", ASCENDING), ("skill_id", ASCENDING)], unique=True, partialFilterExpression=LIVE_DOCUMENTS)
         ]
 
 
@@ -247,13 +268,13 @@ class JobDocument(BaseDocument):
     class Settings:
         name = "jobs"
         indexes = [
-            "company_id",
-            "title",
-            "location",
-            "status",
-            "posting_date",
-            "experience_level",
-            "is_remote"
+            IndexModel([("company_id", ASCENDING)]),
+            IndexModel([("title", ASCENDING)]),
+            IndexModel([("location", ASCENDING)]),
+            IndexModel([("status", ASCENDING)]),
+            IndexModel([("posting_date", ASCENDING)]),
+            IndexModel([("experience_level", ASCENDING)]),
+            IndexModel([("is_remote", ASCENDING)])
         ]
 
 
@@ -262,7 +283,7 @@ class ApplicationDocument(BaseDocument):
     job_id: UUID
     candidate_id: UUID
     status: str = "submitted"  # "submitted", "under_review", "interviewed", "offered", "hired", "rejected", "withdrawn"
-    application_date: datetime = Field(default_factory=datetime.utcnow)
+    application_date: datetime = Field(default_factory=utc_now)
     resume_url: Optional[str] = None
     cover_letter_text: Optional[str] = None
     notes: Optional[str] = None
@@ -271,11 +292,11 @@ class ApplicationDocument(BaseDocument):
     class Settings:
         name = "applications"
         indexes = [
-            "job_id",
-            "candidate_id",
-            "status",
-            "application_date",
-            ("job_id", "candidate_id", {"unique": True})
+            IndexModel([("job_id", ASCENDING)]),
+            IndexModel([("candidate_id", ASCENDING)]),
+            IndexModel([("status", ASCENDING)]),
+            IndexModel([("application_date", ASCENDING)]),
+            IndexModel([("job_id", ASCENDING), ("candidate_id", ASCENDING)], unique=True, partialFilterExpression=LIVE_DOCUMENTS)
         ]
 
 
@@ -284,7 +305,7 @@ class MessageDocument(BaseDocument):
     conversation_id: UUID
     sender_id: UUID
     content: str
-    sent_at: datetime = Field(default_factory=datetime.utcnow)
+    sent_at: datetime = Field(default_factory=utc_now)
     is_read: bool = False
     attachment_url: Optional[str] = None
     message_type: str = "text"  # "text", "file", "image", "system", "template"
@@ -292,9 +313,8 @@ class MessageDocument(BaseDocument):
     class Settings:
         name = "messages"
         indexes = [
-            "conversation_id",
-            "sender_id",
-            "sent_at"
+            IndexModel([("conversation_id", ASCENDING), ("sent_at", DESCENDING)]),
+            IndexModel([("sender_id", ASCENDING), ("sent_at", DESCENDING)])
         ]
 
 
@@ -302,14 +322,15 @@ class ConversationParticipantDocument(BaseDocument):
     """Conversation participant document for MongoDB."""
     conversation_id: UUID
     user_id: UUID
-    joined_at: datetime = Field(default_factory=datetime.utcnow)
+    joined_at: datetime = Field(default_factory=utc_now)
+    last_read_at: Optional[datetime] = None
 
     class Settings:
         name = "conversation_participants"
         indexes = [
-            "conversation_id",
-            "user_id",
-            ("conversation_id", "user_id", {"unique": True})
+            IndexModel([("user_id", ASCENDING)]),
+            IndexModel([("conversation_id", ASCENDING), ("user_id", ASCENDING)], unique=True, partialFilterExpression=LIVE_DOCUMENTS),
+            IndexModel([("conversation_id", ASCENDING), ("last_read_at", ASCENDING)])
         ]
 
 
@@ -322,7 +343,7 @@ class ConversationDocument(BaseDocument):
     class Settings:
         name = "conversations"
         indexes = [
-            "last_message_at"
+            IndexModel([("last_message_at", ASCENDING)])
         ]
 
 
@@ -340,8 +361,8 @@ class EmailTemplateDocument(BaseDocument):
     class Settings:
         name = "email_templates"
         indexes = [
-            "name",
-            "template_type"
+            IndexModel([("name", ASCENDING)]),
+            IndexModel([("template_type", ASCENDING)])
         ]
 
 
@@ -360,7 +381,7 @@ class AIInteractionDocument(BaseDocument):
     class Settings:
         name = "ai_interactions"
         indexes = [
-            "user_id",
-            "interaction_type",
-            "created_at"
+            IndexModel([("user_id", ASCENDING)]),
+            IndexModel([("interaction_type", ASCENDING)]),
+            IndexModel([("created_at", ASCENDING)])
         ]
\ No newline at end of file
@@ -1,7 +1,7 @@
 from sqlalchemy import Column, String, Text, Integer, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.base import BaseModel
+from app.models.base import BaseModel, model_repr
 
 
 class SkillCategory(BaseModel):
@@ -14,8 +14,7 @@ class SkillCategory(BaseModel):
     # Relationships
     skills = relationship("Skill", back_populates="category", cascade="all, delete-orphan")
 
-    def __repr__(self):
-        return f"<SkillCategory(id={self.id}, name={self.name})>"
+    __repr__ = model_repr("SkillCategory", "id", "name")
 
 
 class Skill(BaseModel):
@@ -30,5 +29,4 @@ class Skill(BaseModel):
     candidate_skills = relationship("CandidateSkill", back_populates="skill", cascade="all, delete-orphan")
     job_skills = relationship("JobSkillRequirement", back_populates="skill", cascade="all, delete-orphan")
 
-    def __repr__(self):
-        return f"<Skill(id={self.id}, name={self.name}, category_id={self.category_id})>"
\ No newline at end of file
+    __repr__ = model_repr("Skill", "id", "name", "category_id")
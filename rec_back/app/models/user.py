@@ -1,6 +1,7 @@
 from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
-from app.models.base import BaseModel
+from app.models.base import BaseModel, model_repr
 from app.models.enums import UserRole, OfficeId
 
 
@@ -30,11 +31,25 @@ class User(BaseModel):
     # Messages sent
     sent_messages = relationship("Message", back_populates="sender", foreign_keys="Message.sender_id")
     
+    # Messaging participation
+    # Read-only: participants are written through Conversation.participants / the table
+    conversations = relationship(
+        "Conversation",
+        secondary="conversation_participants",
+        back_populates="participants",
+        viewonly=True
+    )
+    message_read_receipts = relationship("MessageReadReceipt", back_populates="user")
+    reactions = relationship("MessageReaction", back_populates="user")
+    
     # Remove the problematic applications relationship - applications are accessed through candidate_profile
 
-    @property
+    @hybrid_property
     def full_name(self):
         return f"{self.first_name} {self.last_name}"
 
-    def __repr__(self):
-        return f"<User(id={self.id}, email={self.email}, role={self.role})>"
\ No newline at end of file
+    @full_name.expression
+    def full_name(cls):
+        return cls.first_name + " " + cls.last_name
+
+    __repr__ = model_repr("User", "id", "email", "role")
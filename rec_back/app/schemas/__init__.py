@@ -1,160 +1,101 @@
-from .auth import (
-    LoginRequest, RefreshTokenRequest, RegisterRequest, UserResponse, 
-    TokenResponse, LoginResponse, RefreshResponse, AuthStatusResponse
-)
-from .candidate import (
-    CandidateProfileBase, CandidateProfileCreate, CandidateProfileUpdate, CandidateProfile,
-    CandidateFullProfile, EducationBase, EducationCreate, EducationUpdate, Education,
-    WorkExperienceBase, WorkExperienceCreate, WorkExperienceUpdate, WorkExperience,
-    CandidateJobPreferenceBase, CandidateJobPreferenceCreate, CandidateJobPreferenceUpdate,
-    CandidateJobPreference, CandidateSearchFilters, CandidateListResponse,
-    CandidateNotificationSettings, CandidateNotificationSettingsCreate, CandidateNotificationSettingsUpdate,
-    CandidateSkill, CandidateSkillCreate, CandidateSkillUpdate
-)
-from .employer import (
-    CompanyBase, CompanyCreate, CompanyUpdate, Company, CompanyStats,
-    EmployerProfileBase, EmployerProfileCreate, EmployerProfileUpdate, EmployerProfile,
-    EmployerFullProfile, CompanySearchFilters, EmployerSearchFilters,
-    CompanyListResponse, EmployerListResponse,
-    CompanyContact, CompanyContactCreate, CompanyContactUpdate,
-    CompanyHiringPreferences, CompanyHiringPreferencesCreate, CompanyHiringPreferencesUpdate,
-    RecruitmentHistory, RecruitmentHistoryCreate, RecruitmentHistoryUpdate
-)
-from .consultant import (
-    ConsultantProfileBase, ConsultantProfileCreate, ConsultantProfileUpdate, ConsultantProfile,
-    ConsultantProfileWithDetails, ConsultantTargetBase, ConsultantTargetCreate, ConsultantTargetUpdate,
-    ConsultantTarget, ConsultantPerformanceReviewBase, ConsultantPerformanceReviewCreate,
-    ConsultantPerformanceReviewUpdate, ConsultantPerformanceReview, ConsultantSearchFilters,
-    ConsultantListResponse, ConsultantStats,
-    ConsultantCandidate, ConsultantCandidateCreate, ConsultantCandidateUpdate,
-    ConsultantClient, ConsultantClientCreate, ConsultantClientUpdate
-)
-from .job import (
-    JobBase, JobCreate, JobUpdate, Job, JobWithDetails,
-    JobSkillRequirementBase, JobSkillRequirementCreate, JobSkillRequirementUpdate, JobSkillRequirement,
-    JobSearchFilters, JobListResponse, JobApplicationSummary
-)
-from .application import (
-    ApplicationBase, ApplicationCreate, ApplicationUpdate, Application, ApplicationWithDetails,
-    ApplicationStatusHistoryBase, ApplicationStatusHistoryCreate, ApplicationStatusHistory,
-    ApplicationSearchFilters, ApplicationListResponse, ApplicationStats,
-    BulkApplicationUpdate, BulkApplicationResponse, ApplicationStatusChange,
-    ScheduleInterview, MakeOffer,
-    ApplicationNote, ApplicationNoteCreate, ApplicationNoteUpdate
-)
-from .skill import (
-    SkillBase, SkillCreate, SkillUpdate, Skill, SkillWithCategory,
-    SkillCategoryBase, SkillCategoryCreate, SkillCategoryUpdate, SkillCategory,
-    SkillSearchFilters, SkillListResponse, SkillCategoryListResponse,
-    SkillStats, CategoryStats
-)
-from .messaging import (
-    ConversationBase, ConversationCreate, ConversationUpdate, Conversation, ConversationWithDetails,
-    MessageBase, MessageCreate, MessageUpdate, Message, MessageWithDetails,
-    MessageAttachmentBase, MessageAttachmentCreate, MessageAttachmentUpdate, MessageAttachment,
-    EmailTemplateBase, EmailTemplateCreate, EmailTemplateUpdate, EmailTemplate, EmailTemplateWithStats,
-    ConversationSearchFilters, MessageSearchFilters, EmailTemplateSearchFilters,
-    ConversationListResponse, MessageListResponse, EmailTemplateListResponse,
-    SendMessageRequest, CreateConversationRequest, MessageReactionRequest, MarkAsReadRequest
-)
-from .admin import (
-    AdminProfileBase, AdminProfileCreate, AdminProfileUpdate, AdminProfile, AdminProfileWithDetails,
-    SuperAdminProfileBase, SuperAdminProfileCreate, SuperAdminProfileUpdate, SuperAdminProfile, SuperAdminProfileWithDetails,
-    AdminAuditLogBase, AdminAuditLogCreate, AdminAuditLog, AdminAuditLogWithDetails,
-    SystemConfigurationBase, SystemConfigurationCreate, SystemConfigurationUpdate, SystemConfiguration, SystemConfigurationWithDetails,
-    AdminNotificationBase, AdminNotificationCreate, AdminNotification,
-    AdminSearchFilters, AuditLogSearchFilters, SystemConfigSearchFilters,
-    AdminListResponse, SuperAdminListResponse, AuditLogListResponse, SystemConfigListResponse, NotificationListResponse,
-    UpdateAdminPermissionsRequest, UpdateSystemConfigRequest, CreateAuditLogRequest, AdminLoginRequest,
-    AdminStats, SystemStats
-)
-from .ai_tools import (
-    CVAnalysisRequest, CVAnalysisResponse,
-    JobMatchRequest, JobMatchResult, JobMatchResponse,
-    EmailGenerationRequest, EmailGenerationResponse,
-    InterviewQuestionsRequest, InterviewQuestion, InterviewQuestionsResponse,
-    JobDescriptionRequest, JobDescriptionResponse,
-    CandidateFeedbackRequest, CandidateFeedbackResponse,
-    SkillsExtractionRequest, ExtractedSkill, SkillsExtractionResponse
-)
+"""
+Pydantic schemas, re-exported lazily.
 
-__all__ = [
-    # Auth
-    "LoginRequest", "RefreshTokenRequest", "RegisterRequest", "UserResponse", 
-    "TokenResponse", "LoginResponse", "RefreshResponse", "AuthStatusResponse",
-    
-    # Candidate
-    "CandidateProfileBase", "CandidateProfileCreate", "CandidateProfileUpdate", "CandidateProfile",
-    "CandidateFullProfile", "EducationBase", "EducationCreate", "EducationUpdate", "Education",
-    "WorkExperienceBase", "WorkExperienceCreate", "WorkExperienceUpdate", "WorkExperience",
-    "CandidateJobPreferenceBase", "CandidateJobPreferenceCreate", "CandidateJobPreferenceUpdate",
-    "CandidateJobPreference", "CandidateSearchFilters", "CandidateListResponse",
-    "CandidateNotificationSettings", "CandidateNotificationSettingsCreate", "CandidateNotificationSettingsUpdate",
-    "CandidateSkill", "CandidateSkillCreate", "CandidateSkillUpdate",
-    
-    # Employer/Company
-    "CompanyBase", "CompanyCreate", "CompanyUpdate", "Company", "CompanyStats",
-    "EmployerProfileBase", "EmployerProfileCreate", "EmployerProfileUpdate", "EmployerProfile",
-    "EmployerFullProfile", "CompanySearchFilters", "EmployerSearchFilters",
-    "CompanyListResponse", "EmployerListResponse",
-    "CompanyContact", "CompanyContactCreate", "CompanyContactUpdate",
-    "CompanyHiringPreferences", "CompanyHiringPreferencesCreate", "CompanyHiringPreferencesUpdate",
-    "RecruitmentHistory", "RecruitmentHistoryCreate", "RecruitmentHistoryUpdate",
-    
-    # Consultant
-    "ConsultantProfileBase", "ConsultantProfileCreate", "ConsultantProfileUpdate", "ConsultantProfile",
-    "ConsultantProfileWithDetails", "ConsultantTargetBase", "ConsultantTargetCreate", "ConsultantTargetUpdate",
-    "ConsultantTarget", "ConsultantPerformanceReviewBase", "ConsultantPerformanceReviewCreate",
-    "ConsultantPerformanceReviewUpdate", "ConsultantPerformanceReview", "ConsultantSearchFilters",
-    "ConsultantListResponse", "ConsultantStats",
-    "ConsultantCandidate", "ConsultantCandidateCreate", "ConsultantCandidateUpdate",
-    "ConsultantClient", "ConsultantClientCreate", "ConsultantClientUpdate",
-    
-    # Job
-    "JobBase", "JobCreate", "JobUpdate", "Job", "JobWithDetails",
-    "JobSkillRequirementBase", "JobSkillRequirementCreate", "JobSkillRequirementUpdate", "JobSkillRequirement",
-    "JobSearchFilters", "JobListResponse", "JobApplicationSummary",
-    
-    # Application
-    "ApplicationBase", "ApplicationCreate", "ApplicationUpdate", "Application", "ApplicationWithDetails",
-    "ApplicationStatusHistoryBase", "ApplicationStatusHistoryCreate", "ApplicationStatusHistory",
-    "ApplicationSearchFilters", "ApplicationListResponse", "ApplicationStats",
-    "BulkApplicationUpdate", "BulkApplicationResponse", "ApplicationStatusChange",
-    "ScheduleInterview", "MakeOffer",
-    "ApplicationNote", "ApplicationNoteCreate", "ApplicationNoteUpdate",
-    
-    # Skills
-    "SkillBase", "SkillCreate", "SkillUpdate", "Skill", "SkillWithCategory",
-    "SkillCategoryBase", "SkillCategoryCreate", "SkillCategoryUpdate", "SkillCategory",
-    "SkillSearchFilters", "SkillListResponse", "SkillCategoryListResponse",
-    "SkillStats", "CategoryStats",
-    
-    # Messaging
-    "ConversationBase", "ConversationCreate", "ConversationUpdate", "Conversation", "ConversationWithDetails",
-    "MessageBase", "MessageCreate", "MessageUpdate", "Message", "MessageWithDetails",
-    "MessageAttachmentBase", "MessageAttachmentCreate", "MessageAttachmentUpdate", "MessageAttachment",
-    "EmailTemplateBase", "EmailTemplateCreate", "EmailTemplateUpdate", "EmailTemplate", "EmailTemplateWithStats",
-    "ConversationSearchFilters", "MessageSearchFilters", "EmailTemplateSearchFilters",
-    "ConversationListResponse", "MessageListResponse", "EmailTemplateListResponse",
-    "SendMessageRequest", "CreateConversationRequest", "MessageReactionRequest", "MarkAsReadRequest",
-    
-    # Admin
-    "AdminProfileBase", "AdminProfileCreate", "AdminProfileUpdate", "AdminProfile", "AdminProfileWithDetails",
-    "SuperAdminProfileBase", "SuperAdminProfileCreate", "SuperAdminProfileUpdate", "SuperAdminProfile", "SuperAdminProfileWithDetails",
-    "AdminAuditLogBase", "AdminAuditLogCreate", "AdminAuditLog", "AdminAuditLogWithDetails",
-    "SystemConfigurationBase", "SystemConfigurationCreate", "SystemConfigurationUpdate", "SystemConfiguration", "SystemConfigurationWithDetails",
-    "AdminNotificationBase", "AdminNotificationCreate", "AdminNotification",
-    "AdminSearchFilters", "AuditLogSearchFilters", "SystemConfigSearchFilters",
-    "AdminListResponse", "SuperAdminListResponse", "AuditLogListResponse", "SystemConfigListResponse", "NotificationListResponse",
-    "UpdateAdminPermissionsRequest", "UpdateSystemConfigRequest", "CreateAuditLogRequest", "AdminLoginRequest",
-    "AdminStats", "SystemStats",
-    
-    # AI Tools
-    "CVAnalysisRequest", "CVAnalysisResponse",
-    "JobMatchRequest", "JobMatchResult", "JobMatchResponse",
-    "EmailGenerationRequest", "EmailGenerationResponse",
-    "InterviewQuestionsRequest", "InterviewQuestion", "InterviewQuestionsResponse",
-    "JobDescriptionRequest", "JobDescriptionResponse",
-    "CandidateFeedbackRequest", "CandidateFeedbackResponse",
-    "SkillsExtractionRequest", "ExtractedSkill", "SkillsExtractionResponse",
-]
\ No newline at end of file
+Importing a schema module builds every model in it, so the names below are
+resolved on first attribute access (PEP 562) and only the submodule that
+defines them is imported.
+"""
+from app.core.lazy import lazy_exports
+
+# Public name groups, keyed by the submodule that defines them
+_EXPORTS = {
+    "auth": (
+        "LoginRequest", "RefreshTokenRequest", "RegisterRequest", "UserResponse",
+        "TokenResponse", "LoginResponse", "RefreshResponse", "AuthStatusResponse",
+    ),
+    "candidate": (
+        "CandidateProfileBase", "CandidateProfileCreate", "CandidateProfileUpdate", "CandidateProfile",
+        "CandidateFullProfile", "EducationBase", "EducationCreate", "EducationUpdate", "Education",
+        "WorkExperienceBase", "WorkExperienceCreate", "WorkExperienceUpdate", "WorkExperience",
+        "CandidateJobPreferenceBase", "CandidateJobPreferenceCreate", "CandidateJobPreferenceUpdate",
+        "CandidateJobPreference", "CandidateSearchFilters", "CandidateListResponse",
+        "CandidateNotificationSettings", "CandidateNotificationSettingsCreate", "CandidateNotificationSettingsUpdate",
+        "CandidateSkill", "CandidateSkillCreate", "CandidateSkillUpdate",
+    ),
+    "employer": (
+        "CompanyBase", "CompanyCreate", "CompanyUpdate", "Company", "CompanyStats",
+        "EmployerProfileBase", "EmployerProfileCreate", "EmployerProfileUpdate", "EmployerProfile",
+        "EmployerFullProfile", "CompanySearchFilters", "EmployerSearchFilters",
+        "CompanyListResponse", "EmployerListResponse",
+        "CompanyContact", "CompanyContactCreate", "CompanyContactUpdate",
+        "CompanyHiringPreferences", "CompanyHiringPreferencesCreate", "CompanyHiringPreferencesUpdate",
+        "RecruitmentHistory", "RecruitmentHistoryCreate", "RecruitmentHistoryUpdate",
+    ),
+    "consultant": (
+        "ConsultantProfileBase", "ConsultantProfileCreate", "ConsultantProfileUpdate", "ConsultantProfile",
+        "ConsultantProfileWithDetails", "ConsultantTargetBase", "ConsultantTargetCreate", "ConsultantTargetUpdate",
+        "ConsultantTarget", "ConsultantPerformanceReviewBase", "ConsultantPerformanceReviewCreate",
+        "ConsultantPerformanceReviewUpdate", "ConsultantPerformanceReview", "ConsultantSearchFilters",
+        "ConsultantListResponse", "ConsultantStats",
+        "ConsultantCandidate", "ConsultantCandidateCreate", "ConsultantCandidateUpdate",
+        "ConsultantClient", "ConsultantClientCreate", "ConsultantClientUpdate",
+    ),
+    "job": (
+        "JobBase", "JobCreate", "JobUpdate", "Job", "JobWithDetails",
+        "JobSkillRequirementBase", "JobSkillRequirementCreate", "JobSkillRequirementUpdate", "JobSkillRequirement",
+        "JobSearchFilters", "JobListResponse", "JobApplicationSummary",
+    ),
+    "application": (
+        "ApplicationBase", "ApplicationCreate", "ApplicationUpdate", "Application", "ApplicationWithDetails",
+        "ApplicationStatusHistoryBase", "ApplicationStatusHistoryCreate", "ApplicationStatusHistory",
+        "ApplicationSearchFilters", "ApplicationListResponse", "ApplicationStats",
+        "BulkApplicationUpdate", "BulkApplicationResponse", "ApplicationStatusChange",
+        "ScheduleInterview", "MakeOffer",
+        "ApplicationNote", "ApplicationNoteCreate", "ApplicationNoteUpdate",
+    ),
+    "skill": (
+        "SkillBase", "SkillCreate", "SkillUpdate", "Skill", "SkillWithCategory",
+        "SkillCategoryBase", "SkillCategoryCreate", "SkillCategoryUpdate", "SkillCategory",
+        "SkillSearchFilters", "SkillListResponse", "SkillCategoryListResponse",
+        "SkillStats", "CategoryStats",
+    ),
+    "messaging": (
+        "ConversationBase", "ConversationCreate", "ConversationUpdate", "Conversation", "ConversationWithDetails",
+        "MessageBase", "MessageCreate", "MessageUpdate", "Message", "MessageSender", "MessageWithDetails",
+        "MessageAttachmentBase", "MessageAttachmentCreate", "MessageAttachmentUpdate", "MessageAttachment",
+        "EmailTemplateBase", "EmailTemplateCreate", "EmailTemplateUpdate", "EmailTemplate", "EmailTemplateWithStats",
+        "ConversationSearchFilters", "MessageSearchFilters", "EmailTemplateSearchFilters",
+        "ConversationListResponse", "MessageListResponse", "EmailTemplateListResponse",
+        "SendMessageRequest", "CreateConversationRequest", "MessageReactionRequest", "MarkAsReadRequest",
+    ),
+    "admin": (
+        "AdminProfileBase", "AdminProfileCreate", "AdminProfileUpdate", "AdminProfile", "AdminProfileWithDetails",
+        "SuperAdminProfileBase", "SuperAdminProfileCreate", "SuperAdminProfileUpdate", "SuperAdminProfile", "SuperAdminProfileWithDetails",
+        "AdminAuditLogBase", "AdminAuditLogCreate", "AdminAuditLog", "AdminAuditLogWithDetails",
+        "SystemConfigurationBase", "SystemConfigurationCreate", "SystemConfigurationUpdate", "SystemConfiguration", "SystemConfigurationWithDetails",
+        "AdminNotificationBase", "AdminNotificationCreate", "AdminNotification",
+        "AdminSearchFilters", "AuditLogSearchFilters", "SystemConfigSearchFilters",
+        "Page", "AdminListResponse", "SuperAdminListResponse", "AuditLogListResponse", "SystemConfigListResponse", "NotificationListResponse",
+        "UpdateAdminPermissionsRequest", "UpdateSystemConfigRequest", "CreateAuditLogRequest", "AdminLoginRequest",
+        "AdminStats", "SystemStats",
+    ),
+    "ai_tools": (
+        "CVAnalysisRequest", "CVAnalysisResponse",
+        "JobMatchRequest", "JobMatchResult", "JobMatchResponse",
+        "EmailGenerationRequest", "EmailGenerationResponse",
+        "InterviewQuestionsRequest", "InterviewQuestion", "InterviewQuestionsResponse",
+        "JobDescriptionRequest", "JobDescriptionResponse",
+        "CandidateFeedbackRequest", "CandidateFeedbackResponse",
+        "SkillsExtractionRequest", "ExtractedSkill", "SkillsExtractionResponse",
+    ),
+}
+
+__getattr__, __dir__, __all__ = lazy_exports(globals(), _EXPORTS)
+
+# Auth schemas are used by every authenticated request and app.schemas.auth
+# is imported at startup anyway, so bind them now rather than on first access
+_EAGER = ("UserResponse", "LoginResponse", "AuthStatusResponse")
+
+for _name in _EAGER:
+    __getattr__(_name)
+del _name
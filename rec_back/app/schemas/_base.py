@@ -0,0 +1,62 @@
+from dataclasses import is_dataclass
+from functools import lru_cache
+from typing import Any, Optional, Type, TypeVar, get_args
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+from pydantic.fields import FieldInfo
+from typing_extensions import Self
+
+from app.core.config import settings
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+# Shared base for response schemas built from ORM objects, so they share one
+# config instead of each declaring its own
+class BaseSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> Self:
+        """Build from a loaded ORM row with model_construct, skipping
+        validation. Only for schemas whose columns already hold the field
+        types (no String columns behind enum fields). Schemas with nested
+        model fields are still validated, since model_construct would leave
+        the related rows as ORM objects."""
+        if settings.ENABLE_VALIDATION or _has_nested_models(cls):
+            return cls.model_validate(obj)
+        return cls.model_construct(**{
+            name: getattr(obj, name, field.get_default(call_default_factory=True))
+            for name, field in cls.model_fields.items()
+        })
+
+
+# page/page_size shared by the *SearchFilters schemas; filters with a
+# different page size redeclare page_size
+class Pagination(BaseModel):
+    page: int = Field(1, ge=1)
+    page_size: int = Field(20, ge=1, le=100)
+
+
+def _is_nested(annotation: Any) -> bool:
+    if isinstance(annotation, type) and (issubclass(annotation, BaseModel) or is_dataclass(annotation)):
+        return True
+    return any(_is_nested(arg) for arg in get_args(annotation))
+
+
+@lru_cache(maxsize=None)
+def _has_nested_models(model: Type[BaseModel]) -> bool:
+    return any(_is_nested(field.annotation) for field in model.model_fields.values())
+
+
+def make_partial(model: Type[ModelT], name: str) -> Type[ModelT]:
+    """Subclass of model whose required fields are optional and default to
+    None, for *Update schemas. Fields that already have a default keep it,
+    and constraints and validators carry over unchanged."""
+    fields = {
+        field_name: (Optional[field.annotation], FieldInfo.merge_field_infos(field, default=None))
+        for field_name, field in model.model_fields.items()
+        if field.is_required()
+    }
+    return create_model(name, __base__=model, __module__=model.__module__, **fields)
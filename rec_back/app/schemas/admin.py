@@ -1,8 +1,52 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, FrozenSet, Generic, Literal, TypeVar
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from enum import Enum
+import ipaddress
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, TypeAdapter, field_serializer, field_validator
+from pydantic.dataclasses import dataclass
 from uuid import UUID
-from app.models.admin import AdminStatus, AdminRole, PermissionLevel
+from app.schemas._base import Pagination
+
+
+# Mirrors app.models.enums.AdminStatus (same values) so that importing these
+# schemas does not load SQLAlchemy and the ORM models
+class AdminStatus(str, Enum):
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+    SUSPENDED = "suspended"
+
+
+class Permission(str, Enum):
+    READ_USERS = "read_users"
+    WRITE_USERS = "write_users"
+    DELETE_USERS = "delete_users"
+    READ_JOBS = "read_jobs"
+    WRITE_JOBS = "write_jobs"
+    DELETE_JOBS = "delete_jobs"
+    READ_APPLICATIONS = "read_applications"
+    MANAGE_APPLICATIONS = "manage_applications"
+    MANAGE_COMPANIES = "manage_companies"
+    MANAGE_CONSULTANTS = "manage_consultants"
+    VIEW_ANALYTICS = "view_analytics"
+    EXPORT_DATA = "export_data"
+    MANAGE_ADMINS = "manage_admins"
+    VIEW_AUDIT_LOGS = "view_audit_logs"
+    SYSTEM_CONFIG = "system_config"
+    SECURITY_MANAGEMENT = "security_management"
+    FULL_ACCESS = "full_access"
+
+
+# IP checks use the stdlib parsers rather than a regex; values are kept as sent
+def _check_ip_address(value: Optional[str]) -> Optional[str]:
+    if value is not None:
+        ipaddress.ip_address(value)
+    return value
+
+
+def _check_ip_networks(values: Optional[List[str]]) -> Optional[List[str]]:
+    for value in values or ():
+        ipaddress.ip_network(value, strict=False)
+    return values
 
 
 # Base schemas for Admin Profile
@@ -13,10 +57,11 @@ class AdminProfileBase(BaseModel):
     admin_level: Optional[int] = Field(1, ge=1, le=5)
     status: Optional[AdminStatus] = AdminStatus.ACTIVE
     phone_number: Optional[str] = Field(None, max_length=20)
-    emergency_contact: Optional[Dict[str, Any]] = None
+    emergency_contact: Optional[SkipValidation[Dict[str, Any]]] = None
     roles: Optional[List[str]] = None
-    permissions: Optional[List[str]] = None
-    restricted_actions: Optional[List[str]] = None
+    # Sets for O(1) membership checks; stored and sent as sorted JSON arrays
+    permissions: Optional[FrozenSet[Permission]] = None
+    restricted_actions: Optional[FrozenSet[str]] = None
     hire_date: Optional[datetime] = None
     two_factor_enabled: Optional[bool] = False
     session_timeout: Optional[int] = Field(None, ge=5, le=480)  # 5 minutes to 8 hours
@@ -25,29 +70,42 @@ class AdminProfileBase(BaseModel):
     notes: Optional[str] = None
     internal_notes: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
+    @field_validator('allowed_ip_ranges')
+    def validate_allowed_ip_ranges(cls, v):
+        return _check_ip_networks(v)
+
+    @field_serializer('permissions', 'restricted_actions')
+    def serialize_sets(self, v):
+        return sorted(v) if v is not None else None
+
 
 class AdminProfileCreate(AdminProfileBase):
     user_id: UUID
 
 
-class AdminProfileUpdate(AdminProfileBase):
-    pass
+# Field-for-field identical to the base, so share its schema instead of
+# building a second copy
+AdminProfileUpdate = AdminProfileBase
 
 
 class AdminProfile(AdminProfileBase):
-    id: UUID
-    user_id: UUID
+    # Read from ORM rows only: keys and timestamps are already UUID/datetime
+    id: SkipValidation[UUID]
+    user_id: SkipValidation[UUID]
+    # Rows created before Permission existed may hold other strings
+    permissions: Optional[FrozenSet[str]] = None
     last_login: Optional[datetime] = None
     login_count: Optional[int] = 0
     failed_login_attempts: Optional[int] = 0
     last_failed_login: Optional[datetime] = None
     total_actions_performed: Optional[int] = 0
     last_action_at: Optional[datetime] = None
-    created_at: datetime
-    updated_at: datetime
+    created_at: SkipValidation[datetime]
+    updated_at: SkipValidation[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 # Admin profile with user details
@@ -57,8 +115,7 @@ class AdminProfileWithDetails(AdminProfile):
     supervisor_name: Optional[str] = None
     supervised_count: Optional[int] = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 # Base schemas for SuperAdmin Profile
@@ -69,7 +126,7 @@ class SuperAdminProfileBase(BaseModel):
     user_management_access: Optional[bool] = True
     financial_access: Optional[bool] = False
     emergency_access_enabled: Optional[bool] = True
-    emergency_contact_info: Optional[Dict[str, Any]] = None
+    emergency_contact_info: Optional[SkipValidation[Dict[str, Any]]] = None
     backup_access: Optional[bool] = True
     recovery_key_access: Optional[bool] = False
     api_key_management: Optional[bool] = True
@@ -77,13 +134,14 @@ class SuperAdminProfileBase(BaseModel):
     appointment_notes: Optional[str] = None
     security_clearance_notes: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class SuperAdminProfileCreate(SuperAdminProfileBase):
     user_id: UUID
 
 
-class SuperAdminProfileUpdate(SuperAdminProfileBase):
-    pass
+SuperAdminProfileUpdate = SuperAdminProfileBase
 
 
 class SuperAdminProfile(SuperAdminProfileBase):
@@ -94,8 +152,7 @@ class SuperAdminProfile(SuperAdminProfileBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 # SuperAdmin profile with user details
@@ -103,8 +160,7 @@ class SuperAdminProfileWithDetails(SuperAdminProfile):
     user_name: Optional[str] = None
     user_email: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 # Base schemas for Admin Audit Log
@@ -115,14 +171,21 @@ class AdminAuditLogBase(BaseModel):
     ip_address: Optional[str] = Field(None, max_length=45)
     user_agent: Optional[str] = Field(None, max_length=500)
     session_id: Optional[str] = Field(None, max_length=100)
-    old_values: Optional[Dict[str, Any]] = None
-    new_values: Optional[Dict[str, Any]] = None
+    # JSONB blobs are passed through to the database without being walked key by key
+    old_values: Optional[SkipValidation[Dict[str, Any]]] = None
+    new_values: Optional[SkipValidation[Dict[str, Any]]] = None
     changes_summary: Optional[str] = None
     status: Optional[str] = Field("success", max_length=20)
     error_message: Optional[str] = None
     reason: Optional[str] = None
     notes: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[SkipValidation[Dict[str, Any]]] = None
+
+    model_config = ConfigDict(defer_build=True)
+
+    @field_validator('ip_address')
+    def validate_ip_address(cls, v):
+        return _check_ip_address(v)
 
 
 class AdminAuditLogCreate(AdminAuditLogBase):
@@ -131,13 +194,12 @@ class AdminAuditLogCreate(AdminAuditLogBase):
 
 
 class AdminAuditLog(AdminAuditLogBase):
-    id: UUID
+    id: SkipValidation[UUID]
     admin_id: Optional[UUID] = None
     superadmin_id: Optional[UUID] = None
-    created_at: datetime
+    created_at: SkipValidation[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 # Audit log with user details
@@ -145,8 +207,7 @@ class AdminAuditLogWithDetails(AdminAuditLog):
     admin_name: Optional[str] = None
     superadmin_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 # Base schemas for System Configuration
@@ -158,13 +219,14 @@ class SystemConfigurationBase(BaseModel):
     category: Optional[str] = Field(None, max_length=50)
     is_sensitive: Optional[bool] = False
     is_public: Optional[bool] = False
-    validation_rules: Optional[Dict[str, Any]] = None
+    validation_rules: Optional[SkipValidation[Dict[str, Any]]] = None
     default_value: Optional[Any] = None
     is_active: Optional[bool] = True
 
+    model_config = ConfigDict(defer_build=True)
+
 
-class SystemConfigurationCreate(SystemConfigurationBase):
-    pass
+SystemConfigurationCreate = SystemConfigurationBase
 
 
 class SystemConfigurationUpdate(SystemConfigurationBase):
@@ -173,23 +235,21 @@ class SystemConfigurationUpdate(SystemConfigurationBase):
 
 
 class SystemConfiguration(SystemConfigurationBase):
-    id: UUID
+    id: SkipValidation[UUID]
     last_modified_by: Optional[UUID] = None
     last_modified_at: Optional[datetime] = None
     version: Optional[int] = 1
-    created_at: datetime
-    updated_at: datetime
+    created_at: SkipValidation[datetime]
+    updated_at: SkipValidation[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 # System configuration with modifier details
 class SystemConfigurationWithDetails(SystemConfiguration):
     last_modified_by_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 # Base schemas for Admin Notification
@@ -197,14 +257,16 @@ class AdminNotificationBase(BaseModel):
     title: str = Field(..., max_length=200)
     message: str = Field(..., min_length=1)
     notification_type: str = Field(..., max_length=50)
-    priority: Optional[str] = Field("medium", pattern="^(low|medium|high|critical)$")
+    priority: Optional[Literal["low", "medium", "high", "critical"]] = "medium"
     action_required: Optional[bool] = False
     action_url: Optional[str] = Field(None, max_length=500)
-    action_data: Optional[Dict[str, Any]] = None
+    action_data: Optional[SkipValidation[Dict[str, Any]]] = None
     expires_at: Optional[datetime] = None
     source_type: Optional[str] = Field(None, max_length=50)
     source_id: Optional[UUID] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class AdminNotificationCreate(AdminNotificationBase):
     admin_id: Optional[UUID] = None
@@ -222,121 +284,111 @@ class AdminNotification(AdminNotificationBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 # Search and filter schemas
-class AdminSearchFilters(BaseModel):
+class AdminSearchFilters(Pagination):
     query: Optional[str] = Field(None, description="Search in name, email, or employee ID")
     status: Optional[AdminStatus] = Field(None, description="Filter by admin status")
+    role: Optional[str] = Field(None, description="Filter by admin role")
     department: Optional[str] = Field(None, description="Filter by department")
     admin_level: Optional[int] = Field(None, description="Filter by admin level")
     supervisor_id: Optional[UUID] = Field(None, description="Filter by supervisor")
     has_two_factor: Optional[bool] = Field(None, description="Filter by 2FA status")
     
-    # Pagination
-    page: int = Field(1, ge=1)
-    page_size: int = Field(20, ge=1, le=100)
-    
     # Sorting
-    sort_by: Optional[str] = Field("created_at", pattern="^(created_at|last_login|admin_level|user_name)$")
-    sort_order: Optional[str] = Field("desc", pattern="^(asc|desc)$")
+    sort_by: Optional[Literal["created_at", "last_login", "admin_level", "user_name"]] = "created_at"
+    sort_order: Optional[Literal["asc", "desc"]] = "desc"
+
+    model_config = ConfigDict(defer_build=True, extra='forbid')
 
 
-class AuditLogSearchFilters(BaseModel):
+class AuditLogSearchFilters(Pagination):
     admin_id: Optional[UUID] = Field(None, description="Filter by admin")
+    user_id: Optional[UUID] = Field(None, description="Filter by the admin's user")
     action_type: Optional[str] = Field(None, description="Filter by action type")
     resource_type: Optional[str] = Field(None, description="Filter by resource type")
     status: Optional[str] = Field(None, description="Filter by status")
+    ip_address: Optional[str] = Field(None, description="Filter by IP address")
     date_from: Optional[datetime] = Field(None, description="Filter from date")
     date_to: Optional[datetime] = Field(None, description="Filter to date")
     
     # Pagination
-    page: int = Field(1, ge=1)
     page_size: int = Field(50, ge=1, le=200)
     
     # Sorting
-    sort_by: Optional[str] = Field("created_at", pattern="^(created_at|action_type|status)$")
-    sort_order: Optional[str] = Field("desc", pattern="^(asc|desc)$")
+    sort_by: Optional[Literal["created_at", "action_type", "status"]] = "created_at"
+    sort_order: Optional[Literal["asc", "desc"]] = "desc"
 
+    model_config = ConfigDict(defer_build=True, extra='forbid')
 
-class SystemConfigSearchFilters(BaseModel):
+
+class SystemConfigSearchFilters(Pagination):
     category: Optional[str] = Field(None, description="Filter by category")
     is_public: Optional[bool] = Field(None, description="Filter by public configs")
     is_active: Optional[bool] = Field(None, description="Filter by active configs")
     query: Optional[str] = Field(None, description="Search in key or description")
     
     # Pagination
-    page: int = Field(1, ge=1)
     page_size: int = Field(50, ge=1, le=100)
     
     # Sorting
-    sort_by: Optional[str] = Field("config_key", pattern="^(config_key|category|last_modified_at)$")
-    sort_order: Optional[str] = Field("asc", pattern="^(asc|desc)$")
-
-
-# Response schemas
-class AdminListResponse(BaseModel):
-    admins: List[AdminProfileWithDetails]
-    total: int
-    page: int
-    page_size: int
-    total_pages: int
+    sort_by: Optional[Literal["config_key", "category", "last_modified_at"]] = "config_key"
+    sort_order: Optional[Literal["asc", "desc"]] = "asc"
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, extra='forbid')
 
 
-class SuperAdminListResponse(BaseModel):
-    superadmins: List[SuperAdminProfileWithDetails]
-    total: int
-
-    class Config:
-        from_attributes = True
+# Response schemas
+T = TypeVar("T")
 
 
-class AuditLogListResponse(BaseModel):
-    logs: List[AdminAuditLogWithDetails]
+@dataclass(config=ConfigDict(defer_build=True, from_attributes=True), slots=True)
+class Page(Generic[T]):
+    items: List[T]
     total: int
-    page: int
-    page_size: int
-    total_pages: int
+    page: int = 1
+    page_size: int = 20
+    total_pages: int = 1
 
-    class Config:
-        from_attributes = True
 
+AdminListResponse = Page[AdminProfileWithDetails]
+SuperAdminListResponse = Page[SuperAdminProfileWithDetails]
+AuditLogListResponse = Page[AdminAuditLogWithDetails]
+SystemConfigListResponse = Page[SystemConfigurationWithDetails]
 
-class SystemConfigListResponse(BaseModel):
-    configurations: List[SystemConfigurationWithDetails]
-    total: int
-    page: int
-    page_size: int
-    total_pages: int
 
-    class Config:
-        from_attributes = True
+@dataclass(config=ConfigDict(defer_build=True, from_attributes=True), slots=True)
+class NotificationListResponse(Page[AdminNotification]):
+    unread_count: int = 0
 
 
-class NotificationListResponse(BaseModel):
-    notifications: List[AdminNotification]
-    total: int
-    unread_count: int
-
-    class Config:
-        from_attributes = True
+# Shared list validators for the list endpoints (built on first use, then reused)
+admin_list_adapter = TypeAdapter(List[AdminProfileWithDetails], config=ConfigDict(defer_build=True))
+system_configuration_list_adapter = TypeAdapter(
+    List[SystemConfigurationWithDetails], config=ConfigDict(defer_build=True)
+)
 
 
 # Action schemas
 class UpdateAdminPermissionsRequest(BaseModel):
-    permissions: List[str] = Field(..., description="List of permissions to grant")
-    restricted_actions: Optional[List[str]] = Field(None, description="List of restricted actions")
+    permissions: FrozenSet[Permission] = Field(..., description="List of permissions to grant")
+    restricted_actions: Optional[FrozenSet[str]] = Field(None, description="List of restricted actions")
+
+    model_config = ConfigDict(defer_build=True)
+
+    @field_serializer('permissions', 'restricted_actions')
+    def serialize_sets(self, v):
+        return sorted(v) if v is not None else None
 
 
 class UpdateSystemConfigRequest(BaseModel):
     config_value: Any = Field(..., description="New configuration value")
     reason: Optional[str] = Field(None, description="Reason for the change")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class CreateAuditLogRequest(BaseModel):
     action_type: str = Field(..., description="Type of action performed")
@@ -344,6 +396,8 @@ class CreateAuditLogRequest(BaseModel):
     resource_id: Optional[UUID] = Field(None, description="ID of affected resource")
     reason: Optional[str] = Field(None, description="Reason for the action")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class AdminLoginRequest(BaseModel):
     admin_id: UUID
@@ -351,9 +405,16 @@ class AdminLoginRequest(BaseModel):
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
+    @field_validator('ip_address')
+    def validate_ip_address(cls, v):
+        return _check_ip_address(v)
+
 
 # Statistics schemas
-class AdminStats(BaseModel):
+@dataclass(config=ConfigDict(defer_build=True, from_attributes=True), slots=True, frozen=True)
+class AdminStats:
     total_admins: int
     active_admins: int
     inactive_admins: int
@@ -362,16 +423,11 @@ class AdminStats(BaseModel):
     recent_logins: int  # Last 24 hours
     failed_login_attempts: int  # Last 24 hours
 
-    class Config:
-        from_attributes = True
 
-
-class SystemStats(BaseModel):
+@dataclass(config=ConfigDict(defer_build=True, from_attributes=True), slots=True, frozen=True)
+class SystemStats:
     total_configurations: int
     active_configurations: int
     public_configurations: int
     recent_changes: int  # Last 24 hours
-    critical_notifications: int
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    critical_notifications: int
\ No newline at end of file
@@ -1,24 +1,38 @@
 # app/schemas/ai_tools.py
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, Literal, Annotated
+import re
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, SkipValidation
+from pydantic.dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
 
+# ISO 639-1 code with an optional region, e.g. "en" or "fr-CA"
+_LANGUAGE_RE = re.compile(r"^[a-z]{2}(-[A-Z]{2})?$")
+
+
+def _check_language(v: str) -> str:
+    if not _LANGUAGE_RE.match(v):
+        raise ValueError(f"Invalid language code: {v}")
+    return v
+
+
+LanguageCode = Annotated[str, AfterValidator(_check_language)]
+
+
 # CV Analysis Schemas
 class CVAnalysisRequest(BaseModel):
     cv_text: str = Field(..., description="Raw CV text to analyze")
     candidate_id: Optional[UUID] = Field(None, description="Associate with existing candidate")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 class CVAnalysisResponse(BaseModel):
     skills: List[str] = Field(default_factory=list)
     skill_ids: List[UUID] = Field(default_factory=list)
-    education: List[Dict[str, Any]] = Field(default_factory=list)
-    experience: List[Dict[str, Any]] = Field(default_factory=list)
+    education: SkipValidation[List[Dict[str, Any]]] = Field(default_factory=list)
+    experience: SkipValidation[List[Dict[str, Any]]] = Field(default_factory=list)
     total_experience_years: int = 0
     summary: str = ""
     analysis_method: str = Field("openai", description="Method used for analysis")
@@ -27,8 +41,7 @@ class CVAnalysisResponse(BaseModel):
     confidence_score: Optional[float] = Field(None, ge=0, le=1)
     processing_time: Optional[float] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 # Job Matching Schemas
@@ -39,8 +52,7 @@ class JobMatchRequest(BaseModel):
     max_jobs_to_match: int = Field(5, ge=1, le=20)
     min_match_score: Optional[float] = Field(0.5, ge=0, le=1)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True, extra='forbid')
 
 
 class JobMatchResult(BaseModel):
@@ -54,29 +66,25 @@ class JobMatchResult(BaseModel):
     improvement_suggestion: str
     match_method: str = "openai"
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
-class JobMatchResponse(BaseModel):
+@dataclass(config=ConfigDict(defer_build=True, from_attributes=True), slots=True)
+class JobMatchResponse:
     matches: List[JobMatchResult]
     total_jobs_analyzed: int
     processing_time: Optional[float] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Email Generation Schemas
 class EmailGenerationRequest(BaseModel):
     template_id: Optional[UUID] = Field(None, description="Use existing template")
     template_type: Optional[str] = Field(None, description="Type of email to generate")
     context: Dict[str, Any] = Field(..., description="Variables for template")
-    tone: Optional[str] = Field("professional", pattern="^(professional|casual|formal)$")
-    language: Optional[str] = Field("en", max_length=5)
+    tone: Optional[Literal["professional", "casual", "formal"]] = "professional"
+    language: Optional[LanguageCode] = "en"
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 class EmailGenerationResponse(BaseModel):
@@ -86,8 +94,7 @@ class EmailGenerationResponse(BaseModel):
     variables_used: List[str] = Field(default_factory=list)
     generation_method: str = "openai"
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 # Interview Questions Schemas
@@ -101,21 +108,19 @@ class InterviewQuestionsRequest(BaseModel):
     include_technical: bool = True
     include_behavioral: bool = True
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True, extra='forbid')
 
 
 class InterviewQuestion(BaseModel):
     question: str
-    question_type: str = Field(..., pattern="^(technical|behavioral|situational|cultural)$")
-    difficulty: str = Field(..., pattern="^(easy|medium|hard)$")
+    question_type: Literal["technical", "behavioral", "situational", "cultural"]
+    difficulty: Literal["easy", "medium", "hard"]
     purpose: str
     evaluation_guidance: str
     expected_time_minutes: Optional[int] = Field(None, ge=1, le=30)
     follow_up_questions: Optional[List[str]] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 class InterviewQuestionsResponse(BaseModel):
@@ -123,8 +128,7 @@ class InterviewQuestionsResponse(BaseModel):
     total_estimated_time_minutes: int
     generation_method: str = "openai"
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 # Job Description Generation Schemas
@@ -138,10 +142,9 @@ class JobDescriptionRequest(BaseModel):
     location: Optional[str] = None
     is_remote: Optional[bool] = False
     salary_range: Optional[Dict[str, float]] = None
-    tone: Optional[str] = Field("professional", pattern="^(professional|casual|startup|corporate)$")
+    tone: Optional[Literal["professional", "casual", "startup", "corporate"]] = "professional"
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 class JobDescriptionResponse(BaseModel):
@@ -159,20 +162,18 @@ class JobDescriptionResponse(BaseModel):
     generation_method: str = "openai"
     seo_keywords: Optional[List[str]] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 # Candidate Feedback Schemas
 class CandidateFeedbackRequest(BaseModel):
     candidate_id: UUID
     application_id: Optional[UUID] = None
-    feedback_type: str = Field(..., pattern="^(interview|rejection|general|improvement)$")
+    feedback_type: Literal["interview", "rejection", "general", "improvement"]
     specific_areas: Optional[List[str]] = None
     include_recommendations: bool = True
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 class CandidateFeedbackResponse(BaseModel):
@@ -183,20 +184,18 @@ class CandidateFeedbackResponse(BaseModel):
     resources: Optional[List[Dict[str, str]]] = None
     generation_method: str = "openai"
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 # Skills Extraction Schemas  
 class SkillsExtractionRequest(BaseModel):
     text: str = Field(..., description="Text to extract skills from")
-    context_type: str = Field("cv", pattern="^(cv|job_description|profile)$")
+    context_type: Literal["cv", "job_description", "profile"] = "cv"
     include_soft_skills: bool = True
     include_technical_skills: bool = True
     match_to_database: bool = True
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True, extra='forbid')
 
 
 class ExtractedSkill(BaseModel):
@@ -206,15 +205,12 @@ class ExtractedSkill(BaseModel):
     confidence: float = Field(..., ge=0, le=1)
     context: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
-class SkillsExtractionResponse(BaseModel):
+@dataclass(config=ConfigDict(defer_build=True, from_attributes=True), slots=True)
+class SkillsExtractionResponse:
     technical_skills: List[ExtractedSkill]
     soft_skills: List[ExtractedSkill]
     unmatched_skills: List[str]
-    extraction_method: str = "openai"
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    extraction_method: str = "openai"
\ No newline at end of file
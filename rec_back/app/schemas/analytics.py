@@ -1,5 +1,7 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Dict, Any, Literal
+from typing_extensions import TypedDict
 from datetime import datetime, date
 from uuid import UUID
 
@@ -18,7 +20,10 @@ class AnalyticsFilters(BaseModel):
 
 
 # Response schemas for analytics data
-class OverviewMetrics(BaseModel):
+# Leaf metric groups are plain slotted dataclasses; the response models that
+# contain them still validate the service's dicts into them
+@dataclass(slots=True, frozen=True)
+class OverviewMetrics:
     total_users: int
     total_candidates: int
     total_companies: int
@@ -26,34 +31,46 @@ class OverviewMetrics(BaseModel):
     total_applications: int
 
 
-class ActiveMetrics(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ActiveMetrics:
     active_jobs: int
     new_applications: int
     hired_count: int
     application_growth_percent: float
 
 
-class ConversionRates(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ConversionRates:
     application_to_review: float
     review_to_interview: float
     interview_to_offer: float
     offer_to_hire: float
 
 
+# pydantic needs typing_extensions.TypedDict before Python 3.12
+class DashboardPeriod(TypedDict):
+    start_date: str  # ISO format
+    end_date: str
+
+
 class DashboardOverviewResponse(BaseModel):
     overview: OverviewMetrics
     active_metrics: ActiveMetrics
     conversion_rates: ConversionRates
-    period: Dict[str, str]  # start_date, end_date as ISO strings
+    period: DashboardPeriod
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
 
-class ApplicationConversionRates(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class ApplicationConversionRates:
     application_to_interview: float
     interview_to_offer: float
     offer_to_hire: float
 
 
-class TimeMetrics(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TimeMetrics:
     average_time_to_hire_days: float
     applications_this_month: int
 
@@ -66,6 +83,8 @@ class ApplicationAnalyticsResponse(BaseModel):
     monthly_trends: Dict[str, int]
     source_analysis: Dict[str, int]
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
 
 class JobPerformanceItem(BaseModel):
     job_id: str
@@ -74,14 +93,18 @@ class JobPerformanceItem(BaseModel):
     created_at: str
     status: str
 
+    model_config = ConfigDict(frozen=True)
 
-class JobPerformanceMetrics(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class JobPerformanceMetrics:
     average_applications_per_job: float
     average_time_to_fill_days: float
     fill_rate: float
 
 
-class SkillDemandItem(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SkillDemandItem:
     skill: str
     demand_count: int
 
@@ -94,13 +117,17 @@ class JobAnalyticsResponse(BaseModel):
     skills_in_demand: List[SkillDemandItem]
     monthly_job_postings: Dict[str, int]
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
 
-class CandidateSuccessMetrics(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CandidateSuccessMetrics:
     average_applications_per_candidate: float
     average_success_rate: float
 
 
-class CandidateSkillItem(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CandidateSkillItem:
     skill: str
     candidate_count: int
 
@@ -114,6 +141,8 @@ class CandidateAnalyticsResponse(BaseModel):
     success_metrics: CandidateSuccessMetrics
     monthly_registrations: Dict[str, int]
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
 
 class ConsultantPerformanceItem(BaseModel):
     consultant_id: str
@@ -123,8 +152,11 @@ class ConsultantPerformanceItem(BaseModel):
     hire_rate: float
     interview_rate: float
 
+    model_config = ConfigDict(frozen=True)
+
 
-class ConsultantOverallMetrics(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ConsultantOverallMetrics:
     total_applications: int
     total_hired: int
     average_hire_rate: float
@@ -135,6 +167,8 @@ class ConsultantAnalyticsResponse(BaseModel):
     consultant_performance: List[ConsultantPerformanceItem]
     overall_metrics: ConsultantOverallMetrics
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
 
 class CompanyPerformanceItem(BaseModel):
     company_id: str
@@ -145,31 +179,36 @@ class CompanyPerformanceItem(BaseModel):
     hire_rate: float
     avg_applications_per_job: float
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CompanyAnalyticsResponse(BaseModel):
     total_companies: int
     company_performance: List[CompanyPerformanceItem]
     top_hiring_companies: List[CompanyPerformanceItem]
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
 
 # Custom report request schemas
 class CustomReportRequest(BaseModel):
     report_type: str = Field(..., description="Type of report to generate")
     filters: AnalyticsFilters
     metrics: List[str] = Field(..., description="List of metrics to include")
-    format: Optional[str] = Field("json", description="Output format (json, csv, excel)")
+    format: Optional[Literal["json", "csv", "excel"]] = Field("json", description="Output format")
 
 
 class ReportScheduleRequest(BaseModel):
     report_type: str
     filters: AnalyticsFilters
-    schedule_frequency: str = Field(..., description="daily, weekly, monthly")
+    schedule_frequency: Literal["daily", "weekly", "monthly"]
     recipients: List[str] = Field(..., description="Email addresses to send report")
     next_run_date: datetime
 
 
 # Trend analysis schemas
-class TrendDataPoint(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TrendDataPoint:
     date: str
     value: float
     metric_name: str
@@ -179,9 +218,11 @@ class TrendAnalysisResponse(BaseModel):
     metric_name: str
     period: str
     data_points: List[TrendDataPoint]
-    trend_direction: str  # "increasing", "decreasing", "stable"
+    trend_direction: Literal["increasing", "decreasing", "stable"]
     growth_rate: float
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
 
 # Benchmark comparison schemas
 class BenchmarkMetrics(BaseModel):
@@ -189,7 +230,9 @@ class BenchmarkMetrics(BaseModel):
     current_value: float
     industry_average: float
     percentile_rank: Optional[int] = None
-    comparison: str  # "above_average", "below_average", "average"
+    comparison: Literal["above_average", "below_average", "average"]
+
+    model_config = ConfigDict(frozen=True)
 
 
 class BenchmarkResponse(BaseModel):
@@ -197,6 +240,8 @@ class BenchmarkResponse(BaseModel):
     metrics: List[BenchmarkMetrics]
     overall_performance_score: float
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
 
 # Export schemas
 class ExportRequest(BaseModel):
@@ -210,4 +255,6 @@ class ExportResponse(BaseModel):
     export_id: str
     download_url: str
     expires_at: datetime
-    file_size_mb: float
\ No newline at end of file
+    file_size_mb: float
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
\ No newline at end of file
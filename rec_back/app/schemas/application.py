@@ -1,7 +1,9 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime, date
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, TypeAdapter
 from uuid import UUID
+from app.schemas._base import BaseSchema, Pagination, make_partial
+from app.schemas.types import Interned
 from app.models.enums import ApplicationStatus
 
 
@@ -16,7 +18,7 @@ class ApplicationStatusHistoryCreate(ApplicationStatusHistoryBase):
     application_id: UUID
 
 
-class ApplicationStatusHistory(ApplicationStatusHistoryBase):
+class ApplicationStatusHistory(ApplicationStatusHistoryBase, BaseSchema):
     id: UUID
     application_id: UUID
     changed_at: datetime
@@ -24,9 +26,6 @@ class ApplicationStatusHistory(ApplicationStatusHistoryBase):
     # Changed by user info (populated via join)
     changed_by_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Base schemas for Application Notes
 class ApplicationNoteBase(BaseModel):
@@ -39,11 +38,10 @@ class ApplicationNoteCreate(ApplicationNoteBase):
     consultant_id: UUID
 
 
-class ApplicationNoteUpdate(ApplicationNoteBase):
-    note_text: Optional[str] = Field(None, min_length=1)
+ApplicationNoteUpdate = make_partial(ApplicationNoteBase, "ApplicationNoteUpdate")
 
 
-class ApplicationNote(ApplicationNoteBase):
+class ApplicationNote(ApplicationNoteBase, BaseSchema):
     id: UUID
     application_id: UUID
     consultant_id: UUID
@@ -53,9 +51,6 @@ class ApplicationNote(ApplicationNoteBase):
     # Relationships
     consultant_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Base schemas for Applications
 class ApplicationBase(BaseModel):
@@ -65,21 +60,21 @@ class ApplicationBase(BaseModel):
     portfolio_url: Optional[str] = Field(None, max_length=500)
     
     # Application details
-    source: Optional[str] = Field("website", max_length=50)  # website, linkedin, referral, etc.
+    source: Optional[Interned] = Field("website", max_length=50)  # website, linkedin, referral, etc.
     referral_source: Optional[str] = Field(None, max_length=200)
     
     # Interview information
     interview_date: Optional[datetime] = None
-    interview_type: Optional[str] = Field(None, pattern="^(phone|video|in_person|panel)$")
+    interview_type: Optional[Literal["phone", "video", "in_person", "panel"]] = None
     interview_feedback: Optional[str] = None
     interview_rating: Optional[int] = Field(None, ge=1, le=5)
     
     # Offer information
     offer_salary: Optional[float] = Field(None, ge=0)
-    offer_currency: Optional[str] = Field("EUR", max_length=3)
+    offer_currency: Optional[Interned] = Field("EUR", max_length=3)
     offer_date: Optional[date] = None
     offer_expiry_date: Optional[date] = None
-    offer_response: Optional[str] = Field(None, pattern="^(pending|accepted|rejected|negotiating)$")
+    offer_response: Optional[Literal["pending", "accepted", "rejected", "negotiating"]] = None
     
     # Feedback and notes
     candidate_feedback: Optional[str] = None
@@ -90,8 +85,8 @@ class ApplicationBase(BaseModel):
     rejection_reason: Optional[str] = None
     rejection_feedback: Optional[str] = None
     
-    # Additional metadata
-    application_metadata: Optional[Dict[str, Any]] = None
+    # Additional metadata (JSONB blob, passed through without walking it)
+    application_metadata: Optional[SkipValidation[Dict[str, Any]]] = None
 
 
 class ApplicationCreate(ApplicationBase):
@@ -104,7 +99,7 @@ class ApplicationUpdate(ApplicationBase):
     consultant_id: Optional[UUID] = None
 
 
-class Application(ApplicationBase):
+class Application(ApplicationBase, BaseSchema):
     id: UUID
     candidate_id: UUID
     job_id: UUID
@@ -119,9 +114,6 @@ class Application(ApplicationBase):
     status_history: Optional[List[ApplicationStatusHistory]] = None
     notes: Optional[List[ApplicationNote]] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Application with detailed information
 class ApplicationWithDetails(Application):
@@ -138,12 +130,11 @@ class ApplicationWithDetails(Application):
     # Consultant information
     consultant_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True)
 
 
 # Search and filter schemas
-class ApplicationSearchFilters(BaseModel):
+class ApplicationSearchFilters(Pagination):
     query: Optional[str] = Field(None, description="General search query")
     candidate_id: Optional[UUID] = Field(None, description="Filter by candidate")
     job_id: Optional[UUID] = Field(None, description="Filter by job")
@@ -157,28 +148,25 @@ class ApplicationSearchFilters(BaseModel):
     applied_after: Optional[date] = Field(None, description="Applied after date")
     applied_before: Optional[date] = Field(None, description="Applied before date")
     
-    # Pagination
-    page: int = Field(1, ge=1)
-    page_size: int = Field(20, ge=1, le=100)
-    
     # Sorting
-    sort_by: Optional[str] = Field("applied_at", pattern="^(applied_at|last_updated|status|candidate_name|job_title)$")
-    sort_order: Optional[str] = Field("desc", pattern="^(asc|desc)$")
+    sort_by: Optional[Literal["applied_at", "last_updated", "status", "candidate_name", "job_title"]] = "applied_at"
+    sort_order: Optional[Literal["asc", "desc"]] = "desc"
 
 
-class ApplicationListResponse(BaseModel):
+# Validates a whole page of ORM applications in one call
+application_list_adapter = TypeAdapter(List[ApplicationWithDetails], config=ConfigDict(defer_build=True))
+
+
+class ApplicationListResponse(BaseSchema):
     applications: List[ApplicationWithDetails]
     total: int
     page: int
     page_size: int
     total_pages: int
 
-    class Config:
-        from_attributes = True
-
 
 # Application statistics
-class ApplicationStats(BaseModel):
+class ApplicationStats(BaseSchema):
     total_applications: int
     new_applications: int
     under_review: int
@@ -201,9 +189,6 @@ class ApplicationStats(BaseModel):
     avg_time_to_offer: Optional[float] = None
     avg_time_to_hire: Optional[float] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Bulk application operations
 class BulkApplicationUpdate(BaseModel):
@@ -229,7 +214,7 @@ class ApplicationStatusChange(BaseModel):
 
 class ScheduleInterview(BaseModel):
     interview_date: datetime
-    interview_type: str = Field(..., pattern="^(phone|video|in_person|panel)$")
+    interview_type: Literal["phone", "video", "in_person", "panel"]
     location: Optional[str] = None
     notes: Optional[str] = None
     notify_candidate: Optional[bool] = True
@@ -237,7 +222,7 @@ class ScheduleInterview(BaseModel):
 
 class MakeOffer(BaseModel):
     salary_amount: float = Field(..., ge=0)
-    currency: str = Field("EUR", max_length=3)
+    currency: Interned = Field("EUR", max_length=3)
     start_date: Optional[date] = None
     offer_expiry_date: Optional[date] = None
     benefits: Optional[List[str]] = None
@@ -1,19 +1,21 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 from typing import Optional
+from functools import cached_property
 from datetime import datetime
 from uuid import UUID
 from app.models.enums import UserRole
+from app.schemas.types import Email
 
 # Request schemas
 class LoginRequest(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
 
 class RefreshTokenRequest(BaseModel):
     refresh_token: str
 
 class RegisterRequest(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
     first_name: str
     last_name: str
@@ -33,13 +35,13 @@ class UserResponse(BaseModel):
     created_at: datetime
     last_login: Optional[datetime] = None
     
-    # Computed field for backwards compatibility
-    @property
+    # Computed field for backwards compatibility, built once per instance
+    @computed_field
+    @cached_property
     def name(self) -> str:
         return f"{self.first_name} {self.last_name}"
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class TokenResponse(BaseModel):
     access_token: str
@@ -47,15 +49,23 @@ class TokenResponse(BaseModel):
     token_type: str = "bearer"
     expires_in: int
 
+    model_config = ConfigDict(frozen=True)
+
 class LoginResponse(BaseModel):
     user: UserResponse
     tokens: TokenResponse
 
+    model_config = ConfigDict(frozen=True)
+
 class RefreshResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
     expires_in: int
 
+    model_config = ConfigDict(frozen=True)
+
 class AuthStatusResponse(BaseModel):
     is_authenticated: bool
-    user: Optional[UserResponse] = None
\ No newline at end of file
+    user: Optional[UserResponse] = None
+
+    model_config = ConfigDict(frozen=True)
\ No newline at end of file
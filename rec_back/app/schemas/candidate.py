@@ -1,9 +1,13 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Literal
+from typing_extensions import TypedDict
 from datetime import datetime, date
 from decimal import Decimal
-from pydantic import BaseModel, field_validator, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, TypeAdapter, Field, AliasChoices
 from uuid import UUID
 
+from app.schemas._base import BaseSchema, Pagination, make_partial
+from app.schemas.types import Interned, Money
+
 
 # Base schemas
 class CandidateJobPreferenceBase(BaseModel):
@@ -25,15 +29,12 @@ class CandidateJobPreferenceUpdate(CandidateJobPreferenceBase):
     pass
 
 
-class CandidateJobPreference(CandidateJobPreferenceBase):
+class CandidateJobPreference(CandidateJobPreferenceBase, BaseSchema):
     id: UUID
     candidate_id: UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Notification Settings schemas
 class CandidateNotificationSettingsBase(BaseModel):
@@ -50,20 +51,18 @@ class CandidateNotificationSettingsUpdate(CandidateNotificationSettingsBase):
     pass
 
 
-class CandidateNotificationSettings(CandidateNotificationSettingsBase):
+class CandidateNotificationSettings(CandidateNotificationSettingsBase, BaseSchema):
+    # Settings are stored on the candidate profile, so both ids are the profile id
     id: UUID
-    candidate_id: UUID
+    candidate_id: UUID = Field(validation_alias=AliasChoices("candidate_id", "id"))
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Candidate Skill schemas
 class CandidateSkillBase(BaseModel):
     skill_id: UUID
-    proficiency_level: Optional[str] = Field(None, pattern="^(Beginner|Intermediate|Advanced|Expert)$")
+    proficiency_level: Optional[Literal["Beginner", "Intermediate", "Advanced", "Expert"]] = None
     years_experience: Optional[int] = Field(None, ge=0, le=50)
 
 
@@ -71,11 +70,10 @@ class CandidateSkillCreate(CandidateSkillBase):
     candidate_id: UUID
 
 
-class CandidateSkillUpdate(CandidateSkillBase):
-    skill_id: Optional[UUID] = None
+CandidateSkillUpdate = make_partial(CandidateSkillBase, "CandidateSkillUpdate")
 
 
-class CandidateSkill(CandidateSkillBase):
+class CandidateSkill(CandidateSkillBase, BaseSchema):
     id: UUID
     candidate_id: UUID
     created_at: datetime
@@ -84,9 +82,6 @@ class CandidateSkill(CandidateSkillBase):
     # Relationships
     skill_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Education schemas
 class EducationBase(BaseModel):
@@ -104,20 +99,15 @@ class EducationCreate(EducationBase):
     candidate_id: UUID
 
 
-class EducationUpdate(EducationBase):
-    institution: Optional[str] = Field(None, min_length=1, max_length=200)
-    degree: Optional[str] = Field(None, min_length=1, max_length=100)
+EducationUpdate = make_partial(EducationBase, "EducationUpdate")
 
 
-class Education(EducationBase):
+class Education(EducationBase, BaseSchema):
     id: UUID
     candidate_id: UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Work Experience schemas
 class WorkExperienceBase(BaseModel):
@@ -127,7 +117,7 @@ class WorkExperienceBase(BaseModel):
     start_date: Optional[date] = None
     end_date: Optional[date] = None
     is_current: Optional[bool] = False
-    salary: Optional[Decimal] = Field(None, ge=0)
+    salary: Optional[Money] = None
     description: Optional[str] = None
     achievements: Optional[List[str]] = None
     technologies_used: Optional[List[str]] = None
@@ -138,19 +128,45 @@ class WorkExperienceCreate(WorkExperienceBase):
     candidate_id: UUID
 
 
-class WorkExperienceUpdate(WorkExperienceBase):
-    company_name: Optional[str] = Field(None, min_length=1, max_length=200)
-    position: Optional[str] = Field(None, min_length=1, max_length=100)
+WorkExperienceUpdate = make_partial(WorkExperienceBase, "WorkExperienceUpdate")
 
 
-class WorkExperience(WorkExperienceBase):
+class WorkExperience(WorkExperienceBase, BaseSchema):
     id: UUID
     candidate_id: UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+
+# Entries of the candidate profile's JSONB arrays. Every key is optional, as
+# in the stored documents; dates are kept as the strings they are stored as
+class LanguageEntry(TypedDict, total=False):
+    language: str
+    proficiency: str
+
+
+class CertificationEntry(TypedDict, total=False):
+    name: str
+    issuer: str
+    date: str
+    expiry_date: str
+    credential_id: str
+    url: str
+
+
+class AwardEntry(TypedDict, total=False):
+    title: str
+    issuer: str
+    date: str
+    description: str
+
+
+class PublicationEntry(TypedDict, total=False):
+    title: str
+    publisher: str
+    date: str
+    url: str
+    description: str
 
 
 # Candidate Profile schemas
@@ -162,10 +178,10 @@ class CandidateProfileBase(BaseModel):
     
     # Personal information
     date_of_birth: Optional[date] = None
-    nationality: Optional[str] = Field(None, max_length=100)
+    nationality: Optional[Interned] = Field(None, max_length=100)
     address: Optional[str] = Field(None, max_length=500)
     city: Optional[str] = Field(None, max_length=100)
-    country: Optional[str] = Field(None, max_length=100)
+    country: Optional[Interned] = Field(None, max_length=100)
     postal_code: Optional[str] = Field(None, max_length=20)
     
     # Professional information
@@ -174,28 +190,22 @@ class CandidateProfileBase(BaseModel):
     years_of_experience: Optional[int] = Field(None, ge=0, le=50)
     
     # CV and documents
-    cv_urls: Optional[List[str]] = None
+    cv_urls: Optional[List[str]] = Field(None, max_length=5)  # Maximum 5 CV files
     cover_letter_url: Optional[str] = Field(None, max_length=500)
     
     # Additional information
-    languages: Optional[List[Dict[str, Any]]] = None
-    certifications: Optional[List[Dict[str, Any]]] = None
-    awards: Optional[List[Dict[str, Any]]] = None
-    publications: Optional[List[Dict[str, Any]]] = None
+    languages: Optional[List[LanguageEntry]] = None
+    certifications: Optional[List[CertificationEntry]] = None
+    awards: Optional[List[AwardEntry]] = None
+    publications: Optional[List[PublicationEntry]] = None
     
     # Visibility and settings
-    profile_visibility: Optional[str] = Field("public", pattern="^(public|private|semi_private)$")
+    profile_visibility: Optional[Literal["public", "private", "semi_private"]] = "public"
     is_open_to_opportunities: Optional[bool] = True
     
     # Notes
     notes: Optional[str] = None
 
-    @field_validator('cv_urls')
-    def validate_cv_urls(cls, v):
-        if v is not None and len(v) > 5:
-            raise ValueError('Maximum 5 CV files allowed')
-        return v
-
 
 class CandidateProfileCreate(CandidateProfileBase):
     user_id: UUID
@@ -205,7 +215,7 @@ class CandidateProfileUpdate(CandidateProfileBase):
     pass
 
 
-class CandidateProfile(CandidateProfileBase):
+class CandidateProfile(CandidateProfileBase, BaseSchema):
     id: UUID
     user_id: UUID
     created_at: datetime
@@ -218,15 +228,12 @@ class CandidateProfile(CandidateProfileBase):
     skills: Optional[List[CandidateSkill]] = None
     notification_settings: Optional[CandidateNotificationSettings] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Comprehensive candidate response with user info
-class CandidateFullProfile(BaseModel):
+class CandidateFullProfile(BaseSchema):
     # User information
     id: UUID
-    email: EmailStr
+    email: str
     first_name: str
     last_name: str
     phone: Optional[str] = None
@@ -238,12 +245,11 @@ class CandidateFullProfile(BaseModel):
     # Profile information
     profile: Optional[CandidateProfile] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True)
 
 
 # Search and filter schemas
-class CandidateSearchFilters(BaseModel):
+class CandidateSearchFilters(Pagination):
     query: Optional[str] = Field(None, description="General search query")
     skills: Optional[List[str]] = Field(None, description="Required skills")
     experience_min: Optional[int] = Field(None, ge=0, description="Minimum years of experience")
@@ -251,26 +257,23 @@ class CandidateSearchFilters(BaseModel):
     locations: Optional[List[str]] = Field(None, description="Preferred locations")
     industries: Optional[List[str]] = Field(None, description="Industry experience")
     education_level: Optional[str] = Field(None, description="Minimum education level")
-    availability: Optional[str] = Field(None, pattern="^(immediate|1_week|2_weeks|1_month|3_months)$")
+    availability: Optional[Literal["immediate", "1_week", "2_weeks", "1_month", "3_months"]] = None
     remote_only: Optional[bool] = Field(None, description="Remote work only")
-    salary_min: Optional[Decimal] = Field(None, ge=0, description="Minimum salary expectation")
-    salary_max: Optional[Decimal] = Field(None, ge=0, description="Maximum salary expectation")
-    
-    # Pagination
-    page: int = Field(1, ge=1)
-    page_size: int = Field(20, ge=1, le=100)
+    salary_min: Optional[Money] = Field(None, description="Minimum salary expectation")
+    salary_max: Optional[Money] = Field(None, description="Maximum salary expectation")
     
     # Sorting
-    sort_by: Optional[str] = Field("created_at", pattern="^(created_at|updated_at|experience|relevance)$")
-    sort_order: Optional[str] = Field("desc", pattern="^(asc|desc)$")
+    sort_by: Optional[Literal["created_at", "updated_at", "experience", "relevance"]] = "created_at"
+    sort_order: Optional[Literal["asc", "desc"]] = "desc"
+
 
+# Validates a whole page of ORM profiles in one call
+candidate_profile_list_adapter = TypeAdapter(List[CandidateFullProfile], config=ConfigDict(defer_build=True))
 
-class CandidateListResponse(BaseModel):
+
+class CandidateListResponse(BaseSchema):
     candidates: List[CandidateFullProfile]
     total: int
     page: int
     page_size: int
-    total_pages: int
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    total_pages: int
\ No newline at end of file
@@ -1,9 +1,11 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime, date
 from decimal import Decimal
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, TypeAdapter
 from uuid import UUID
+from app.schemas._base import BaseSchema, Pagination, make_partial
 from app.models.enums import ConsultantStatus
+from app.schemas.types import Rate
 
 
 # Base schemas for Consultant Profile
@@ -12,8 +14,9 @@ class ConsultantProfileBase(BaseModel):
     specialization: Optional[str] = Field(None, max_length=200)
     experience_years: Optional[int] = Field(None, ge=0, le=50)
     status: Optional[ConsultantStatus] = ConsultantStatus.ACTIVE
-    commission_rate: Optional[Decimal] = Field(None, ge=0, le=1)
-    contact_info: Optional[Dict[str, Any]] = None
+    commission_rate: Optional[Rate] = None
+    # JSONB blob, passed through without walking it key by key
+    contact_info: Optional[SkipValidation[Dict[str, Any]]] = None
     bio: Optional[str] = None
     skills: Optional[List[str]] = None
     certifications: Optional[List[str]] = None
@@ -24,25 +27,21 @@ class ConsultantProfileCreate(ConsultantProfileBase):
     pass
 
 
-class ConsultantProfileUpdate(ConsultantProfileBase):
-    user_id: Optional[UUID] = None
+ConsultantProfileUpdate = make_partial(ConsultantProfileBase, "ConsultantProfileUpdate")
 
 
-class ConsultantProfile(ConsultantProfileBase):
+class ConsultantProfile(ConsultantProfileBase, BaseSchema):
     id: UUID
     total_placements: Optional[int] = 0
     total_earnings: Optional[Decimal] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Consultant Target schemas
 class ConsultantTargetBase(BaseModel):
     consultant_id: UUID
-    target_type: str = Field(..., pattern="^(monthly|quarterly|yearly)$")
+    target_type: Literal["monthly", "quarterly", "yearly"]
     target_value: Decimal = Field(..., ge=0)
     target_period: str
     achieved_value: Optional[Decimal] = Field(0, ge=0)
@@ -52,21 +51,14 @@ class ConsultantTargetCreate(ConsultantTargetBase):
     pass
 
 
-class ConsultantTargetUpdate(ConsultantTargetBase):
-    consultant_id: Optional[UUID] = None
-    target_type: Optional[str] = Field(None, pattern="^(monthly|quarterly|yearly)$")
-    target_value: Optional[Decimal] = Field(None, ge=0)
-    target_period: Optional[str] = None
+ConsultantTargetUpdate = make_partial(ConsultantTargetBase, "ConsultantTargetUpdate")
 
 
-class ConsultantTarget(ConsultantTargetBase):
+class ConsultantTarget(ConsultantTargetBase, BaseSchema):
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Performance Review schemas
 class ConsultantPerformanceReviewBase(BaseModel):
@@ -77,27 +69,21 @@ class ConsultantPerformanceReviewBase(BaseModel):
     strengths: Optional[str] = None
     areas_for_improvement: Optional[str] = None
     goals_next_period: Optional[str] = None
-    overall_rating: Optional[str] = Field(None, pattern="^(excellent|good|satisfactory|needs_improvement|unsatisfactory)$")
+    overall_rating: Optional[Literal["excellent", "good", "satisfactory", "needs_improvement", "unsatisfactory"]] = None
 
 
 class ConsultantPerformanceReviewCreate(ConsultantPerformanceReviewBase):
     pass
 
 
-class ConsultantPerformanceReviewUpdate(ConsultantPerformanceReviewBase):
-    consultant_id: Optional[UUID] = None
-    reviewer_id: Optional[UUID] = None
-    review_period: Optional[str] = None
+ConsultantPerformanceReviewUpdate = make_partial(ConsultantPerformanceReviewBase, "ConsultantPerformanceReviewUpdate")
 
 
-class ConsultantPerformanceReview(ConsultantPerformanceReviewBase):
+class ConsultantPerformanceReview(ConsultantPerformanceReviewBase, BaseSchema):
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Consultant-Candidate Association schemas
 class ConsultantCandidateBase(BaseModel):
@@ -114,7 +100,7 @@ class ConsultantCandidateUpdate(ConsultantCandidateBase):
     pass
 
 
-class ConsultantCandidate(ConsultantCandidateBase):
+class ConsultantCandidate(ConsultantCandidateBase, BaseSchema):
     id: UUID
     consultant_id: UUID
     candidate_id: UUID
@@ -126,9 +112,6 @@ class ConsultantCandidate(ConsultantCandidateBase):
     candidate_name: Optional[str] = None
     consultant_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Consultant-Client Association schemas
 class ConsultantClientBase(BaseModel):
@@ -146,7 +129,7 @@ class ConsultantClientUpdate(ConsultantClientBase):
     pass
 
 
-class ConsultantClient(ConsultantClientBase):
+class ConsultantClient(ConsultantClientBase, BaseSchema):
     id: UUID
     consultant_id: UUID
     company_id: UUID
@@ -158,39 +141,33 @@ class ConsultantClient(ConsultantClientBase):
     company_name: Optional[str] = None
     consultant_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Search and filter schemas
-class ConsultantSearchFilters(BaseModel):
+class ConsultantSearchFilters(Pagination):
     status: Optional[ConsultantStatus] = None
     specialization: Optional[str] = None
     min_experience_years: Optional[int] = Field(None, ge=0)
     max_experience_years: Optional[int] = Field(None, ge=0)
     skills: Optional[List[str]] = None
-    min_commission_rate: Optional[Decimal] = Field(None, ge=0, le=1)
-    max_commission_rate: Optional[Decimal] = Field(None, ge=0, le=1)
+    min_commission_rate: Optional[Rate] = None
+    max_commission_rate: Optional[Rate] = None
     languages: Optional[List[str]] = None
     
-    # Pagination
-    page: int = Field(1, ge=1)
-    page_size: int = Field(20, ge=1, le=100)
-    
     # Sorting
-    sort_by: Optional[str] = Field("created_at", pattern="^(created_at|updated_at|experience_years|total_placements)$")
-    sort_order: Optional[str] = Field("desc", pattern="^(asc|desc)$")
+    sort_by: Optional[Literal["created_at", "updated_at", "experience_years", "total_placements"]] = "created_at"
+    sort_order: Optional[Literal["asc", "desc"]] = "desc"
+
 
+# Validates a whole page of ORM consultants in one call
+consultant_profile_list_adapter = TypeAdapter(List[ConsultantProfile], config=ConfigDict(defer_build=True))
 
-class ConsultantListResponse(BaseModel):
+
+class ConsultantListResponse(BaseSchema):
     consultants: List[ConsultantProfile]
     total: int
     page: int
     pages: int
 
-    class Config:
-        from_attributes = True
-
 
 # Extended schemas with relationships
 class ConsultantProfileWithDetails(ConsultantProfile):
@@ -200,12 +177,11 @@ class ConsultantProfileWithDetails(ConsultantProfile):
     active_clients: Optional[int] = 0
     active_candidates: Optional[int] = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True)
 
 
 # Statistics schemas
-class ConsultantStats(BaseModel):
+class ConsultantStats(BaseSchema):
     total_consultants: int
     active_consultants: int
     top_performers: List[Dict[str, Any]]
@@ -213,5 +189,4 @@ class ConsultantStats(BaseModel):
     total_placements_this_month: int
     total_earnings_this_month: Optional[Decimal]
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(defer_build=True)
\ No newline at end of file
@@ -1,8 +1,9 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime, date
-from decimal import Decimal
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, Field, SkipValidation
 from uuid import UUID
+from app.schemas._base import BaseSchema, Pagination
+from app.schemas.types import Email, Interned, Money
 
 
 # Base schemas for Company
@@ -13,17 +14,17 @@ class CompanyBase(BaseModel):
     
     # Contact information
     website: Optional[str] = Field(None, max_length=500)
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     phone: Optional[str] = Field(None, max_length=20)
     
     # Address information
     address: Optional[str] = Field(None, max_length=500)
     city: Optional[str] = Field(None, max_length=100)
-    country: Optional[str] = Field(None, max_length=100)
+    country: Optional[Interned] = Field(None, max_length=100)
     postal_code: Optional[str] = Field(None, max_length=20)
     
     # Company details
-    company_size: Optional[str] = Field(None, pattern="^(1-10|10-50|50-200|200-1000|1000\+)$")
+    company_size: Optional[Literal["1-10", "10-50", "50-200", "200-1000", "1000+"]] = None
     founded_year: Optional[int] = Field(None, ge=1800, le=2030)
     
     # Business information
@@ -51,22 +52,21 @@ class CompanyUpdate(CompanyBase):
     name: Optional[str] = Field(None, min_length=1, max_length=200)
 
 
-class Company(CompanyBase):
+class Company(CompanyBase, BaseSchema):
     id: UUID
+    email: Optional[str] = None  # Validated on write
+    social_media: Optional[SkipValidation[Dict[str, str]]] = None
     total_employees: Optional[int] = 0
     active_jobs: Optional[int] = 0
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Base schemas for Company Contact
 class CompanyContactBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=200)
     title: Optional[str] = Field(None, max_length=100)
-    email: EmailStr
+    email: Email
     phone: Optional[str] = Field(None, max_length=20)
     is_primary: Optional[bool] = False
 
@@ -77,18 +77,16 @@ class CompanyContactCreate(CompanyContactBase):
 
 class CompanyContactUpdate(CompanyContactBase):
     name: Optional[str] = Field(None, min_length=1, max_length=200)
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
 
 
-class CompanyContact(CompanyContactBase):
+class CompanyContact(CompanyContactBase, BaseSchema):
     id: UUID
+    email: str  # Validated on write
     company_id: UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Base schemas for Company Hiring Preferences
 class CompanyHiringPreferencesBase(BaseModel):
@@ -106,15 +104,12 @@ class CompanyHiringPreferencesUpdate(CompanyHiringPreferencesBase):
     pass
 
 
-class CompanyHiringPreferences(CompanyHiringPreferencesBase):
+class CompanyHiringPreferences(CompanyHiringPreferencesBase, BaseSchema):
     id: UUID
     company_id: UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Base schemas for Recruitment History
 class RecruitmentHistoryBase(BaseModel):
@@ -132,7 +127,7 @@ class RecruitmentHistoryUpdate(RecruitmentHistoryBase):
     job_title: Optional[str] = Field(None, min_length=1, max_length=200)
 
 
-class RecruitmentHistory(RecruitmentHistoryBase):
+class RecruitmentHistory(RecruitmentHistoryBase, BaseSchema):
     id: UUID
     company_id: UUID
     created_at: datetime
@@ -141,9 +136,6 @@ class RecruitmentHistory(RecruitmentHistoryBase):
     # Relationships
     consultant_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Base schemas for Employer Profile
 class EmployerProfileBase(BaseModel):
@@ -157,11 +149,11 @@ class EmployerProfileBase(BaseModel):
     
     # Hiring information
     can_post_jobs: Optional[bool] = True
-    hiring_budget: Optional[Decimal] = Field(None, ge=0)
-    hiring_budget_currency: Optional[str] = Field("EUR", max_length=3)
+    hiring_budget: Optional[Money] = None
+    hiring_budget_currency: Optional[Interned] = Field("EUR", max_length=3)
     
     # Preferences
-    preferred_communication: Optional[str] = Field("email", pattern="^(email|phone|both)$")
+    preferred_communication: Optional[Literal["email", "phone", "both"]] = "email"
     notification_settings: Optional[Dict[str, Any]] = None
     
     # Additional information
@@ -181,24 +173,22 @@ class EmployerProfileUpdate(EmployerProfileBase):
     company_id: Optional[UUID] = None
 
 
-class EmployerProfile(EmployerProfileBase):
+class EmployerProfile(EmployerProfileBase, BaseSchema):
     id: UUID
+    notification_settings: Optional[SkipValidation[Dict[str, Any]]] = None
     user_id: UUID
     company_id: UUID
-    jobs_posted: Optional[int] = 0
-    successful_hires: Optional[int] = 0
+    jobs_posted: int = 0
+    successful_hires: int = 0
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Comprehensive employer response with user and company info
-class EmployerFullProfile(BaseModel):
+class EmployerFullProfile(BaseSchema):
     # User information
     id: UUID
-    email: EmailStr
+    email: str
     first_name: str
     last_name: str
     phone: Optional[str] = None
@@ -213,16 +203,13 @@ class EmployerFullProfile(BaseModel):
     # Company information
     company: Optional[Company] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Search and filter schemas
-class CompanySearchFilters(BaseModel):
+class CompanySearchFilters(Pagination):
     query: Optional[str] = Field(None, description="General search query")
     name: Optional[str] = Field(None, description="Company name search")
     industry: Optional[str] = Field(None, description="Industry filter")
-    company_size: Optional[str] = Field(None, description="Company size filter")
+    company_size: Optional[Literal["1-10", "10-50", "50-200", "200-1000", "1000+"]] = Field(None, description="Company size filter")
     location: Optional[str] = Field(None, description="Location filter")
     is_active: Optional[bool] = Field(None, description="Active companies only")
     is_verified: Optional[bool] = Field(None, description="Verified companies only")
@@ -230,63 +217,46 @@ class CompanySearchFilters(BaseModel):
     founded_after: Optional[int] = Field(None, description="Founded after year")
     founded_before: Optional[int] = Field(None, description="Founded before year")
     
-    # Pagination
-    page: int = Field(1, ge=1)
-    page_size: int = Field(20, ge=1, le=100)
-    
     # Sorting
-    sort_by: Optional[str] = Field("created_at", pattern="^(created_at|updated_at|name|active_jobs)$")
-    sort_order: Optional[str] = Field("desc", pattern="^(asc|desc)$")
+    sort_by: Optional[Literal["created_at", "updated_at", "name", "active_jobs"]] = "created_at"
+    sort_order: Optional[Literal["asc", "desc"]] = "desc"
 
 
-class EmployerSearchFilters(BaseModel):
+class EmployerSearchFilters(Pagination):
     query: Optional[str] = Field(None, description="General search query")
     company_id: Optional[UUID] = Field(None, description="Filter by company")
     position: Optional[str] = Field(None, description="Position filter")
     department: Optional[str] = Field(None, description="Department filter")
     can_post_jobs: Optional[bool] = Field(None, description="Can post jobs filter")
     
-    # Pagination
-    page: int = Field(1, ge=1)
-    page_size: int = Field(20, ge=1, le=100)
-    
     # Sorting
-    sort_by: Optional[str] = Field("created_at", pattern="^(created_at|updated_at|jobs_posted|successful_hires)$")
-    sort_order: Optional[str] = Field("desc", pattern="^(asc|desc)$")
+    sort_by: Optional[Literal["created_at", "updated_at", "jobs_posted", "successful_hires"]] = "created_at"
+    sort_order: Optional[Literal["asc", "desc"]] = "desc"
 
 
-class CompanyListResponse(BaseModel):
+class CompanyListResponse(BaseSchema):
     companies: List[Company]
     total: int
     page: int
     page_size: int
     total_pages: int
 
-    class Config:
-        from_attributes = True
-
 
-class EmployerListResponse(BaseModel):
+class EmployerListResponse(BaseSchema):
     employers: List[EmployerFullProfile]
     total: int
     page: int
     page_size: int
     total_pages: int
 
-    class Config:
-        from_attributes = True
-
 
 # Company statistics
-class CompanyStats(BaseModel):
+class CompanyStats(BaseSchema):
     company_id: UUID
     total_jobs_posted: int
     active_jobs: int
     total_applications: int
     total_hires: int
     average_time_to_hire: Optional[float] = None  # in days
-    top_skills_requested: List[Dict[str, Any]]
-    hiring_trends: Dict[str, Any]
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    top_skills_requested: SkipValidation[List[Dict[str, Any]]]
+    hiring_trends: SkipValidation[Dict[str, Any]]
@@ -1,17 +1,18 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal, Tuple
 from datetime import datetime, date
-from decimal import Decimal
-from pydantic import BaseModel, field_validator, Field, model_validator
+from pydantic import BaseModel, field_validator, Field, model_validator, ConfigDict, TypeAdapter
 from uuid import UUID
+from app.schemas._base import BaseSchema, Pagination
 from app.models.job import JobStatus, JobType, ExperienceLevel
 from app.models.enums import ContractType
+from app.schemas.types import Interned, Money
 
 
 # Base schemas for Job Skill Requirements
 class JobSkillRequirementBase(BaseModel):
     skill_id: UUID
     is_required: Optional[bool] = True
-    proficiency_level: Optional[str] = Field(None, pattern="^(Beginner|Intermediate|Advanced|Expert)$")
+    proficiency_level: Optional[Literal["Beginner", "Intermediate", "Advanced", "Expert"]] = None
     years_experience: Optional[int] = Field(None, ge=0, le=50)
 
 
@@ -23,15 +24,12 @@ class JobSkillRequirementUpdate(JobSkillRequirementBase):
     skill_id: Optional[UUID] = None
 
 
-class JobSkillRequirement(JobSkillRequirementBase):
+class JobSkillRequirement(JobSkillRequirementBase, BaseSchema):
     id: UUID
     job_id: UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Base schemas for Jobs
 class JobBase(BaseModel):
@@ -51,9 +49,9 @@ class JobBase(BaseModel):
     experience_level: Optional[ExperienceLevel] = ExperienceLevel.MID_LEVEL
     
     # Salary information
-    salary_min: Optional[Decimal] = Field(None, ge=0)
-    salary_max: Optional[Decimal] = Field(None, ge=0)
-    salary_currency: Optional[str] = Field("EUR", max_length=3)
+    salary_min: Optional[Money] = None
+    salary_max: Optional[Money] = None
+    salary_currency: Optional[Interned] = Field("EUR", max_length=3)
     
     # Job posting details
     deadline_date: Optional[date] = None
@@ -70,6 +68,10 @@ class JobBase(BaseModel):
     # Internal fields
     internal_notes: Optional[str] = None
 
+
+# Salary range check for request bodies only; Job is built from stored rows
+# that already passed it
+class JobSalaryRangeMixin(BaseModel):
     @model_validator(mode='after')
     def validate_salary_range(self):
         if self.salary_max is not None and self.salary_min is not None:
@@ -78,33 +80,34 @@ class JobBase(BaseModel):
         return self
 
 
-class JobCreate(JobBase):
+class JobCreate(JobBase, JobSalaryRangeMixin):
     company_id: UUID
     posted_by: UUID
 
 
-class JobUpdate(JobBase):
+class JobUpdate(JobBase, JobSalaryRangeMixin):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     status: Optional[JobStatus] = None
 
 
-class Job(JobBase):
+class Job(JobBase, BaseSchema):
     id: UUID
+    # Read-only on responses; JobCreate/JobUpdate keep lists
+    responsibilities: Optional[Tuple[str, ...]] = None
+    requirements: Optional[Tuple[str, ...]] = None
+    benefits: Optional[Tuple[str, ...]] = None
     company_id: UUID
     posted_by: UUID
     assigned_consultant_id: Optional[UUID] = None
     status: JobStatus
-    application_count: Optional[int] = 0
-    view_count: Optional[int] = 0
+    application_count: int = 0
+    view_count: int = 0
     created_at: datetime
     updated_at: datetime
     
     # Relationships
     skill_requirements: Optional[List[JobSkillRequirement]] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Job with company and poster information
 class JobWithDetails(Job):
@@ -112,47 +115,41 @@ class JobWithDetails(Job):
     posted_by_name: Optional[str] = None
     assigned_consultant_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Search and filter schemas
-class JobSearchFilters(BaseModel):
+class JobSearchFilters(Pagination):
     query: Optional[str] = Field(None, description="General search query")
     company_id: Optional[UUID] = Field(None, description="Filter by company")
     location: Optional[str] = Field(None, description="Location filter")
     is_remote: Optional[bool] = Field(None, description="Remote jobs only")
     job_type: Optional[JobType] = Field(None, description="Job type filter")
     experience_level: Optional[ExperienceLevel] = Field(None, description="Experience level filter")
-    salary_min: Optional[Decimal] = Field(None, ge=0, description="Minimum salary")
-    salary_max: Optional[Decimal] = Field(None, ge=0, description="Maximum salary")
+    salary_min: Optional[Money] = Field(None, description="Minimum salary")
+    salary_max: Optional[Money] = Field(None, description="Maximum salary")
     skills: Optional[List[str]] = Field(None, description="Required skills")
     status: Optional[JobStatus] = Field(None, description="Job status filter")
     posted_after: Optional[date] = Field(None, description="Posted after date")
     posted_before: Optional[date] = Field(None, description="Posted before date")
     
-    # Pagination
-    page: int = Field(1, ge=1)
-    page_size: int = Field(20, ge=1, le=100)
-    
     # Sorting
-    sort_by: Optional[str] = Field("created_at", pattern="^(created_at|updated_at|title|salary_min|application_count|relevance)$")
-    sort_order: Optional[str] = Field("desc", pattern="^(asc|desc)$")
+    sort_by: Optional[Literal["created_at", "updated_at", "title", "salary_min", "application_count", "relevance"]] = "created_at"
+    sort_order: Optional[Literal["asc", "desc"]] = "desc"
 
 
-class JobListResponse(BaseModel):
+# Validates a whole page of ORM jobs in one call
+job_list_adapter = TypeAdapter(List[JobWithDetails], config=ConfigDict(defer_build=True))
+
+
+class JobListResponse(BaseSchema):
     jobs: List[JobWithDetails]
     total: int
     page: int
     page_size: int
     total_pages: int
 
-    class Config:
-        from_attributes = True
-
 
 # Application-related schemas
-class JobApplicationSummary(BaseModel):
+class JobApplicationSummary(BaseSchema):
     job_id: UUID
     total_applications: int
     new_applications: int
@@ -161,6 +158,3 @@ class JobApplicationSummary(BaseModel):
     offered: int
     hired: int
     rejected: int
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
@@ -1,7 +1,8 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 from uuid import UUID
+from app.schemas._base import BaseSchema, Pagination
 from app.models.messaging import ConversationType, MessageType, MessageStatus
 
 
@@ -24,37 +25,30 @@ class ConversationUpdate(ConversationBase):
     is_pinned: Optional[bool] = None
 
 
-class Conversation(ConversationBase):
+class Conversation(ConversationBase, BaseSchema):
     id: UUID
     created_by_id: UUID
-    is_archived: Optional[bool] = False
-    is_pinned: Optional[bool] = False
-    total_messages: Optional[int] = 0
+    is_archived: bool = False
+    is_pinned: bool = False
+    total_messages: int = 0
     last_message_at: Optional[datetime] = None
     last_activity_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Conversation with participants and last message
 class ConversationWithDetails(Conversation):
     participant_count: Optional[int] = 0
-    participant_names: Optional[List[str]] = None
+    participant_names: Optional[Tuple[str, ...]] = None
     last_message_preview: Optional[str] = None
     unread_count: Optional[int] = 0
 
-    class Config:
-        from_attributes = True
-
 
 # Base schemas for Message
 class MessageBase(BaseModel):
     content: Optional[str] = None
     message_type: Optional[MessageType] = MessageType.TEXT
-    parent_message_id: Optional[UUID] = None
     reply_to_id: Optional[UUID] = None
     mentions: Optional[List[UUID]] = None
 
@@ -69,36 +63,38 @@ class MessageUpdate(MessageBase):
     is_pinned: Optional[bool] = None
 
 
-class Message(MessageBase):
+class Message(MessageBase, BaseSchema):
     id: UUID
+    mentions: Optional[Tuple[UUID, ...]] = None
     conversation_id: UUID
     sender_id: UUID
+    thread_root_id: Optional[UUID] = None
     status: MessageStatus
-    is_edited: Optional[bool] = False
-    is_deleted: Optional[bool] = False
-    is_pinned: Optional[bool] = False
-    is_system_message: Optional[bool] = False
+    is_edited: bool = False
+    is_deleted: bool = False
+    is_pinned: bool = False
+    is_system_message: bool = False
     sent_at: Optional[datetime] = None
     delivered_at: Optional[datetime] = None
     read_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
 
+# Sender display data, sent once per user alongside a page of messages
+class MessageSender(BaseSchema):
+    id: UUID
+    first_name: str
+    last_name: str
+    email: str
 
-# Message with sender details
+
+# Message with counters; sender details live in the list envelope's users map
 class MessageWithDetails(Message):
-    sender_name: Optional[str] = None
-    sender_email: Optional[str] = None
     attachment_count: Optional[int] = 0
     reaction_count: Optional[int] = 0
     reply_count: Optional[int] = 0
 
-    class Config:
-        from_attributes = True
-
 
 # Base schemas for Message Attachment
 class MessageAttachmentBase(BaseModel):
@@ -122,16 +118,13 @@ class MessageAttachmentUpdate(MessageAttachmentBase):
     file_url: Optional[str] = Field(None, max_length=500)
 
 
-class MessageAttachment(MessageAttachmentBase):
+class MessageAttachment(MessageAttachmentBase, BaseSchema):
     id: UUID
     message_id: UUID
     download_count: Optional[int] = 0
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Base schemas for Email Template
 class EmailTemplateBase(BaseModel):
@@ -161,45 +154,35 @@ class EmailTemplateUpdate(EmailTemplateBase):
     template_type: Optional[str] = Field(None, max_length=50)
 
 
-class EmailTemplate(EmailTemplateBase):
+class EmailTemplate(EmailTemplateBase, BaseSchema):
     id: UUID
     version: Optional[str] = None
-    usage_count: Optional[int] = 0
+    usage_count: int = 0
     last_used_at: Optional[datetime] = None
     created_by_id: Optional[UUID] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Email template with usage statistics
 class EmailTemplateWithStats(EmailTemplate):
     created_by_name: Optional[str] = None
     recent_usage_count: Optional[int] = 0  # Usage in last 30 days
 
-    class Config:
-        from_attributes = True
-
 
 # Search and filter schemas
-class ConversationSearchFilters(BaseModel):
+class ConversationSearchFilters(Pagination):
     query: Optional[str] = Field(None, description="Search in title or participants")
     type: Optional[ConversationType] = Field(None, description="Filter by conversation type")
     is_archived: Optional[bool] = Field(None, description="Filter archived conversations")
     participant_id: Optional[UUID] = Field(None, description="Filter by participant")
     
-    # Pagination
-    page: int = Field(1, ge=1)
-    page_size: int = Field(20, ge=1, le=100)
-    
     # Sorting
-    sort_by: Optional[str] = Field("last_activity_at", pattern="^(last_activity_at|last_message_at|created_at|title)$")
-    sort_order: Optional[str] = Field("desc", pattern="^(asc|desc)$")
+    sort_by: Optional[Literal["last_activity_at", "last_message_at", "created_at", "title"]] = "last_activity_at"
+    sort_order: Optional[Literal["asc", "desc"]] = "desc"
 
 
-class MessageSearchFilters(BaseModel):
+class MessageSearchFilters(Pagination):
     query: Optional[str] = Field(None, description="Search in message content")
     conversation_id: Optional[UUID] = Field(None, description="Filter by conversation")
     sender_id: Optional[UUID] = Field(None, description="Filter by sender")
@@ -210,15 +193,14 @@ class MessageSearchFilters(BaseModel):
     date_to: Optional[datetime] = Field(None, description="Messages before date")
     
     # Pagination
-    page: int = Field(1, ge=1)
     page_size: int = Field(50, ge=1, le=100)
     
     # Sorting
-    sort_by: Optional[str] = Field("created_at", pattern="^(created_at|sent_at)$")
-    sort_order: Optional[str] = Field("desc", pattern="^(asc|desc)$")
+    sort_by: Optional[Literal["created_at", "sent_at"]] = "sent_at"
+    sort_order: Optional[Literal["asc", "desc"]] = "desc"
 
 
-class EmailTemplateSearchFilters(BaseModel):
+class EmailTemplateSearchFilters(Pagination):
     query: Optional[str] = Field(None, description="Search in name, subject, or body")
     template_type: Optional[str] = Field(None, description="Filter by template type")
     category: Optional[str] = Field(None, description="Filter by category")
@@ -226,48 +208,45 @@ class EmailTemplateSearchFilters(BaseModel):
     is_active: Optional[bool] = Field(None, description="Filter active templates")
     created_by: Optional[UUID] = Field(None, description="Filter by creator")
     
-    # Pagination
-    page: int = Field(1, ge=1)
-    page_size: int = Field(20, ge=1, le=100)
-    
     # Sorting
-    sort_by: Optional[str] = Field("name", pattern="^(name|usage_count|created_at|last_used_at)$")
-    sort_order: Optional[str] = Field("asc", pattern="^(asc|desc)$")
+    sort_by: Optional[Literal["name", "usage_count", "created_at", "last_used_at"]] = "name"
+    sort_order: Optional[Literal["asc", "desc"]] = "asc"
+
+
+# Validates a whole page of ORM conversations in one call
+conversation_list_adapter = TypeAdapter(List[ConversationWithDetails], config=ConfigDict(defer_build=True))
 
 
 # Response schemas
-class ConversationListResponse(BaseModel):
+class ConversationListResponse(BaseSchema):
     conversations: List[ConversationWithDetails]
     total: int
     page: int
     page_size: int
     total_pages: int
 
-    class Config:
-        from_attributes = True
+
+# Validates a whole page of ORM messages in one call
+message_list_adapter = TypeAdapter(List[MessageWithDetails], config=ConfigDict(defer_build=True))
 
 
-class MessageListResponse(BaseModel):
+class MessageListResponse(BaseSchema):
     messages: List[MessageWithDetails]
+    users: Dict[UUID, MessageSender] = {}
+    reactions: Dict[UUID, Dict[str, int]] = {}  # message_id -> emoji -> count
     total: int
     page: int
     page_size: int
     total_pages: int
 
-    class Config:
-        from_attributes = True
 
-
-class EmailTemplateListResponse(BaseModel):
+class EmailTemplateListResponse(BaseSchema):
     templates: List[EmailTemplateWithStats]
     total: int
     page: int
     page_size: int
     total_pages: int
 
-    class Config:
-        from_attributes = True
-
 
 # Action schemas
 class SendMessageRequest(BaseModel):
@@ -290,4 +269,4 @@ class MessageReactionRequest(BaseModel):
 
 
 class MarkAsReadRequest(BaseModel):
-    message_ids: List[UUID] = Field(..., min_items=1)
\ No newline at end of file
+    message_ids: List[UUID] = Field(..., min_items=1)
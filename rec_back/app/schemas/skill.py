@@ -1,7 +1,8 @@
-from typing import Optional, List
+from typing import Optional, List, Literal
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 from uuid import UUID
+from app.schemas._base import BaseSchema, Pagination
 
 
 # Base schemas for Skill Category
@@ -19,21 +20,18 @@ class SkillCategoryUpdate(SkillCategoryBase):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
 
 
-class SkillCategory(SkillCategoryBase):
+class SkillCategory(SkillCategoryBase, BaseSchema):
     id: UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Base schemas for Skill
 class SkillBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
     description: Optional[str] = None
     category_id: Optional[UUID] = None
-    skill_type: Optional[str] = Field("technical", pattern="^(technical|soft|language|certification)$")
+    skill_type: Optional[Literal["technical", "soft", "language", "certification"]] = "technical"
     is_verified: Optional[bool] = False
     is_trending: Optional[bool] = False
 
@@ -46,7 +44,7 @@ class SkillUpdate(SkillBase):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
 
 
-class Skill(SkillBase):
+class Skill(SkillBase, BaseSchema):
     id: UUID
     usage_count: Optional[int] = 0
     created_at: datetime
@@ -55,61 +53,53 @@ class Skill(SkillBase):
     # Relationships
     category: Optional[SkillCategory] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Skill with category information
 class SkillWithCategory(Skill):
     category_name: Optional[str] = None
     category_color: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 # Search and filter schemas
-class SkillSearchFilters(BaseModel):
+class SkillSearchFilters(Pagination):
     query: Optional[str] = Field(None, description="Search query")
     category_id: Optional[UUID] = Field(None, description="Filter by category")
-    skill_type: Optional[str] = Field(None, description="Filter by skill type")
-    proficiency_level: Optional[str] = Field(None, description="Filter by proficiency level")
+    skill_type: Optional[Literal["technical", "soft", "language", "certification"]] = Field(None, description="Filter by skill type")
+    proficiency_level: Optional[Literal["Beginner", "Intermediate", "Advanced", "Expert"]] = Field(None, description="Filter by proficiency level")
     is_active: Optional[bool] = Field(None, description="Filter by active status")
     industry: Optional[str] = Field(None, description="Filter by industry relevance")
     is_verified: Optional[bool] = Field(None, description="Filter verified skills")
     is_trending: Optional[bool] = Field(None, description="Filter trending skills")
     min_usage: Optional[int] = Field(None, ge=0, description="Minimum usage count")
     
-    # Pagination
-    page: int = Field(1, ge=1)
-    page_size: int = Field(20, ge=1, le=100)
-    
     # Sorting
-    sort_by: Optional[str] = Field("name", pattern="^(name|usage_count|created_at|updated_at)$")
-    sort_order: Optional[str] = Field("asc", pattern="^(asc|desc)$")
+    sort_by: Optional[Literal["name", "usage_count", "created_at", "updated_at"]] = "name"
+    sort_order: Optional[Literal["asc", "desc"]] = "asc"
+
 
+# Validates a whole page of ORM skills in one call
+skill_list_adapter = TypeAdapter(List[SkillWithCategory], config=ConfigDict(defer_build=True))
 
-class SkillListResponse(BaseModel):
+
+class SkillListResponse(BaseSchema):
     skills: List[SkillWithCategory]
     total: int
     page: int
     page_size: int
     total_pages: int
 
-    class Config:
-        from_attributes = True
+
+# Validates a whole page of ORM skill categories in one call
+skill_category_list_adapter = TypeAdapter(List[SkillCategory], config=ConfigDict(defer_build=True))
 
 
-class SkillCategoryListResponse(BaseModel):
+class SkillCategoryListResponse(BaseSchema):
     categories: List[SkillCategory]
     total: int
 
-    class Config:
-        from_attributes = True
-
 
 # Skill statistics
-class SkillStats(BaseModel):
+class SkillStats(BaseSchema):
     skill_id: UUID
     skill_name: str
     usage_count: int
@@ -117,16 +107,10 @@ class SkillStats(BaseModel):
     job_requirement_count: int
     trending_score: Optional[float] = None
 
-    class Config:
-        from_attributes = True
 
-
-class CategoryStats(BaseModel):
+class CategoryStats(BaseSchema):
     category_id: UUID
     category_name: str
     skill_count: int
     total_usage: int
     top_skills: List[SkillStats]
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
@@ -0,0 +1,31 @@
+from decimal import Decimal
+from sys import intern
+from typing import Annotated
+
+from pydantic import AfterValidator, Field, StringConstraints
+
+
+# Constrained types repeated across the schema modules, declared once so
+# every field using them gets the same constraints
+Money = Annotated[Decimal, Field(ge=0)]  # Salaries, budgets
+Rate = Annotated[Decimal, Field(ge=0, le=1)]  # Commission rates as fractions
+
+# Low-cardinality strings (sources, currencies, countries) repeated on every
+# row of a list response; interning shares one str object per distinct value
+Interned = Annotated[str, AfterValidator(intern)]
+
+
+def _lower_domain(value: str) -> str:
+    # EmailStr lowercased the domain; stored addresses rely on that form
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+# Syntax-only email check run by pydantic-core's regex engine, without
+# email-validator's per-call Python parsing
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+Email = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, max_length=254, pattern=EMAIL_PATTERN),
+    AfterValidator(_lower_domain),
+]
@@ -1,46 +1,23 @@
-from .base import BaseService
-from .auth import auth_service, AuthService
-from .candidate import candidate_service, CandidateService
-from .job import job_service, JobService
-from .application import application_service, ApplicationService
-from .company import company_service, CompanyService
-from .consultant import consultant_service, ConsultantService
-from .notification import notification_service, NotificationService
-from .analytics import analytics_service, AnalyticsService
+"""
+Service singletons and their classes.
 
-__all__ = [
-    # Base
-    "BaseService",
-    
-    # Auth
-    "auth_service",
-    "AuthService",
-    
-    # Candidate
-    "candidate_service", 
-    "CandidateService",
-    
-    # Job
-    "job_service",
-    "JobService",
-    
-    # Application
-    "application_service",
-    "ApplicationService",
-    
-    # Company
-    "company_service",
-    "CompanyService",
-    
-    # Consultant
-    "consultant_service",
-    "ConsultantService",
-    
-    # Notification
-    "notification_service",
-    "NotificationService",
-    
-    # Analytics
-    "analytics_service",
-    "AnalyticsService",
-]
\ No newline at end of file
+Services sit on top of the CRUD layer and pull in every model, schema and
+CRUD module they touch, so a route importing one service should not pay for
+the rest. Names are bound on first access.
+"""
+from app.core.lazy import lazy_exports
+
+# Public name groups, keyed by the submodule that defines them
+_EXPORTS = {
+    "base": ("BaseService",),
+    "auth": ("auth_service", "AuthService"),
+    "candidate": ("candidate_service", "CandidateService"),
+    "job": ("job_service", "JobService"),
+    "application": ("application_service", "ApplicationService"),
+    "company": ("company_service", "CompanyService"),
+    "consultant": ("consultant_service", "ConsultantService"),
+    "notification": ("notification_service", "NotificationService"),
+    "analytics": ("analytics_service", "AnalyticsService"),
+}
+
+__getattr__, __dir__, __all__ = lazy_exports(globals(), _EXPORTS)
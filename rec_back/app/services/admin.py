@@ -1,5 +1,5 @@
 # app/services/admin.py
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func, desc
 from uuid import UUID
@@ -15,7 +15,7 @@ from app.models.user import User, UserRole
 from app.schemas.admin import (
     AdminProfileCreate, AdminProfileUpdate,
     SuperAdminProfileCreate, UpdateAdminPermissionsRequest,
-    UpdateSystemConfigRequest, AdminSearchFilters
+    UpdateSystemConfigRequest, AdminSearchFilters, AuditLogSearchFilters
 )
 from app.crud import admin as admin_crud
 from app.services.base import BaseService
@@ -99,19 +99,17 @@ class AdminService(BaseService[AdminProfile, admin_crud.CRUDAdminProfile]):
         # Store old permissions for audit
         old_permissions = admin.permissions or []
         
-        # Validate permissions
-        for permission in permissions_update.permissions:
-            if not self._is_valid_permission(permission):
-                raise ValueError(f"Invalid permission: {permission}")
+        # Permission names are already validated against the Permission enum
         
         # Check if updater has authority
         updater = self.get(db, id=updated_by)
         if not self._can_manage_permissions(updater, admin):
             raise ValueError("Insufficient privileges to update permissions")
         
-        # Update permissions
-        admin.permissions = permissions_update.permissions
-        admin.restricted_actions = permissions_update.restricted_actions
+        # Update permissions (JSONB arrays)
+        new_values = permissions_update.model_dump(mode="json")
+        admin.permissions = new_values["permissions"]
+        admin.restricted_actions = new_values["restricted_actions"]
         
         # Log change
         self.audit_crud.create_log_entry(
@@ -121,10 +119,7 @@ class AdminService(BaseService[AdminProfile, admin_crud.CRUDAdminProfile]):
             resource_type="admin_profile",
             resource_id=admin_id,
             old_values={"permissions": old_permissions},
-            new_values={
-                "permissions": permissions_update.permissions,
-                "restricted_actions": permissions_update.restricted_actions
-            },
+            new_values=new_values,
             status="success"
         )
         
@@ -288,6 +283,15 @@ class AdminService(BaseService[AdminProfile, admin_crud.CRUDAdminProfile]):
         
         return updated
     
+    def get_audit_logs_json(
+        self, 
+        db: Session, 
+        *, 
+        filters: AuditLogSearchFilters
+    ) -> Tuple[str, int]:
+        """Get a page of audit logs as a JSON array, with the total count"""
+        return self.audit_crud.search_as_json(db, filters=filters)
+    
     def get_audit_log_analysis(
         self, 
         db: Session, 
@@ -517,20 +521,6 @@ class AdminService(BaseService[AdminProfile, admin_crud.CRUDAdminProfile]):
         
         return permissions
     
-    def _is_valid_permission(self, permission: str) -> bool:
-        """Validate if permission string is valid"""
-        valid_permissions = [
-            "read_users", "write_users", "delete_users",
-            "read_jobs", "write_jobs", "delete_jobs",
-            "read_applications", "manage_applications",
-            "manage_companies", "manage_consultants",
-            "view_analytics", "export_data",
-            "manage_admins", "view_audit_logs",
-            "system_config", "security_management",
-            "full_access"
-        ]
-        return permission in valid_permissions
-    
     def _can_manage_permissions(
         self, 
         updater: AdminProfile, 
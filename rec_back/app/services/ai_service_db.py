@@ -18,6 +18,7 @@ from app.models.company import Company
 from app.models.user import User
 from app.models.application import Application
 from app.models.enums import UserRole, ProficiencyLevel
+from app.crud import candidate as candidate_crud
 
 # --- Configuration & Constants ---
 
@@ -1021,25 +1022,13 @@ Your feedback should be constructive, specific, and personalized. Format it as a
             candidate.summary = cv_analysis.get("summary", candidate.summary)
             candidate.years_of_experience = cv_analysis.get("total_experience_years", candidate.years_of_experience)
             
-            # Add skills from analysis
-            skill_ids = cv_analysis.get("skill_ids", [])
-            existing_skills = db.query(CandidateSkill).filter(
-                CandidateSkill.candidate_id == candidate_id
-            ).all()
-            
-            # Get existing skill IDs
-            existing_skill_ids = [str(skill.skill_id) for skill in existing_skills]
-            
-            # Add new skills
-            for skill_id in skill_ids:
-                if skill_id not in existing_skill_ids:
-                    # Create new skill association
-                    candidate_skill = CandidateSkill(
-                        candidate_id=candidate_id,
-                        skill_id=skill_id,
-                        proficiency_level=ProficiencyLevel.INTERMEDIATE  # Default to intermediate
-                    )
-                    db.add(candidate_skill)
+            # Add skills from analysis; ones the candidate already has are skipped by ON CONFLICT
+            candidate_crud.candidate_skill.add_missing(
+                db,
+                candidate_id=candidate_id,
+                skill_ids=cv_analysis.get("skill_ids", []),
+                proficiency_level=ProficiencyLevel.INTERMEDIATE  # Default to intermediate
+            )
             
             # Update education records if available
             if cv_analysis.get("education"):
@@ -1120,13 +1109,12 @@ Your feedback should be constructive, specific, and personalized. Format it as a
             db.flush()  # Get the ID without committing
             
             # Add skills
-            for skill_id in cv_analysis.get("skill_ids", []):
-                candidate_skill = CandidateSkill(
-                    candidate_id=new_candidate.id,
-                    skill_id=skill_id,
-                    proficiency_level=ProficiencyLevel.INTERMEDIATE  # Default
-                )
-                db.add(candidate_skill)
+            candidate_crud.candidate_skill.add_missing(
+                db,
+                candidate_id=new_candidate.id,
+                skill_ids=cv_analysis.get("skill_ids", []),
+                proficiency_level=ProficiencyLevel.INTERMEDIATE  # Default
+            )
             
             # Would add education and experience here in a full implementation
             
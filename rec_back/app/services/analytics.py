@@ -1,6 +1,6 @@
 # app/services/analytics.py
 from typing import Optional, List, Dict, Any, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy import and_, or_, func, case, extract, desc, asc, text
 from uuid import UUID
 from datetime import datetime, timedelta, date
@@ -207,7 +207,9 @@ class AnalyticsService:
         date_range: Optional[Tuple[datetime, datetime]] = None
     ) -> Dict[str, Any]:
         """Get job posting and performance analytics"""
-        query = db.query(Job)
+        query = db.query(Job).options(
+            load_only(Job.id, Job.title, Job.status, Job.created_at, Job.updated_at)
+        )
         
         if company_id:
             query = query.filter(Job.company_id == company_id)
@@ -284,7 +286,13 @@ class AnalyticsService:
         date_range: Optional[Tuple[datetime, datetime]] = None
     ) -> Dict[str, Any]:
         """Get candidate pool and performance analytics"""
-        query = db.query(CandidateProfile).join(User)
+        query = db.query(CandidateProfile).join(User).options(
+            load_only(
+                CandidateProfile.id, CandidateProfile.flags,
+                CandidateProfile.years_of_experience, CandidateProfile.city,
+                CandidateProfile.created_at
+            )
+        )
         
         if date_range:
             start_date, end_date = date_range
@@ -447,7 +455,7 @@ class AnalyticsService:
         company_metrics = []
         for company in companies:
             # Get jobs for this company
-            job_query = db.query(Job).filter(Job.company_id == company.id)
+            job_query = db.query(Job).options(load_only(Job.id)).filter(Job.company_id == company.id)
             if date_range:
                 start_date, end_date = date_range
                 job_query = job_query.filter(
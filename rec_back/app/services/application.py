@@ -503,15 +503,6 @@ class ApplicationService(BaseService[Application, CRUDApplication]):
         # Close job if positions filled
         # This would depend on job requirements
         
-        # Update consultant metrics
-        if application.consultant_id:
-            consultant = db.query(ConsultantProfile).filter(
-                ConsultantProfile.id == application.consultant_id
-            ).first()
-            if consultant:
-                consultant.successful_placements += 1
-                consultant.total_placements += 1
-        
         # Create recruitment history record
         from app.models.company import RecruitmentHistory
         history = RecruitmentHistory(
@@ -7,7 +7,7 @@ from datetime import datetime, timedelta
 
 from app.models.candidate import (
     CandidateProfile, CandidateEducation, CandidateExperience,
-    CandidateSkill, CandidatePreferences, CandidateNotificationSettings
+    CandidateSkill, CandidatePreferences
 )
 from app.models.job import Job
 from app.models.skill import Skill
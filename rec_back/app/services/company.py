@@ -803,12 +803,11 @@ class CompanyService(BaseService[Company, employer_crud.CRUDCompany]):
         # Apply status filter if provided
         if status:
             from app.models.enums import JobStatus
-            try:
-                job_status = JobStatus(status.upper())
-                query = query.filter(Job.status == job_status)
-            except ValueError:
+            job_status = JobStatus._vmap.get(status.lower())
+            if job_status is None:
                 # Invalid status, return empty results
                 return [], 0
+            query = query.filter(Job.status == job_status)
         
         # Get total count
         total = query.count()
@@ -1,17 +1,18 @@
 # app/services/consultant.py
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy.orm import Session, joinedload, load_only
+from sqlalchemy import and_, or_, func, cast, Integer
 from uuid import UUID
 from datetime import datetime, timedelta, date
 from decimal import Decimal
 
 from app.models.consultant import (
     ConsultantProfile, ConsultantStatus, ConsultantTarget,
-    ConsultantPerformanceReview, ConsultantCandidate, ConsultantClient
+    ConsultantPerformanceReview, ConsultantCandidate, ConsultantClient, ConsultantStats
 )
 from app.models.application import Application, ApplicationStatus
 from app.models.job import Job
+from app.models.user import User
 from app.schemas.consultant import (
     ConsultantProfileCreate, ConsultantProfileUpdate,
     ConsultantTargetCreate, ConsultantPerformanceReviewCreate,
@@ -166,9 +167,6 @@ class ConsultantService(BaseService[ConsultantProfile, consultant_crud.CRUDConsu
             notes=assignment_reason
         )
         
-        # Update consultant metrics
-        consultant.current_active_jobs += 1
-        
         # Log assignment
         self.log_action(
             "candidate_assigned_to_consultant",
@@ -237,11 +235,8 @@ class ConsultantService(BaseService[ConsultantProfile, consultant_crud.CRUDConsu
         if not consultant or not application:
             return False
         
-        # Update consultant metrics
-        consultant.total_placements += 1
-        consultant.successful_placements += 1
-        consultant.this_month_placements += 1
-        
+        # Placement counters are aggregated in consultant_stats_mv;
+        # only revenue, which is not derivable from applications, is kept live
         if placement_fee:
             consultant.total_revenue_generated = (
                 (consultant.total_revenue_generated or 0) + placement_fee
@@ -309,23 +304,38 @@ class ConsultantService(BaseService[ConsultantProfile, consultant_crud.CRUDConsu
         manager_id: UUID
     ) -> Dict[str, Any]:
         """Get performance metrics for consultant's team"""
-        # Get team members
-        team_members = db.query(ConsultantProfile).filter(
+        # Team totals in one aggregate; money stays DECIMAL end to end
+        team_size, total_placements, total_revenue, average_rating = db.query(
+            func.count(ConsultantProfile.id),
+            # The view's counters are bigint, whose SUM is numeric
+            cast(func.coalesce(func.sum(ConsultantStats.total_placements), 0), Integer),
+            func.coalesce(func.sum(ConsultantProfile.total_revenue_generated), 0),
+            func.round(func.avg(func.coalesce(ConsultantProfile.average_rating, 0)), 2)
+        ).outerjoin(
+            ConsultantStats, ConsultantStats.consultant_id == ConsultantProfile.id
+        ).filter(
             ConsultantProfile.manager_id == manager_id
-        ).all()
+        ).one()
         
-        if not team_members:
+        if not team_size:
             return {"team_size": 0, "message": "No team members found"}
         
-        # Aggregate metrics
         team_metrics = {
-            "team_size": len(team_members),
-            "total_placements": sum(m.total_placements for m in team_members),
-            "total_revenue": sum(m.total_revenue_generated or 0 for m in team_members),
-            "average_rating": sum(m.average_rating or 0 for m in team_members if m.average_rating) / len(team_members),
+            "team_size": team_size,
+            "total_placements": total_placements,
+            "total_revenue": total_revenue,
+            "average_rating": average_rating,
             "members": []
         }
         
+        # Only the columns the member breakdown reads (stats rides along joined)
+        team_members = db.query(ConsultantProfile).options(
+            load_only(ConsultantProfile.id, ConsultantProfile.status, ConsultantProfile.average_rating),
+            joinedload(ConsultantProfile.user).load_only(User.first_name, User.last_name)
+        ).filter(
+            ConsultantProfile.manager_id == manager_id
+        ).all()
+        
         # Individual member performance
         for member in team_members:
             current_targets = self.target_crud.get_current_targets(
@@ -814,18 +824,18 @@ class ConsultantService(BaseService[ConsultantProfile, consultant_crud.CRUDConsu
     ) -> Decimal:
         """Calculate revenue generated in period"""
         # This is simplified - would need actual placement fee tracking
-        placements = db.query(Application).filter(
+        placements = db.query(func.count(Application.id)).filter(
             and_(
                 Application.consultant_id == consultant_id,
                 Application.status == ApplicationStatus.HIRED,
                 Application.last_updated >= start_date,
                 Application.last_updated <= end_date
             )
-        ).all()
+        ).scalar()
         
         # Estimate based on average placement fee
         avg_placement_fee = Decimal("5000")  # Would come from config
-        return len(placements) * avg_placement_fee
+        return placements * avg_placement_fee
     
     def _get_target_achievement_details(
         self, 
@@ -1,6 +1,7 @@
 # app/services/messaging.py
+import re
 from typing import Optional, List, Dict, Any, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from sqlalchemy import and_, or_, func, desc
 from uuid import UUID
 from datetime import datetime, timedelta
@@ -19,6 +20,9 @@ from app.schemas.messaging import (
 from app.crud import messaging as messaging_crud
 from app.services.base import BaseService
 
+# {{variable}} placeholders in email templates
+TEMPLATE_VARIABLE_RE = re.compile(r'\{\{(\w+)\}\}')
+
 
 class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation]):
     """Service for messaging and communication operations"""
@@ -38,7 +42,7 @@ class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation
     ) -> Conversation:
         """Create a new conversation with participants"""
         # Validate participants exist
-        participants = db.query(User).filter(
+        participants = db.query(User).options(raiseload("*")).filter(
             User.id.in_(request.participant_ids + [created_by])
         ).all()
         
@@ -49,22 +53,20 @@ class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation
         conversation = Conversation(
             title=request.title,
             type=request.type,
-            created_by_id=created_by,
-            last_activity_at=datetime.utcnow()
+            created_by_id=created_by
         )
         db.add(conversation)
         db.flush()  # Get the ID
         
         # Add participants
         participant_data = [
-            {"conversation_id": conversation.id, "user_id": created_by, "joined_at": datetime.utcnow()}
+            {"conversation_id": conversation.id, "user_id": created_by}
         ]
         for participant_id in request.participant_ids:
             if participant_id != created_by:  # Don't add creator twice
                 participant_data.append({
                     "conversation_id": conversation.id, 
-                    "user_id": participant_id, 
-                    "joined_at": datetime.utcnow()
+                    "user_id": participant_id
                 })
         
         db.execute(conversation_participants.insert().values(participant_data))
@@ -89,7 +91,7 @@ class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation
     ) -> Tuple[List[Conversation], int]:
         """Get conversations with search filters and pagination"""
         # Get user's conversations        
-        query = db.query(Conversation).join(
+        query = db.query(Conversation).options(raiseload("*")).join(
             conversation_participants,
             conversation_participants.c.conversation_id == Conversation.id
         ).filter(
@@ -143,7 +145,9 @@ class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation
         filters: MessageSearchFilters
     ) -> Tuple[List[Message], int]:
         """Get messages with search filters and pagination"""
-        query = db.query(Message)
+        # Soft-deleted messages are never listed; with sent_at ordering a
+        # conversation page is served by ix_messages_conv_sent_active
+        query = db.query(Message).options(raiseload("*")).filter(Message.is_deleted == False)
         
         # Apply filters
         if filters.conversation_id:
@@ -169,10 +173,10 @@ class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation
         total = query.count()
         
         # Apply sorting
-        if filters.sort_by == "sent_at":
-            order_col = Message.sent_at
-        else:  # created_at
+        if filters.sort_by == "created_at":
             order_col = Message.created_at
+        else:  # sent_at
+            order_col = Message.sent_at
         
         if filters.sort_order == "asc":
             query = query.order_by(order_col)
@@ -192,7 +196,7 @@ class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation
         filters: EmailTemplateSearchFilters
     ) -> Tuple[List[EmailTemplate], int]:
         """Get email templates with search filters and pagination"""
-        query = db.query(EmailTemplate)
+        query = db.query(EmailTemplate).options(raiseload("*"))
         
         # Apply filters
         if filters.template_type:
@@ -271,6 +275,15 @@ class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation
         """Get conversation with details"""
         return self.crud.get_with_details(db, id=id)
     
+    def get_conversation_json(
+        self, 
+        db: Session, 
+        *, 
+        id: UUID
+    ) -> Optional[str]:
+        """Get conversation with messages, attachments and reactions as JSON"""
+        return self.crud.get_as_json(db, id=id)
+    
     def update_conversation(
         self, 
         db: Session, 
@@ -422,18 +435,11 @@ class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation
         message_ids: List[UUID]
     ) -> int:
         """Mark multiple messages as read"""
-        marked_count = 0
-        
-        for message_id in message_ids:
-            success = self.message_crud.mark_as_read(
-                db, 
-                message_id=message_id,
-                user_id=user_id
-            )
-            if success:
-                marked_count += 1
-        
-        return marked_count
+        return self.message_crud.mark_many_as_read(
+            db,
+            message_ids=message_ids,
+            user_id=user_id
+        )
     
     def add_reaction(
         self, 
@@ -459,6 +465,45 @@ class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation
             emoji=emoji
         )
     
+    def get_thread(
+        self, 
+        db: Session, 
+        *, 
+        conversation_id: UUID,
+        thread_root_id: UUID
+    ) -> List[Message]:
+        """Get the messages of a thread, oldest first"""
+        return self.message_crud.get_thread(
+            db,
+            conversation_id=conversation_id,
+            thread_root_id=thread_root_id
+        )
+    
+    def get_user_mentions(
+        self, 
+        db: Session, 
+        *, 
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 50
+    ) -> List[Message]:
+        """Get messages mentioning a user, newest first"""
+        return self.message_crud.get_user_mentions(
+            db,
+            user_id=user_id,
+            skip=skip,
+            limit=limit
+        )
+    
+    def get_reaction_counts(
+        self, 
+        db: Session, 
+        *, 
+        message_ids: List[UUID]
+    ) -> Dict[UUID, Dict[str, int]]:
+        """Get emoji tallies for a page of messages"""
+        return self.message_crud.get_reaction_counts(db, message_ids=message_ids)
+    
     def get_unread_count(
         self, 
         db: Session, 
@@ -578,7 +623,7 @@ class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation
         
         for conv in conversations:
             # Get messages in time period
-            messages = db.query(Message).filter(
+            messages = db.query(Message).options(raiseload("*")).filter(
                 and_(
                     Message.conversation_id == conv.id,
                     Message.created_at >= since_date
@@ -654,7 +699,7 @@ class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation
         
         # Search messages
         search_term = f"%{query}%"
-        messages = db.query(Message).filter(
+        messages = db.query(Message).options(raiseload("*")).filter(
             and_(
                 Message.conversation_id.in_(conversation_ids),
                 Message.content.ilike(search_term)
@@ -816,11 +861,7 @@ class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation
     
     def _extract_template_variables(self, template_body: str) -> List[str]:
         """Extract variable placeholders from template"""
-        import re
-        
-        # Find {{variable}} patterns
-        pattern = r'\{\{(\w+)\}\}'
-        variables = re.findall(pattern, template_body)
+        variables = TEMPLATE_VARIABLE_RE.findall(template_body)
         
         return list(set(variables))
     
@@ -830,14 +871,11 @@ class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation
         context: Dict[str, Any]
     ) -> str:
         """Render template string with context"""
-        import re
-        
         def replace_var(match):
             var_name = match.group(1)
             return str(context.get(var_name, f"{{{{{var_name}}}}}"))
         
-        pattern = r'\{\{(\w+)\}\}'
-        return re.sub(pattern, replace_var, template_str)
+        return TEMPLATE_VARIABLE_RE.sub(replace_var, template_str)
     
     def _get_conversation_title(
         self, 
@@ -853,7 +891,7 @@ class MessagingService(BaseService[Conversation, messaging_crud.CRUDConversation
         if conversation.type == ConversationType.DIRECT:
             from app.models.messaging import conversation_participants
             
-            other_participant = db.query(User).join(
+            other_participant = db.query(User).options(raiseload("*")).join(
                 conversation_participants,
                 conversation_participants.c.user_id == User.id
             ).filter(
@@ -9,7 +9,7 @@ from email.mime.multipart import MIMEMultipart
 import json
 
 from app.models.user import User, UserRole
-from app.models.candidate import CandidateProfile, CandidateNotificationSettings
+from app.models.candidate import CandidateProfile
 from app.models.application import Application, ApplicationStatus
 from app.models.job import Job
 from app.models.messaging import EmailTemplate, Message, Conversation
@@ -584,19 +584,18 @@ class NotificationService:
         notification_type: str
     ) -> bool:
         """Check if candidate should receive notification"""
-        settings = db.query(CandidateNotificationSettings).filter(
-            CandidateNotificationSettings.candidate_id == candidate_id
-        ).first()
-        
-        if not settings:
-            return True  # Default to sending
-        
         if notification_type == "job_matches":
-            return settings.job_matches
+            setting = CandidateProfile.job_matches
         elif notification_type == "application_updates":
-            return settings.application_updates
+            setting = CandidateProfile.application_updates
         else:
-            return settings.email_alerts
+            setting = CandidateProfile.email_alerts
+        
+        enabled = db.query(setting).filter(
+            CandidateProfile.id == candidate_id
+        ).scalar()
+        
+        return True if enabled is None else enabled  # Default to sending
     
     def _has_sms_enabled(self, db: Session, user_id: UUID) -> bool:
         """Check if user has SMS notifications enabled"""
@@ -146,6 +146,16 @@ class SkillService(BaseService[Skill, CRUDSkill]):
         
         # Update all references to point to primary skill
         for dup_skill in duplicate_skills:
+            # Drop duplicates for candidates that already have the primary skill
+            db.query(CandidateSkill).filter(
+                CandidateSkill.skill_id == dup_skill.id,
+                CandidateSkill.candidate_id.in_(
+                    db.query(CandidateSkill.candidate_id).filter(
+                        CandidateSkill.skill_id == primary_skill_id
+                    )
+                )
+            ).delete(synchronize_session=False)
+            
             # Update candidate skills
             db.query(CandidateSkill).filter(
                 CandidateSkill.skill_id == dup_skill.id
@@ -1,6 +1,7 @@
 # app/services/user.py
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
+from typing import Optional, List, Dict, Any, Iterable
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session, load_only, raiseload
 from uuid import UUID
 
 from app.models.user import User
@@ -149,9 +150,8 @@ class UserService(BaseService[User, CRUDBase]):
         """Search users by name or email"""
         search_term = f"%{query}%"
         db_query = db.query(User).filter(
-            db.or_(
-                User.first_name.ilike(search_term),
-                User.last_name.ilike(search_term),
+            or_(
+                User.full_name.ilike(search_term),
                 User.email.ilike(search_term)
             )
         )
@@ -308,5 +308,42 @@ class UserService(BaseService[User, CRUDBase]):
         return stats
 
 
+class UserLoader:
+    """Request-scoped batch loader for user display data.
+
+    Collects user ids from a page of rows, fetches the missing ones with a
+    single IN query and memoizes them for the rest of the request.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self._cache: Dict[UUID, Optional[User]] = {}
+
+    def load_many(self, ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """Return the users for ``ids`` keyed by id, skipping unknown ids"""
+        ids = set(ids)
+        missing = ids - self._cache.keys()
+        if missing:
+            users = self.db.scalars(
+                select(User)
+                .options(
+                    load_only(User.id, User.email, User.first_name, User.last_name, User.role),
+                    raiseload("*")
+                )
+                .where(User.id.in_(missing))
+            ).all()
+            self._cache.update(dict.fromkeys(missing))
+            self._cache.update((user.id, user) for user in users)
+        return {
+            user_id: self._cache[user_id]
+            for user_id in ids
+            if self._cache[user_id] is not None
+        }
+
+    def load(self, user_id: UUID) -> Optional[User]:
+        """Return a single user, sharing the cache with load_many"""
+        return self.load_many([user_id]).get(user_id)
+
+
 # Create service instance
 user_service = UserService()
\ No newline at end of file